@@ -38,15 +38,8 @@ from research_agent.api.server import run_server
 from research_agent.checkpoints import CheckpointManager, generate_run_id
 from research_agent.config import Settings, format_validation_error
 from research_agent.doctor import CheckStatus, run_doctor
-from research_agent.enhance_context import build_project_context
-from research_agent.enhance_engine import (
-    generate_enhancement_report,
-    identify_opportunities,
-    persist_findings,
-    plan_incremental_research,
-)
+from research_agent.enhance_engine import run_enhancement
 from research_agent.enhance_models import OpportunityCategory
-from research_agent.enhance_store import KnowledgeStore as EnhancementKnowledgeStore
 from research_agent.knowledge.io import (
     export_to_json as export_knowledge_json,
 )
@@ -669,6 +662,13 @@ def doctor(
         bool,
         typer.Option("--quiet", help="Suppress table output, use exit code only."),
     ] = False,
+    fast_fail: Annotated[
+        bool,
+        typer.Option(
+            "--fast-fail",
+            help="Stop at the first failing check and skip the rest.",
+        ),
+    ] = False,
 ) -> None:
     """Run self-diagnostics and health checks for this environment."""
     settings = _load_settings(config)
@@ -676,6 +676,7 @@ def doctor(
         settings=settings,
         config_path=config,
         check_api_probes=not no_api_probes,
+        fast_fail=fast_fail,
     )
 
     if not quiet:
@@ -688,6 +689,7 @@ def doctor(
             CheckStatus.OK: "[green]OK[/green]",
             CheckStatus.WARN: "[yellow]WARN[/yellow]",
             CheckStatus.FAIL: "[red]FAIL[/red]",
+            CheckStatus.SKIPPED: "[dim]SKIPPED[/dim]",
         }
 
         for check in report.checks:
@@ -762,48 +764,22 @@ def enhance(
     if not project_path.exists():
         raise typer.BadParameter(f"Project path does not exist: {project_path}")
 
-    focus_areas = _parse_focus_areas(focus)
-    context = build_project_context(project_path)
-    opportunities = identify_opportunities(
-        context,
-        focus_areas=focus_areas or None,
-    )
-
-    knowledge_path = Path(settings.vector_store.persist_directory) / "enhancement.json"
-    store = EnhancementKnowledgeStore(knowledge_path)
-    refresh_targets, delta, shared_entries = plan_incremental_research(
-        project_id=context.project_name,
-        opportunities=opportunities,
-        store=store,
-        stale_days=max(stale_days, 1),
+    result = run_enhancement(
+        project_path,
+        settings,
+        focus_areas=_parse_focus_areas(focus),
+        stale_days=stale_days,
         force_refresh=force_refresh,
+        output=output,
+        apply_to=apply_to,
     )
 
-    if refresh_targets:
-        persist_findings(context.project_name, refresh_targets, store)
-
-    report_targets = refresh_targets or opportunities
-    report = generate_enhancement_report(
-        context=context,
-        opportunities=report_targets,
-        delta=delta,
-        shared_entries=shared_entries,
-    )
-
-    output_path = output or (project_path / "COMPILED_RESEARCH.md")
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(report, encoding="utf-8")
-
-    if apply_to is not None:
-        apply_to.parent.mkdir(parents=True, exist_ok=True)
-        apply_to.write_text(report, encoding="utf-8")
-
     console.print(
         Panel(
-            f"Project: [cyan]{context.project_name}[/cyan]\n"
+            f"Project: [cyan]{result.context.project_name}[/cyan]\n"
             f"Focus: {focus or 'all categories'}\n"
-            f"Opportunities researched: {len(report_targets)}\n"
-            f"Output: [green]{output_path}[/green]",
+            f"Opportunities researched: {len(result.opportunities)}\n"
+            f"Output: [green]{result.output_path}[/green]",
             title="Enhancement Research",
             border_style="magenta",
         )
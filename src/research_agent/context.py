@@ -10,7 +10,9 @@ progressive masking based on context utilization:
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from enum import IntEnum
+from itertools import islice
 from typing import Any, Literal
 
 import structlog
@@ -18,6 +20,8 @@ from pydantic import BaseModel, Field
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
+Role = Literal["system", "user", "assistant", "tool"]
+
 # Stage activation thresholds (percentage of max_tokens)
 _STAGE_1_THRESHOLD = 75.0
 _STAGE_2_THRESHOLD = 80.0
@@ -26,6 +30,9 @@ _STAGE_3_THRESHOLD = 85.0
 # Minimum content length (chars) to be eligible for file pointer replacement
 _FILE_POINTER_MIN_CHARS = 200
 
+# Token count assigned to a turn once its content has been masked
+_MASKED_TOKEN_COUNT = 10
+
 
 # ---------------------------------------------------------------------------
 # Models
@@ -41,12 +48,71 @@ class MaskingStage(IntEnum):
     STAGE_3 = 3  # Replace large text with file pointers
 
 
+# Packed stage lookup: bisect_right over the ascending thresholds yields the
+# index of the active stage in _STAGES_BY_RANK.
+_STAGE_THRESHOLDS: tuple[float, ...] = (
+    _STAGE_1_THRESHOLD,
+    _STAGE_2_THRESHOLD,
+    _STAGE_3_THRESHOLD,
+)
+_STAGES_BY_RANK: tuple[MaskingStage, ...] = tuple(MaskingStage)
+
+# Shared default for format_for_api() when no tool schemas are supplied
+_EMPTY_TOOLS: tuple[dict[str, Any], ...] = ()
+
+# Fixed key order for window_report()
+_REPORT_KEYS: tuple[str, ...] = (
+    "turn_count",
+    "total_tokens",
+    "max_tokens",
+    "utilization_percent",
+    "active_stage",
+    "masked_count",
+    "unmasked_count",
+    "window_size",
+)
+
+
+class RoleCode(IntEnum):
+    """Integer codes for turn roles, used for cheap role checks."""
+
+    SYSTEM = 0
+    USER = 1
+    ASSISTANT = 2
+    TOOL = 3
+
+
+# Role names indexed by RoleCode value
+_ROLE_NAMES: tuple[Role, ...] = ("system", "user", "assistant", "tool")
+_ROLE_CODES: dict[str, RoleCode] = {
+    name: RoleCode(code) for code, name in enumerate(_ROLE_NAMES)
+}
+
+
+# Bitmask of roles masked outright at each stage, indexed by MaskingStage
+_STAGE_MASKABLE_ROLES: tuple[int, ...] = (
+    0,
+    1 << RoleCode.TOOL,
+    (1 << RoleCode.TOOL) | (1 << RoleCode.ASSISTANT),
+    (1 << RoleCode.TOOL) | (1 << RoleCode.ASSISTANT),
+)
+
+# Placeholder templates for role-based masking, indexed by RoleCode value
+_ROLE_MASK_TEMPLATES: tuple[str, ...] = (
+    "",
+    "",
+    "[compressed summary from {}]",
+    "[masked tool output from {}]",
+)
+
+
 class Turn(BaseModel):
-    """A single conversation turn in the research agent's history."""
+    """A single conversation turn in the research agent's history.
 
-    role: Literal["system", "user", "assistant", "tool"] = Field(
-        description="The role of the turn author.",
-    )
+    ``role_code`` gives the role as a ``RoleCode`` for cheap role checks.
+    """
+
+    role: Role = Field(description="The role of the turn author.")
     content: str = Field(description="Turn content (text or tool output).")
     token_count: int = Field(default=0, ge=0, description="Estimated token count.")
     step_name: str = Field(
@@ -57,6 +123,11 @@ class Turn(BaseModel):
         description="Whether this turn's content has been replaced with a summary.",
     )
 
+    @property
+    def role_code(self) -> RoleCode:
+        """Return the integer code of the turn author role."""
+        return _ROLE_CODES[self.role]
+
 
 class CompactionResult(BaseModel):
     """Result of a context compaction operation."""
@@ -104,6 +175,9 @@ class ContextManager:
         self._turns: list[Turn] = []
         self._turns_since_compaction: int = 0
         self._compaction_pending = False
+        # Upper bound on content length across added turns; lets compact()
+        # skip stage-3 file pointer checks when every turn is short.
+        self._max_content_len: int = 0
 
     @property
     def turn_count(self) -> int:
@@ -150,14 +224,9 @@ class ContextManager:
         Returns:
             The highest applicable masking stage.
         """
-        pct = self.utilization_percent
-        if pct >= _STAGE_3_THRESHOLD:
-            return MaskingStage.STAGE_3
-        if pct >= _STAGE_2_THRESHOLD:
-            return MaskingStage.STAGE_2
-        if pct >= _STAGE_1_THRESHOLD:
-            return MaskingStage.STAGE_1
-        return MaskingStage.NONE
+        return _STAGES_BY_RANK[
+            bisect_right(_STAGE_THRESHOLDS, self.utilization_percent)
+        ]
 
     def add_turn(self, turn: Turn) -> None:
         """Append a new turn and trigger compaction if needed.
@@ -170,6 +239,7 @@ class ContextManager:
         """
         self._turns.append(turn)
         self._turns_since_compaction += 1
+        self._max_content_len = max(self._max_content_len, len(turn.content))
 
         if self._compaction_pending:
             if self._turns_since_compaction < self.compaction_cooldown_turns:
@@ -192,40 +262,41 @@ class ContextManager:
         Returns:
             Statistics about the compaction, including the stage applied.
         """
-        original_tokens = self.total_tokens
-        turns_masked = 0
         stage = self.active_stage
-        cutoff = max(0, len(self._turns) - self.window_size)
-
-        # Stage 1: Mask tool outputs outside window
-        if stage >= MaskingStage.STAGE_1:
-            for i in range(cutoff):
-                turn = self._turns[i]
-                if turn.role == "tool" and not turn.masked:
-                    turn.content = f"[masked tool output from {turn.step_name}]"
-                    turn.token_count = 10
-                    turn.masked = True
-                    turns_masked += 1
-
-        # Stage 2: Compress assistant summaries outside window
-        if stage >= MaskingStage.STAGE_2:
-            for i in range(cutoff):
-                turn = self._turns[i]
-                if turn.role == "assistant" and not turn.masked:
-                    turn.content = f"[compressed summary from {turn.step_name}]"
-                    turn.token_count = 10
-                    turn.masked = True
-                    turns_masked += 1
-
-        # Stage 3: Replace large text with file pointers
-        if stage >= MaskingStage.STAGE_3:
-            for i in range(cutoff):
-                turn = self._turns[i]
-                if not turn.masked and len(turn.content) >= _FILE_POINTER_MIN_CHARS:
-                    turn.content = f"[content saved to file; ref: {turn.step_name}]"
-                    turn.token_count = 10
-                    turn.masked = True
-                    turns_masked += 1
+        turns = self._turns
+        cutoff = max(0, len(turns) - self.window_size)
+        role_mask = _STAGE_MASKABLE_ROLES[stage]
+        min_chars = _FILE_POINTER_MIN_CHARS
+        use_file_pointers = (
+            stage >= MaskingStage.STAGE_3 and self._max_content_len >= min_chars
+        )
+
+        original_tokens = 0
+        tokens_saved = 0
+        turns_masked = 0
+
+        # Single pass over turns outside the window; each turn is masked by
+        # the lowest stage that applies to it.
+        for turn in islice(turns, cutoff):
+            original_tokens += turn.token_count
+            if turn.masked:
+                continue
+            code = turn.role_code
+            if role_mask & (1 << code):
+                # Stage 1: Mask tool outputs; stage 2: compress summaries
+                turn.content = _ROLE_MASK_TEMPLATES[code].format(turn.step_name)
+            elif use_file_pointers and len(turn.content) >= min_chars:
+                # Stage 3: Replace large text with file pointers
+                turn.content = f"[content saved to file; ref: {turn.step_name}]"
+            else:
+                continue
+            tokens_saved += turn.token_count - _MASKED_TOKEN_COUNT
+            turn.token_count = _MASKED_TOKEN_COUNT
+            turn.masked = True
+            turns_masked += 1
+
+        for turn in islice(turns, cutoff, None):
+            original_tokens += turn.token_count
 
         if turns_masked > 0:
             self._compaction_pending = False
@@ -233,7 +304,7 @@ class ContextManager:
 
         result = CompactionResult(
             original_tokens=original_tokens,
-            compacted_tokens=self.total_tokens,
+            compacted_tokens=original_tokens - tokens_saved,
             turns_masked=turns_masked,
             turns_total=len(self._turns),
             stage_applied=stage,
@@ -273,14 +344,9 @@ class ContextManager:
         Returns:
             Dict with ``system``, ``tools``, and ``messages`` keys.
         """
-        system_block = [
-            {
-                "type": "text",
-                "text": system_prompt,
-            }
-        ]
+        system_block = [{"type": "text", "text": system_prompt}]
 
-        tools: list[dict[str, Any]] = list(tool_definitions) if tool_definitions else []
+        tools: list[dict[str, Any]] = list(tool_definitions or _EMPTY_TOOLS)
 
         messages = self.get_context_window()
 
@@ -300,20 +366,28 @@ class ContextManager:
             utilization_percent, active_stage, masked_count,
             and unmasked_count.
         """
-        masked = sum(1 for t in self._turns if t.masked)
-        return {
-            "turn_count": self.turn_count,
-            "total_tokens": self.total_tokens,
-            "max_tokens": self.max_tokens,
-            "utilization_percent": round(self.utilization_percent, 1),
-            "active_stage": self.active_stage.name,
-            "masked_count": masked,
-            "unmasked_count": self.turn_count - masked,
-            "window_size": self.window_size,
-        }
+        turn_count = self.turn_count
+        masked = sum(t.masked for t in self._turns)
+        return dict(
+            zip(
+                _REPORT_KEYS,
+                (
+                    turn_count,
+                    self.total_tokens,
+                    self.max_tokens,
+                    round(self.utilization_percent, 1),
+                    self.active_stage.name,
+                    masked,
+                    turn_count - masked,
+                    self.window_size,
+                ),
+                strict=True,
+            )
+        )
 
     def clear(self) -> None:
         """Remove all turns and reset compaction state."""
         self._turns.clear()
         self._compaction_pending = False
         self._turns_since_compaction = 0
+        self._max_content_len = 0
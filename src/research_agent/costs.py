@@ -7,29 +7,47 @@ along with model fallback chains.
 
 from __future__ import annotations
 
-from enum import StrEnum
-from typing import ClassVar
+import math
+import sys
+import weakref
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import IntEnum
+from itertools import accumulate
+from types import MappingProxyType, MethodType
+from typing import TYPE_CHECKING, ClassVar, TypeAlias
 
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 from research_agent.exceptions import BudgetExhaustedError
+from research_agent.prompt_cache import (
+    CACHE_READ_COST_MULTIPLIER,
+    CACHE_WRITE_COST_MULTIPLIER,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
+# Step key used when a call record has no step name
+_UNKNOWN_STEP = "unknown"
+
 
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
 
 
-class DegradationTier(StrEnum):
-    """Budget degradation tiers (ordered by capability)."""
+class DegradationTier(IntEnum):
+    """Budget degradation tiers, ordered from most to least capable."""
 
-    FULL = "FULL"
-    REDUCED = "REDUCED"
-    CACHED = "CACHED"
-    PARTIAL = "PARTIAL"
+    FULL = 0
+    REDUCED = 1
+    CACHED = 2
+    PARTIAL = 3
 
 
 # ---------------------------------------------------------------------------
@@ -43,9 +61,21 @@ class LLMCallRecord(BaseModel):
     model: str = Field(description="Model identifier.")
     input_tokens: int = Field(default=0, ge=0)
     output_tokens: int = Field(default=0, ge=0)
+    cached_read_tokens: int = Field(
+        default=0, ge=0, description="Input tokens served from the prompt cache."
+    )
+    cached_write_tokens: int = Field(
+        default=0, ge=0, description="Input tokens written to the prompt cache."
+    )
     cost_usd: float = Field(default=0.0, ge=0.0)
     step_name: str = Field(default="", description="Graph node that made the call.")
 
+    @field_validator("step_name")
+    @classmethod
+    def intern_step_name(cls, v: str) -> str:
+        """Intern step names so per-step aggregation keys share one object."""
+        return sys.intern(v)
+
 
 class BudgetStatus(BaseModel):
     """Current budget consumption status."""
@@ -58,18 +88,45 @@ class BudgetStatus(BaseModel):
     budget_used_percent: float = Field(default=0.0, ge=0.0, le=100.0)
     current_tier: DegradationTier = DegradationTier.FULL
 
+    @field_validator("current_tier", mode="before")
+    @classmethod
+    def parse_tier_name(cls, v: object) -> object:
+        """Accept tiers by name, the form they are serialized in."""
+        if isinstance(v, str):
+            return DegradationTier.__members__.get(v, v)
+        return v
+
+    @field_serializer("current_tier")
+    def serialize_tier_name(self, tier: DegradationTier) -> str:
+        """Serialize tiers by name so the wire format stays ``"FULL"`` etc."""
+        return tier.name
+
 
 # ---------------------------------------------------------------------------
 # Pricing
 # ---------------------------------------------------------------------------
 
-# Approximate pricing per 1M tokens (input, output) in USD
-MODEL_PRICING: dict[str, tuple[float, float]] = {
-    "claude-sonnet-4-5-20250929": (3.00, 15.00),
-    "claude-haiku-3-5-20241022": (0.80, 4.00),
-    "gpt-4o": (2.50, 10.00),
-    "gpt-4o-mini": (0.15, 0.60),
-}
+# Approximate pricing per 1M tokens (input, output) in USD. Read-only, since
+# estimate_cost reads the column arrays derived from it below.
+MODEL_PRICING: Mapping[str, tuple[float, float]] = MappingProxyType(
+    {
+        "claude-sonnet-4-5-20250929": (3.00, 15.00),
+        "claude-haiku-3-5-20241022": (0.80, 4.00),
+        "gpt-4o": (2.50, 10.00),
+        "gpt-4o-mini": (0.15, 0.60),
+    }
+)
+
+# Pricing applied to models missing from MODEL_PRICING
+_FALLBACK_INPUT_PRICE = 5.0
+_FALLBACK_OUTPUT_PRICE = 15.0
+
+# Column-wise copy of MODEL_PRICING built at import: estimate_cost resolves
+# the model to an index once and reads both prices from contiguous arrays.
+_MODEL_INDEX: dict[str, int] = {model: i for i, model in enumerate(MODEL_PRICING)}
+_INPUT_PRICES = array("d", (prices[0] for prices in MODEL_PRICING.values()))
+_OUTPUT_PRICES = array("d", (prices[1] for prices in MODEL_PRICING.values()))
+
 
 # Tier transition thresholds (percentage of max budget consumed)
 # Per ARCHITECTURE.md: FULL -> REDUCED at 80% -> CACHED at 95% -> PARTIAL at 100%
@@ -80,12 +137,33 @@ _TIER_THRESHOLDS: dict[DegradationTier, float] = {
     DegradationTier.PARTIAL: 100.0,
 }
 
+_TIER_ORDER: tuple[DegradationTier, ...] = tuple(DegradationTier)
+
+# Packed tier lookup: bisect_right over the ascending thresholds yields the
+# index of the active tier in _TIER_ORDER.
+_TIER_BOUNDARIES: tuple[float, ...] = tuple(
+    _TIER_THRESHOLDS[tier] for tier in _TIER_ORDER[1:]
+)
+
 
 # ---------------------------------------------------------------------------
 # Budget Tracker
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True, slots=True)
+class _StrongRef:
+    """Strong counterpart to ``weakref.WeakMethod`` for plain observer callables."""
+
+    callback: Callable[[float], None]
+
+    def __call__(self) -> Callable[[float], None]:
+        return self.callback
+
+
+_ObserverRef: TypeAlias = "_StrongRef | weakref.WeakMethod[Callable[[float], None]]"
+
+
 class BudgetTracker:
     """Tracks cumulative cost of LLM calls within a research run.
 
@@ -95,6 +173,19 @@ class BudgetTracker:
         warn_at_percent: Emit a warning when usage exceeds this percentage.
     """
 
+    __slots__ = (
+        "_cost_by_step",
+        "_max_cost_usd",
+        "_observers",
+        "_records",
+        "_total_cost",
+        "_total_input_tokens",
+        "_total_output_tokens",
+        "_warned",
+        "max_llm_calls",
+        "warn_at_percent",
+    )
+
     def __init__(
         self,
         max_cost_usd: float = 2.00,
@@ -108,12 +199,57 @@ class BudgetTracker:
             max_llm_calls: Maximum number of LLM calls.
             warn_at_percent: Warning threshold as a percentage.
         """
-        self.max_cost_usd = max_cost_usd
+        self._max_cost_usd = max_cost_usd
         self.max_llm_calls = max_llm_calls
         self.warn_at_percent = warn_at_percent
         self._records: list[LLMCallRecord] = []
+        self._cost_by_step: dict[str, float] = {}
+        self._observers: list[_ObserverRef] = []
+        # Running totals so status() does not rescan the records
+        self._total_cost = 0.0
+        self._total_input_tokens = 0
+        self._total_output_tokens = 0
         self._warned = False
 
+    @property
+    def max_cost_usd(self) -> float:
+        """Return the maximum cost budget in USD.
+
+        Returns:
+            Budget limit.
+        """
+        return self._max_cost_usd
+
+    @max_cost_usd.setter
+    def max_cost_usd(self, value: float) -> None:
+        """Change the budget limit and push the new used percentage to observers.
+
+        Args:
+            value: New maximum cost budget in USD.
+        """
+        self._max_cost_usd = value
+        self._notify_observers()
+
+    @property
+    def used_percent(self) -> float:
+        """Return the percentage of the cost budget consumed.
+
+        Returns:
+            Used percentage (0.0 to 100.0+), or 0.0 when the budget is zero.
+        """
+        if self._max_cost_usd <= 0:
+            return 0.0
+        return self._total_cost / self._max_cost_usd * 100
+
+    @property
+    def current_tier(self) -> DegradationTier:
+        """Return the degradation tier for the current spend.
+
+        Returns:
+            The active degradation tier.
+        """
+        return self._current_tier(self.used_percent)
+
     @property
     def total_cost(self) -> float:
         """Return total accumulated cost in USD.
@@ -121,7 +257,7 @@ class BudgetTracker:
         Returns:
             Total cost.
         """
-        return sum(r.cost_usd for r in self._records)
+        return self._total_cost
 
     @property
     def total_calls(self) -> int:
@@ -137,19 +273,44 @@ class BudgetTracker:
         model: str,
         input_tokens: int,
         output_tokens: int,
+        cached_read_tokens: int = 0,
+        cached_write_tokens: int = 0,
     ) -> float:
         """Estimate cost for a prospective LLM call.
 
+        Prompt-cache tokens are priced relative to the model's input price:
+        reads at ``CACHE_READ_COST_MULTIPLIER`` and writes at
+        ``CACHE_WRITE_COST_MULTIPLIER``. ``input_tokens`` should exclude
+        tokens counted as cache reads or writes.
+
         Args:
             model: Model identifier.
-            input_tokens: Estimated input token count.
+            input_tokens: Estimated uncached input token count.
             output_tokens: Estimated output token count.
+            cached_read_tokens: Input tokens expected to be read from cache.
+            cached_write_tokens: Input tokens expected to be written to cache.
 
         Returns:
             Estimated cost in USD.
         """
-        input_price, output_price = MODEL_PRICING.get(model, (5.0, 15.0))
-        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+        idx = _MODEL_INDEX.get(model)
+        if idx is None:
+            input_price = _FALLBACK_INPUT_PRICE
+            output_price = _FALLBACK_OUTPUT_PRICE
+        else:
+            input_price = _INPUT_PRICES[idx]
+            output_price = _OUTPUT_PRICES[idx]
+        return (
+            math.fsum(
+                (
+                    input_tokens * input_price,
+                    output_tokens * output_price,
+                    cached_read_tokens * input_price * CACHE_READ_COST_MULTIPLIER,
+                    cached_write_tokens * input_price * CACHE_WRITE_COST_MULTIPLIER,
+                )
+            )
+            / 1_000_000
+        )
 
     def check_budget(self, estimated_cost: float = 0.0) -> None:
         """Pre-call budget check. Raises before spending.
@@ -160,14 +321,15 @@ class BudgetTracker:
         Raises:
             BudgetExhaustedError: If budget would be exceeded.
         """
-        projected = self.total_cost + estimated_cost
-        if projected >= self.max_cost_usd:
+        if estimated_cost >= self._max_cost_usd - self._total_cost:
             raise BudgetExhaustedError(
-                f"Budget would be exceeded: ${projected:.4f} >= ${self.max_cost_usd:.2f}"
+                kind="projected",
+                spent=self.total_cost + estimated_cost,
+                limit=self.max_cost_usd,
             )
-        if self.total_calls >= self.max_llm_calls:
+        if len(self._records) >= self.max_llm_calls:
             raise BudgetExhaustedError(
-                f"LLM call limit reached: {self.total_calls} >= {self.max_llm_calls}"
+                kind="calls", spent=self.total_calls, limit=self.max_llm_calls
             )
 
     def record_call(self, record: LLMCallRecord) -> None:
@@ -180,10 +342,76 @@ class BudgetTracker:
             BudgetExhaustedError: If the budget is fully consumed.
         """
         self._records.append(record)
+        self._total_cost += record.cost_usd
+        self._total_input_tokens += record.input_tokens
+        self._total_output_tokens += record.output_tokens
+        step = record.step_name or _UNKNOWN_STEP
+        self._cost_by_step[step] = self._cost_by_step.get(step, 0.0) + record.cost_usd
+        self._notify_observers()
+        self._check_thresholds()
 
-        pct = (
-            (self.total_cost / self.max_cost_usd * 100) if self.max_cost_usd > 0 else 0
-        )
+    def record_calls(self, records: Sequence[LLMCallRecord]) -> None:
+        """Record a batch of LLM calls and check budget thresholds once.
+
+        Useful when replaying logged calls. All records are tracked before
+        the thresholds are evaluated against the cumulative totals.
+
+        Args:
+            records: The call records to track.
+
+        Raises:
+            BudgetExhaustedError: If the budget is fully consumed.
+        """
+        if not records:
+            return
+        self._records.extend(records)
+        cost_by_step = self._cost_by_step
+        for record in records:
+            self._total_cost += record.cost_usd
+            self._total_input_tokens += record.input_tokens
+            self._total_output_tokens += record.output_tokens
+            step = record.step_name or _UNKNOWN_STEP
+            cost_by_step[step] = cost_by_step.get(step, 0.0) + record.cost_usd
+        self._notify_observers()
+        self._check_thresholds()
+
+    def add_observer(self, callback: Callable[[float], None]) -> None:
+        """Register a callback invoked with the used percentage after each update.
+
+        Observers are notified after each record and when ``max_cost_usd``
+        changes. They run before budget limits are enforced, so they also
+        see the call that exhausts the budget. Bound methods are held
+        weakly: registering one does not keep its object alive, and it is
+        dropped once the object is collected.
+
+        Args:
+            callback: Called with the budget used percentage (0.0 to 100.0+).
+        """
+        if isinstance(callback, MethodType):
+            self._observers.append(weakref.WeakMethod(callback))
+        else:
+            self._observers.append(_StrongRef(callback))
+
+    def _notify_observers(self) -> None:
+        """Push the current budget used percentage to registered observers."""
+        if not self._observers:
+            return
+        pct = self.used_percent
+        live: list[_ObserverRef] = []
+        for ref in self._observers:
+            callback = ref()
+            if callback is not None:
+                live.append(ref)
+                callback(pct)
+        self._observers = live
+
+    def _check_thresholds(self) -> None:
+        """Warn once past the warning threshold and enforce hard limits.
+
+        Raises:
+            BudgetExhaustedError: If the budget or call limit is reached.
+        """
+        pct = self.used_percent
         if pct >= self.warn_at_percent and not self._warned:
             self._warned = True
             logger.warning(
@@ -195,12 +423,12 @@ class BudgetTracker:
 
         if self.total_cost >= self.max_cost_usd:
             raise BudgetExhaustedError(
-                f"Budget exhausted: ${self.total_cost:.4f} >= ${self.max_cost_usd:.2f}"
+                kind="cost", spent=self.total_cost, limit=self.max_cost_usd
             )
 
         if self.total_calls >= self.max_llm_calls:
             raise BudgetExhaustedError(
-                f"LLM call limit reached: {self.total_calls} >= {self.max_llm_calls}"
+                kind="calls", spent=self.total_calls, limit=self.max_llm_calls
             )
 
     def status(self) -> BudgetStatus:
@@ -209,15 +437,13 @@ class BudgetTracker:
         Returns:
             A ``BudgetStatus`` snapshot.
         """
-        pct = (
-            (self.total_cost / self.max_cost_usd * 100) if self.max_cost_usd > 0 else 0
-        )
+        pct = self.used_percent
         remaining = max(0.0, self.max_cost_usd - self.total_cost)
         return BudgetStatus(
             total_cost_usd=round(self.total_cost, 4),
             total_llm_calls=self.total_calls,
-            total_input_tokens=sum(r.input_tokens for r in self._records),
-            total_output_tokens=sum(r.output_tokens for r in self._records),
+            total_input_tokens=self._total_input_tokens,
+            total_output_tokens=self._total_output_tokens,
             budget_remaining_usd=round(remaining, 4),
             budget_used_percent=round(min(pct, 100.0), 1),
             current_tier=self._current_tier(pct),
@@ -226,14 +452,32 @@ class BudgetTracker:
     def cost_per_step(self) -> dict[str, float]:
         """Aggregate cost by graph step name for report metadata.
 
+        Totals are accumulated in ``record_call`` so this is proportional to
+        the number of distinct steps, not the number of recorded calls.
+
         Returns:
             Mapping of step name to total cost in USD for that step.
         """
-        breakdown: dict[str, float] = {}
-        for record in self._records:
-            key = record.step_name or "unknown"
-            breakdown[key] = breakdown.get(key, 0.0) + record.cost_usd
-        return {k: round(v, 6) for k, v in breakdown.items()}
+        return {k: round(v, 6) for k, v in self._cost_by_step.items()}
+
+    def tier_trace(self) -> list[DegradationTier]:
+        """Return the degradation tier reached after each recorded call.
+
+        Replays the cumulative spend over the recorded calls, which is
+        useful for analysing how a run moved through the tiers.
+
+        Returns:
+            One tier per recorded call, in recording order.
+        """
+        if self.max_cost_usd <= 0:
+            return [DegradationTier.FULL] * len(self._records)
+        scale = 100.0 / self.max_cost_usd
+        order = _TIER_ORDER
+        boundaries = _TIER_BOUNDARIES
+        return [
+            order[bisect_right(boundaries, spent * scale)]
+            for spent in accumulate(r.cost_usd for r in self._records)
+        ]
 
     @staticmethod
     def _current_tier(used_percent: float) -> DegradationTier:
@@ -245,13 +489,7 @@ class BudgetTracker:
         Returns:
             The active degradation tier.
         """
-        if used_percent >= _TIER_THRESHOLDS[DegradationTier.PARTIAL]:
-            return DegradationTier.PARTIAL
-        if used_percent >= _TIER_THRESHOLDS[DegradationTier.CACHED]:
-            return DegradationTier.CACHED
-        if used_percent >= _TIER_THRESHOLDS[DegradationTier.REDUCED]:
-            return DegradationTier.REDUCED
-        return DegradationTier.FULL
+        return _TIER_ORDER[bisect_right(_TIER_BOUNDARIES, used_percent)]
 
 
 # ---------------------------------------------------------------------------
@@ -259,16 +497,47 @@ class BudgetTracker:
 # ---------------------------------------------------------------------------
 
 
-_TIER_ORDER: list[DegradationTier] = [
-    DegradationTier.FULL,
-    DegradationTier.REDUCED,
-    DegradationTier.CACHED,
-    DegradationTier.PARTIAL,
-]
-
 _RECOVERY_THRESHOLD = 75.0  # Recover upward when budget usage drops below 75%
 
 
+@dataclass(frozen=True, slots=True)
+class TierPolicy:
+    """Capabilities allowed at a single degradation tier."""
+
+    model_chain: tuple[str, ...]
+    skip_search: bool
+    skip_scraping: bool
+    max_search_results: int
+
+
+_TIER_POLICIES: dict[DegradationTier, TierPolicy] = {
+    DegradationTier.FULL: TierPolicy(
+        model_chain=("claude-sonnet-4-5-20250929", "gpt-4o"),
+        skip_search=False,
+        skip_scraping=False,
+        max_search_results=10,
+    ),
+    DegradationTier.REDUCED: TierPolicy(
+        model_chain=("claude-haiku-3-5-20241022", "gpt-4o-mini"),
+        skip_search=False,
+        skip_scraping=False,
+        max_search_results=5,
+    ),
+    DegradationTier.CACHED: TierPolicy(
+        model_chain=("claude-haiku-3-5-20241022",),
+        skip_search=True,
+        skip_scraping=False,
+        max_search_results=3,
+    ),
+    DegradationTier.PARTIAL: TierPolicy(
+        model_chain=("gpt-4o-mini",),
+        skip_search=True,
+        skip_scraping=True,
+        max_search_results=0,
+    ),
+}
+
+
 class DegradationManager:
     """Manages capability degradation based on budget tier.
 
@@ -280,22 +549,11 @@ class DegradationManager:
         tracker: The underlying budget tracker.
     """
 
+    __slots__ = ("__weakref__", "_budget_tier", "_forced_tier", "_last_tier", "tracker")
+
     # Model fallback chain per tier
     MODEL_CHAINS: ClassVar[dict[DegradationTier, list[str]]] = {
-        DegradationTier.FULL: [
-            "claude-sonnet-4-5-20250929",
-            "gpt-4o",
-        ],
-        DegradationTier.REDUCED: [
-            "claude-haiku-3-5-20241022",
-            "gpt-4o-mini",
-        ],
-        DegradationTier.CACHED: [
-            "claude-haiku-3-5-20241022",
-        ],
-        DegradationTier.PARTIAL: [
-            "gpt-4o-mini",
-        ],
+        tier: list(policy.model_chain) for tier, policy in _TIER_POLICIES.items()
     }
 
     def __init__(self, tracker: BudgetTracker) -> None:
@@ -307,13 +565,25 @@ class DegradationManager:
         self.tracker = tracker
         self._forced_tier: DegradationTier | None = None
         self._last_tier: DegradationTier = DegradationTier.FULL
+        # Budget-derived tier, kept current by the tracker's observer callback
+        self._budget_tier: DegradationTier = tracker.current_tier
+        tracker.add_observer(self._on_tracker_update)
+
+    def _on_tracker_update(self, used_percent: float) -> None:
+        """Refresh the cached budget tier after the tracker's spend or limit changes.
+
+        Args:
+            used_percent: Percentage of the budget consumed.
+        """
+        self._budget_tier = self.tracker.current_tier
 
     @property
     def tier(self) -> DegradationTier:
         """Return the current degradation tier.
 
-        Uses the forced tier if set, otherwise computes from budget.
-        Logs tier transitions when the active tier changes.
+        Uses the forced tier if set, otherwise the budget tier cached from
+        the tracker's last update. Logs tier transitions when the active
+        tier changes.
 
         Returns:
             Active tier.
@@ -321,13 +591,13 @@ class DegradationManager:
         if self._forced_tier is not None:
             active = self._forced_tier
         else:
-            active = self.tracker.status().current_tier
+            active = self._budget_tier
 
         if active != self._last_tier:
             logger.info(
                 "tier_transition",
-                from_tier=self._last_tier.value,
-                to_tier=active.value,
+                from_tier=self._last_tier.name,
+                to_tier=active.name,
                 budget_used_percent=self.tracker.status().budget_used_percent,
             )
             self._last_tier = active
@@ -346,13 +616,13 @@ class DegradationManager:
         """
         if tier is not None:
             self._forced_tier = tier
-            logger.info("forced_degradation", tier=tier.value)
+            logger.info("forced_degradation", tier=tier.name)
             return
 
-        current_idx = _TIER_ORDER.index(self.tier)
-        if current_idx < len(_TIER_ORDER) - 1:
-            self._forced_tier = _TIER_ORDER[current_idx + 1]
-            logger.info("forced_degradation", tier=self._forced_tier.value)
+        current = self.tier
+        if current < DegradationTier.PARTIAL:
+            self._forced_tier = DegradationTier(current + 1)
+            logger.info("forced_degradation", tier=self._forced_tier.name)
 
     def try_recover(self) -> bool:
         """Attempt to recover upward one tier.
@@ -371,27 +641,32 @@ class DegradationManager:
         if status.budget_used_percent >= _RECOVERY_THRESHOLD:
             return False
 
-        current_idx = _TIER_ORDER.index(self._forced_tier)
-        if current_idx <= 1:
+        if self._forced_tier <= DegradationTier.REDUCED:
             # Recovering to FULL clears the forced override entirely
             self._forced_tier = None
-            logger.info("tier_recovered", to_tier=DegradationTier.FULL.value)
+            logger.info("tier_recovered", to_tier=DegradationTier.FULL.name)
             return True
 
-        self._forced_tier = _TIER_ORDER[current_idx - 1]
-        logger.info("tier_recovered", to_tier=self._forced_tier.value)
+        self._forced_tier = DegradationTier(self._forced_tier - 1)
+        logger.info("tier_recovered", to_tier=self._forced_tier.name)
         return True
 
+    @property
+    def policy(self) -> TierPolicy:
+        """Return the capability policy for the current tier.
+
+        Returns:
+            The ``TierPolicy`` for the active tier.
+        """
+        return _TIER_POLICIES[self.tier]
+
     def get_model(self) -> str:
         """Return the preferred model for the current tier.
 
         Returns:
             Model identifier string.
         """
-        chain = self.MODEL_CHAINS.get(
-            self.tier, self.MODEL_CHAINS[DegradationTier.FULL]
-        )
-        return chain[0]
+        return self.policy.model_chain[0]
 
     def get_fallback_chain(self) -> list[str]:
         """Return the full model fallback chain for the current tier.
@@ -399,9 +674,7 @@ class DegradationManager:
         Returns:
             Ordered list of model identifiers (preferred first).
         """
-        return list(
-            self.MODEL_CHAINS.get(self.tier, self.MODEL_CHAINS[DegradationTier.FULL])
-        )
+        return list(self.policy.model_chain)
 
     def should_skip_search(self) -> bool:
         """Whether to skip new web searches (use cache only).
@@ -409,7 +682,7 @@ class DegradationManager:
         Returns:
             True if in CACHED or PARTIAL tier.
         """
-        return self.tier in {DegradationTier.CACHED, DegradationTier.PARTIAL}
+        return self.policy.skip_search
 
     def should_skip_scraping(self) -> bool:
         """Whether to skip web scraping (use cached content only).
@@ -417,7 +690,7 @@ class DegradationManager:
         Returns:
             True if in PARTIAL tier.
         """
-        return self.tier == DegradationTier.PARTIAL
+        return self.policy.skip_scraping
 
     def max_search_results(self) -> int:
         """Return the maximum search results allowed at the current tier.
@@ -425,13 +698,7 @@ class DegradationManager:
         Returns:
             Integer limit.
         """
-        limits: dict[DegradationTier, int] = {
-            DegradationTier.FULL: 10,
-            DegradationTier.REDUCED: 5,
-            DegradationTier.CACHED: 3,
-            DegradationTier.PARTIAL: 0,
-        }
-        return limits.get(self.tier, 10)
+        return self.policy.max_search_results
 
 
 # ---------------------------------------------------------------------------
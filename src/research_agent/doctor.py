@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import os
+import threading
+import time
 from enum import StrEnum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import httpx
 from pydantic import BaseModel, Field
 
 from research_agent.config import Settings
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    _Probe = Callable[[httpx.AsyncClient, str], Awaitable["CheckResult"]]
+    # Stage name, names of the checks it reports, and the deferred check call
+    _Stage = tuple[str, tuple[str, ...], Callable[[], list["CheckResult"]]]
+
 
 class CheckStatus(StrEnum):
     """Status for a doctor check item."""
@@ -19,6 +30,7 @@ class CheckStatus(StrEnum):
     OK = "ok"
     WARN = "warn"
     FAIL = "fail"
+    SKIPPED = "skipped"
 
 
 class CheckResult(BaseModel):
@@ -82,14 +94,13 @@ def _check_chromadb_directory(path: Path) -> CheckResult:
         )
 
 
-def _probe_openai(api_key: str, timeout: float) -> CheckResult:
+async def _probe_openai(client: httpx.AsyncClient, api_key: str) -> CheckResult:
     headers = {"Authorization": f"Bearer {api_key}"}
     try:
-        response = httpx.get(
+        response = await client.get(
             "https://api.openai.com/v1/models",
             headers=headers,
             params={"limit": 1},
-            timeout=timeout,
         )
         if response.status_code == 200:
             return CheckResult(
@@ -112,7 +123,7 @@ def _probe_openai(api_key: str, timeout: float) -> CheckResult:
         )
 
 
-def _probe_anthropic(api_key: str, timeout: float) -> CheckResult:
+async def _probe_anthropic(client: httpx.AsyncClient, api_key: str) -> CheckResult:
     headers = {
         "x-api-key": api_key,
         "anthropic-version": "2023-06-01",
@@ -124,11 +135,10 @@ def _probe_anthropic(api_key: str, timeout: float) -> CheckResult:
         "messages": [{"role": "user", "content": "ping"}],
     }
     try:
-        response = httpx.post(
+        response = await client.post(
             "https://api.anthropic.com/v1/messages",
             headers=headers,
             json=payload,
-            timeout=timeout,
         )
         if response.status_code == 200:
             return CheckResult(
@@ -151,7 +161,7 @@ def _probe_anthropic(api_key: str, timeout: float) -> CheckResult:
         )
 
 
-def _probe_tavily(api_key: str, timeout: float) -> CheckResult:
+async def _probe_tavily(client: httpx.AsyncClient, api_key: str) -> CheckResult:
     payload = {
         "api_key": api_key,
         "query": "health check",
@@ -159,10 +169,9 @@ def _probe_tavily(api_key: str, timeout: float) -> CheckResult:
         "search_depth": "basic",
     }
     try:
-        response = httpx.post(
+        response = await client.post(
             "https://api.tavily.com/search",
             json=payload,
-            timeout=timeout,
         )
         if response.status_code == 200:
             return CheckResult(
@@ -186,30 +195,63 @@ def _probe_tavily(api_key: str, timeout: float) -> CheckResult:
 
 
 def _check_api_keys(timeout: float = 5.0) -> list[CheckResult]:
-    checks: list[CheckResult] = []
+    return asyncio.run(_probe_api_keys(timeout))
+
+
+_API_KEY_CHECKS = ("anthropic-api-key", "openai-api-key", "tavily-api-key")
 
-    anthropic_key = os.getenv("ANTHROPIC_API_KEY")
-    openai_key = os.getenv("OPENAI_API_KEY")
-    tavily_key = os.getenv("TAVILY_API_KEY")
+# Stage names in ascending cost order, the order fast-fail runs them in
+_FAST_FAIL_ORDER = (
+    "config-schema",
+    "optional-dependencies",
+    "chromadb-directory",
+    "api-probes",
+)
 
-    key_specs = [
-        ("anthropic-api-key", anthropic_key, _probe_anthropic),
-        ("openai-api-key", openai_key, _probe_openai),
-        ("tavily-api-key", tavily_key, _probe_tavily),
+
+async def _probe_api_keys(timeout: float) -> list[CheckResult]:
+    anthropic_check, openai_check, tavily_check = _API_KEY_CHECKS
+    key_specs: list[tuple[str, str | None, _Probe]] = [
+        (anthropic_check, os.getenv("ANTHROPIC_API_KEY"), _probe_anthropic),
+        (openai_check, os.getenv("OPENAI_API_KEY"), _probe_openai),
+        (tavily_check, os.getenv("TAVILY_API_KEY"), _probe_tavily),
     ]
-    for check_name, key_value, checker in key_specs:
-        if not key_value:
-            checks.append(
-                CheckResult(
-                    name=check_name,
-                    status=CheckStatus.FAIL,
-                    message="API key is not set.",
-                )
+
+    # One keep-alive client for every probe, so they share a connection pool
+    limits = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        # gather preserves argument order, so results stay in key_specs order
+        checks = await asyncio.gather(
+            *(
+                _run_probe(check_name, key_value, checker, client, timeout)
+                for check_name, key_value, checker in key_specs
             )
-            continue
-        checks.append(checker(key_value, timeout))
+        )
+    return list(checks)
 
-    return checks
+
+async def _run_probe(
+    check_name: str,
+    key_value: str | None,
+    checker: _Probe,
+    client: httpx.AsyncClient,
+    timeout: float,
+) -> CheckResult:
+    if not key_value:
+        return CheckResult(
+            name=check_name,
+            status=CheckStatus.FAIL,
+            message="API key is not set.",
+        )
+    try:
+        return await asyncio.wait_for(checker(client, key_value), timeout=timeout)
+    except TimeoutError:
+        return CheckResult(
+            name=check_name,
+            status=CheckStatus.FAIL,
+            message="API probe timed out.",
+            details={"timeout": f"{timeout}s"},
+        )
 
 
 def _check_optional_dependencies() -> CheckResult:
@@ -250,23 +292,131 @@ def run_doctor(
     settings: Settings,
     config_path: Path | None = None,
     check_api_probes: bool = True,
+    fast_fail: bool = False,
+    per_check_timeout: float = 30.0,
 ) -> DoctorReport:
-    """Run all health checks and return a structured report."""
-    checks = [
-        _check_config_schema(config_path),
-        _check_chromadb_directory(Path(settings.vector_store.persist_directory)),
+    """Run all health checks and return a structured report.
+
+    The checks are independent, so by default they run concurrently and
+    any check still running after ``per_check_timeout`` seconds is
+    reported as a warning instead of holding up the report.
+
+    With ``fast_fail``, checks run one at a time, cheapest first. The
+    first failing check stops the run and the remaining checks are
+    reported as skipped, so a broken config never pays for the network
+    probes.
+    """
+    stages = _doctor_stages(settings, config_path, check_api_probes)
+    if not fast_fail:
+        return DoctorReport(checks=_run_stages_concurrently(stages, per_check_timeout))
+
+    by_name = {stage[0]: stage for stage in stages}
+    results_by_stage: dict[str, list[CheckResult]] = {}
+    for index, name in enumerate(_FAST_FAIL_ORDER):
+        results = by_name[name][2]()
+        results_by_stage[name] = results
+        if any(check.status == CheckStatus.FAIL for check in results):
+            for skipped_stage in _FAST_FAIL_ORDER[index + 1 :]:
+                results_by_stage[skipped_stage] = [
+                    CheckResult(
+                        name=check_name,
+                        status=CheckStatus.SKIPPED,
+                        message=f"Skipped because {name} failed.",
+                    )
+                    for check_name in by_name[skipped_stage][1]
+                ]
+            break
+    # Report in the usual display order, whatever order the stages ran in
+    return DoctorReport(
+        checks=[check for name, _, _ in stages for check in results_by_stage[name]]
+    )
+
+
+def _run_stages_concurrently(
+    stages: list[_Stage],
+    timeout: float,
+) -> list[CheckResult]:
+    """Run every stage on its own thread, keeping results in stage order.
+
+    The threads are daemons, so a hung check neither delays the report nor
+    keeps the process alive once the report is returned.
+    """
+    outcomes: list[list[CheckResult] | Exception | None] = [None] * len(stages)
+
+    def run(index: int, run_stage: Callable[[], list[CheckResult]]) -> None:
+        try:
+            outcomes[index] = run_stage()
+        except Exception as exc:
+            outcomes[index] = exc
+
+    threads = [
+        threading.Thread(
+            target=run, args=(index, run_stage), name=f"doctor-{name}", daemon=True
+        )
+        for index, (name, _, run_stage) in enumerate(stages)
     ]
+    for thread in threads:
+        thread.start()
+    # Every stage starts at once, so one shared deadline is a per-check timeout
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+    checks: list[CheckResult] = []
+    for (_, check_names, _), outcome in zip(stages, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome is None:
+            checks.extend(
+                CheckResult(
+                    name=check_name,
+                    status=CheckStatus.WARN,
+                    message="Check timed out.",
+                    details={"timeout": f"{timeout}s"},
+                )
+                for check_name in check_names
+            )
+        else:
+            checks.extend(outcome)
+    return checks
 
-    if check_api_probes:
-        checks.extend(_check_api_keys())
-    else:
-        checks.append(
+
+def _doctor_stages(
+    settings: Settings,
+    config_path: Path | None,
+    check_api_probes: bool,
+) -> list[_Stage]:
+    """Return each doctor check as a deferred call, in display order."""
+    persist_directory = Path(settings.vector_store.persist_directory)
+
+    def skipped_probes() -> list[CheckResult]:
+        return [
             CheckResult(
                 name="api-probes",
                 status=CheckStatus.WARN,
                 message="API key probe checks were skipped.",
             )
-        )
-
-    checks.append(_check_optional_dependencies())
-    return DoctorReport(checks=checks)
+        ]
+
+    return [
+        (
+            "config-schema",
+            ("config-schema",),
+            lambda: [_check_config_schema(config_path)],
+        ),
+        (
+            "chromadb-directory",
+            ("chromadb-directory",),
+            lambda: [_check_chromadb_directory(persist_directory)],
+        ),
+        (
+            ("api-probes", _API_KEY_CHECKS, _check_api_keys)
+            if check_api_probes
+            else ("api-probes", ("api-probes",), skipped_probes)
+        ),
+        (
+            "optional-dependencies",
+            ("optional-dependencies",),
+            lambda: [_check_optional_dependencies()],
+        ),
+    ]
@@ -11,12 +11,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import structlog
 from pydantic import BaseModel, Field
 
 from research_agent.exceptions import EmbeddingError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
@@ -60,6 +62,44 @@ class DeduplicationResult(BaseModel):
     )
 
 
+# ---------------------------------------------------------------------------
+# Similarity helpers
+# ---------------------------------------------------------------------------
+
+
+def _similarities(distances: Sequence[float]) -> np.ndarray:
+    """Convert ChromaDB distances to similarity scores in [0, 1].
+
+    Stored and query vectors are unit-normalized, so both the inner-product
+    and cosine distance spaces report ``1 - cosine similarity``.
+
+    Args:
+        distances: Distances for one query, as returned by ``collection.query``.
+
+    Returns:
+        A float64 array of ``1 - distance`` clipped to the unit interval.
+    """
+    return np.clip(1.0 - np.asarray(distances, dtype=np.float64), 0.0, 1.0)
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row of ``matrix`` to unit length, leaving zero rows as zero."""
+    # Row-wise self dot products; cheaper than np.linalg.norm's generic path
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))[:, np.newaxis]
+    unit: np.ndarray = np.divide(
+        matrix, norms, out=np.zeros_like(matrix), where=norms > 0
+    )
+    return unit
+
+
+def _ensure_unit_rows(matrix: np.ndarray) -> np.ndarray:
+    """Return ``matrix`` with unit-length rows, copying only if a row is not."""
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    if np.allclose(norms, 1.0, rtol=0.0, atol=1e-5):
+        return matrix
+    return _unit_rows(matrix)
+
+
 # ---------------------------------------------------------------------------
 # Embeddings class
 # ---------------------------------------------------------------------------
@@ -81,6 +121,7 @@ class ResearchEmbeddings:
     DEFAULT_MODEL = "nomic-ai/nomic-embed-text-v1.5"
     DEFAULT_CONTENT_DEDUP_THRESHOLD = 0.85
     DEFAULT_EXACT_DEDUP_THRESHOLD = 0.95
+    DEFAULT_EMBED_BATCH_SIZE = 32
 
     def __init__(
         self,
@@ -90,6 +131,7 @@ class ResearchEmbeddings:
         dimensions: int = 768,
         content_dedup_threshold: float = DEFAULT_CONTENT_DEDUP_THRESHOLD,
         exact_dedup_threshold: float = DEFAULT_EXACT_DEDUP_THRESHOLD,
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
     ) -> None:
         """Initialize the embeddings manager.
 
@@ -100,6 +142,7 @@ class ResearchEmbeddings:
             dimensions: Embedding vector dimensions.
             content_dedup_threshold: Cosine similarity for content-level dedup (0.85).
             exact_dedup_threshold: Cosine similarity for exact-match dedup (0.95).
+            embed_batch_size: Texts per model forward pass in ``embed``.
         """
         self.collection_name = collection_name
         self.persist_directory = str(persist_directory)
@@ -107,10 +150,14 @@ class ResearchEmbeddings:
         self.dimensions = dimensions
         self.content_dedup_threshold = content_dedup_threshold
         self.exact_dedup_threshold = exact_dedup_threshold
+        self.embed_batch_size = embed_batch_size
 
         self._client: Any = None  # chromadb.ClientAPI (lazy-loaded)
         self._collection: Any = None  # chromadb.Collection (lazy-loaded)
         self._model: Any = None  # SentenceTransformer (lazy-loaded)
+        # Mean of the stored unit vectors and how many it covers (lazy-loaded)
+        self._mean_normed: np.ndarray | None = None
+        self._mean_count = 0
 
     def _get_client(self) -> Any:
         """Get or create the ChromaDB persistent client.
@@ -137,7 +184,12 @@ class ResearchEmbeddings:
         return self._client
 
     def _get_collection(self) -> Any:
-        """Get or create the ChromaDB collection with cosine similarity.
+        """Get or create the ChromaDB collection.
+
+        Embeddings are normalized before they are stored, so the collection
+        uses the inner-product space: it ranks identically to cosine but
+        skips the per-comparison norm computation. Collections created
+        before this keep the space they were created with.
 
         Returns:
             ChromaDB collection instance.
@@ -148,7 +200,7 @@ class ResearchEmbeddings:
         client = self._get_client()
         self._collection = client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"hnsw:space": "cosine"},
+            metadata={"hnsw:space": "ip"},
         )
         logger.info(
             "chromadb_collection_ready",
@@ -183,50 +235,79 @@ class ResearchEmbeddings:
         logger.info("embedding_model_loaded", model=self.model_name)
         return self._model
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed(self, texts: list[str]) -> np.ndarray:
         """Generate embeddings for a list of texts.
 
+        The model output is returned as-is when it is already float32 and
+        unit-normalized, so no per-row Python lists are built; ChromaDB
+        accepts the array directly.
+
         Args:
             texts: Text strings to embed.
 
         Returns:
-            List of embedding vectors (each a list of floats).
+            A float32 array of shape ``(len(texts), dimensions)`` whose
+            non-zero rows have unit length.
 
         Raises:
             EmbeddingError: If the embedding model fails.
         """
         if not texts:
-            return []
+            return np.empty((0, self.dimensions), dtype=np.float32)
 
         model = self._get_model()
         try:
-            embeddings = model.encode(texts, normalize_embeddings=True)
-            return [vec.tolist() for vec in embeddings]
+            embeddings = model.encode(
+                texts, batch_size=self.embed_batch_size, normalize_embeddings=True
+            )
+            vectors: np.ndarray = np.asarray(embeddings, dtype=np.float32)
         except Exception as exc:
             raise EmbeddingError(f"Embedding failed: {exc}") from exc
+        # The inner-product space only equals cosine for unit vectors, so
+        # guarantee that here rather than trusting every model's output
+        return _ensure_unit_rows(vectors)
 
     def add_documents(self, documents: list[EmbeddingDocument]) -> int:
         """Add documents to the vector store with deduplication.
 
         Checks each document against existing content before adding.
         Documents with similarity above ``content_dedup_threshold``
-        are skipped as duplicates.
+        are skipped as duplicates. The batch is embedded, looked up in
+        the collection, and stored with one call each; documents are also
+        checked against those accepted earlier in the same batch. Documents
+        whose id is already stored, or already used earlier in the batch,
+        are skipped, since ChromaDB would not store them.
 
         Args:
             documents: Documents to add.
 
         Returns:
             Number of documents actually added (excluding duplicates).
+
+        Raises:
+            EmbeddingError: If the collection rejects the batch.
         """
         if not documents:
             return 0
 
         collection = self._get_collection()
-        added = 0
-
-        for doc in documents:
+        vectors = self.embed([doc.content for doc in documents])
+        stored_matches = self._check_vectors(vectors)
+        # Rows are unit length, so the Gram matrix is the cosine matrix
+        batch_similarity: np.ndarray = vectors @ vectors.T
+        accepted: list[int] = []
+        # ChromaDB ignores ids it already stores and rejects the whole add if
+        # an id repeats within it
+        seen_ids = self._stored_ids([doc.id for doc in documents])
+
+        for i, doc in enumerate(documents):
+            if doc.id in seen_ids:
+                logger.debug("document_skipped_duplicate_id", doc_id=doc.id)
+                continue
             # Check for duplicates before adding
-            dedup = self.check_duplicate(doc.content)
+            dedup = self._batch_duplicate(i, accepted, batch_similarity, documents)
+            if not dedup.is_duplicate:
+                dedup = stored_matches[i]
             if dedup.is_duplicate:
                 logger.debug(
                     "document_skipped_duplicate",
@@ -235,18 +316,31 @@ class ResearchEmbeddings:
                     score=dedup.similarity_score,
                 )
                 continue
-
-            # Embed and add
-            vectors = self.embed([doc.content])
-            collection.add(
-                ids=[doc.id],
-                embeddings=vectors,
-                documents=[doc.content],
-                metadatas=[doc.metadata] if doc.metadata else None,
-            )
-            added += 1
-            logger.debug("document_added", doc_id=doc.id)
-
+            accepted.append(i)
+            seen_ids.add(doc.id)
+
+        added = len(accepted)
+        if accepted:
+            kept = [documents[i] for i in accepted]
+            try:
+                collection.add(
+                    ids=[doc.id for doc in kept],
+                    embeddings=vectors[accepted],
+                    documents=[doc.content for doc in kept],
+                    metadatas=(
+                        [doc.metadata or None for doc in kept]
+                        if any(doc.metadata for doc in kept)
+                        else None
+                    ),
+                )
+            except Exception as exc:
+                raise EmbeddingError(f"Adding documents failed: {exc}") from exc
+            logger.debug("documents_added", doc_ids=[doc.id for doc in kept])
+        if added and self._mean_normed is not None:
+            new_sum = vectors[accepted].sum(axis=0, dtype=np.float64)
+            total = self._mean_count + added
+            self._mean_normed = (self._mean_normed * self._mean_count + new_sum) / total
+            self._mean_count = total
         logger.info(
             "add_documents_complete",
             total=len(documents),
@@ -255,6 +349,49 @@ class ResearchEmbeddings:
         )
         return added
 
+    def _stored_ids(self, ids: list[str]) -> set[str]:
+        """Return which of ``ids`` are already stored in the collection.
+
+        Args:
+            ids: Document ids to look up.
+
+        Returns:
+            The subset of ``ids`` present in the collection.
+        """
+        collection = self._get_collection()
+        if collection.count() == 0:
+            return set()
+        return set(collection.get(ids=ids, include=[])["ids"])
+
+    def _batch_duplicate(
+        self,
+        index: int,
+        accepted: list[int],
+        similarity: np.ndarray,
+        documents: list[EmbeddingDocument],
+    ) -> DeduplicationResult:
+        """Check a batch document against the documents already accepted.
+
+        Args:
+            index: Position of the document in the batch.
+            accepted: Positions of documents added earlier in the batch.
+            similarity: Pairwise similarity matrix for the batch.
+            documents: The batch being added.
+
+        Returns:
+            A ``DeduplicationResult`` for the closest accepted document.
+        """
+        if not accepted:
+            return DeduplicationResult()
+        row = similarity[index, accepted]
+        best = int(np.argmax(row))
+        score = float(np.clip(row[best], 0.0, 1.0))
+        return DeduplicationResult(
+            is_duplicate=score >= self.content_dedup_threshold,
+            most_similar_id=documents[accepted[best]].id,
+            similarity_score=score,
+        )
+
     def search(
         self,
         query: str,
@@ -297,21 +434,19 @@ class ResearchEmbeddings:
             docs = raw["documents"][0] if raw.get("documents") else [""] * len(ids)
             distances = raw["distances"][0] if raw.get("distances") else [1.0] * len(ids)
             metadatas = raw["metadatas"][0] if raw.get("metadatas") else [{}] * len(ids)
+            scores = _similarities(distances)
 
-            for i, doc_id in enumerate(ids):
-                # ChromaDB cosine distance = 1 - similarity
-                similarity = 1.0 - distances[i]
+            # Descending score; stable so ties keep ChromaDB's order
+            for i in np.argsort(-scores, kind="stable"):
                 results.append(
                     SimilarityResult(
-                        id=doc_id,
+                        id=ids[i],
                         content=docs[i] or "",
-                        score=max(0.0, min(1.0, similarity)),
+                        score=float(scores[i]),
                         metadata=metadatas[i] or {},
                     )
                 )
 
-        # Sort by descending score
-        results.sort(key=lambda r: r.score, reverse=True)
         return results
 
     def check_duplicate(self, content: str) -> DeduplicationResult:
@@ -328,33 +463,99 @@ class ResearchEmbeddings:
             A ``DeduplicationResult`` indicating whether the content is
             a duplicate and the closest match.
         """
+        if self._get_collection().count() == 0:
+            return DeduplicationResult()
+        return self._check_vector(self.embed([content])[0])
+
+    def _check_vector(self, vector: np.ndarray) -> DeduplicationResult:
+        """Check an embedded vector against the stored documents.
+
+        Args:
+            vector: Normalized embedding to look up.
+
+        Returns:
+            A ``DeduplicationResult`` for the nearest stored document.
+        """
+        return self._check_vectors(vector[np.newaxis])[0]
+
+    def _check_vectors(self, vectors: np.ndarray) -> list[DeduplicationResult]:
+        """Check embedded vectors against the stored documents in one query.
+
+        Args:
+            vectors: Normalized embeddings to look up, one per row.
+
+        Returns:
+            One ``DeduplicationResult`` per vector, for its nearest stored
+            document.
+        """
         collection = self._get_collection()
 
         if collection.count() == 0:
-            return DeduplicationResult()
+            return [DeduplicationResult() for _ in vectors]
 
-        query_embedding = self.embed([content])
         raw = collection.query(
-            query_embeddings=query_embedding,
+            query_embeddings=vectors,
             n_results=1,
             include=["distances"],
         )
 
-        if not raw["ids"] or not raw["ids"][0]:
-            return DeduplicationResult()
+        results: list[DeduplicationResult] = []
+        for i in range(len(vectors)):
+            ids = raw["ids"][i] if raw["ids"] and i < len(raw["ids"]) else []
+            if not ids:
+                results.append(DeduplicationResult())
+                continue
+
+            similarity = float(_similarities(raw["distances"][i][:1])[0])
+            results.append(
+                DeduplicationResult(
+                    is_duplicate=similarity >= self.content_dedup_threshold,
+                    most_similar_id=ids[0],
+                    similarity_score=similarity,
+                )
+            )
+        return results
 
-        distance = raw["distances"][0][0]
-        similarity = 1.0 - distance
-        similarity = max(0.0, min(1.0, similarity))
-        most_similar_id = raw["ids"][0][0]
+    def mean_similarity(self, content: str) -> float:
+        """Return the mean cosine similarity of content to every stored document.
 
-        is_duplicate = similarity >= self.content_dedup_threshold
+        Because stored vectors are unit-normalized, the mean similarity to
+        the whole collection equals the dot product with the mean stored
+        vector, so this costs one dot product regardless of collection
+        size. A low mean does not rule out a close individual match, so
+        this is a corpus-level redundancy signal, not a substitute for
+        ``check_duplicate``.
 
-        return DeduplicationResult(
-            is_duplicate=is_duplicate,
-            most_similar_id=most_similar_id,
-            similarity_score=similarity,
-        )
+        Args:
+            content: Text content to compare.
+
+        Returns:
+            The mean similarity, or 0.0 if the collection is empty.
+        """
+        mean = self._load_mean()
+        if mean is None:
+            return 0.0
+        query = self.embed([content])[0]
+        return float(np.dot(query.astype(np.float64), mean))
+
+    def _load_mean(self) -> np.ndarray | None:
+        """Compute the mean stored vector on first use.
+
+        Returns:
+            The mean unit vector of the collection, or None if it is empty.
+        """
+        if self._mean_normed is not None:
+            return self._mean_normed
+
+        collection = self._get_collection()
+        count: int = collection.count()
+        if count == 0:
+            return None
+
+        stored = collection.get(include=["embeddings"])["embeddings"]
+        self._mean_normed = np.asarray(stored, dtype=np.float64).mean(axis=0)
+        self._mean_count = count
+        return self._mean_normed
 
     def delete_collection(self) -> None:
         """Delete the entire ChromaDB collection."""
@@ -362,6 +563,8 @@ class ResearchEmbeddings:
         try:
             client.delete_collection(name=self.collection_name)
             self._collection = None
+            self._mean_normed = None
+            self._mean_count = 0
             logger.info("collection_deleted", name=self.collection_name)
         except Exception as exc:
             logger.warning(
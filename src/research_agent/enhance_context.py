@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import fnmatch
+import hashlib
 import json
+import os
+import re
 import tomllib
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
 
 from research_agent.enhance_models import FileSummary, ProjectContext, ProjectDependency
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 _SKIPPED_DIRS = {
     ".git",
     ".venv",
@@ -28,6 +37,9 @@ _RELEVANT_FILENAMES = {
     "requirements.txt",
 }
 
+# Files whose contents feed dependency parsing even when not selected
+_DEPENDENCY_FILES = ("package.json", "pyproject.toml", "requirements.txt")
+
 _RELEVANT_EXTENSIONS = {".py", ".ts", ".tsx", ".js", ".jsx", ".go", ".rs", ".java"}
 
 _LANGUAGE_MAP = {
@@ -69,51 +81,83 @@ def load_gitignore_patterns(project_path: Path) -> list[str]:
     return patterns
 
 
-def _is_ignored(rel_path: str, patterns: list[str]) -> bool:
-    normalized = rel_path.replace("\\", "/")
-    for pattern in patterns:
-        p = pattern.strip()
-        if p.endswith("/"):
-            if normalized.startswith(p):
-                return True
-            continue
-        if fnmatch.fnmatch(normalized, p):
-            return True
-        if fnmatch.fnmatch(Path(normalized).name, p):
+def _compile_ignore(patterns: list[str]) -> Callable[[str], bool]:
+    """Merge gitignore patterns into a single matcher for relative POSIX paths.
+
+    Patterns ending in ``/`` ignore everything under that prefix; any other
+    pattern is a glob tested against both the full path and the file name.
+    The globs are joined into one regex so each path costs two matches no
+    matter how many patterns the project declares.
+    """
+    prefixes = tuple(p for p in patterns if p.endswith("/"))
+    globs = [fnmatch.translate(p) for p in patterns if not p.endswith("/")]
+    glob_match = re.compile("|".join(globs)).match if globs else None
+
+    def is_ignored(rel_path: str) -> bool:
+        if prefixes and rel_path.startswith(prefixes):
             return True
-    return False
+        if glob_match is None:
+            return False
+        return bool(glob_match(rel_path) or glob_match(rel_path.rpartition("/")[2]))
+
+    return is_ignored
 
 
 def _iter_relevant_files(project_path: Path, ignore_patterns: list[str]) -> list[Path]:
+    is_ignored = _compile_ignore(ignore_patterns)
+    prefixes = tuple(p for p in ignore_patterns if p.endswith("/"))
     relevant: list[Path] = []
-    for path in sorted(project_path.rglob("*")):
-        if not path.is_file():
+    pending = [("", project_path)]
+    while pending:
+        rel_dir, directory = pending.pop()
+        try:
+            with os.scandir(directory) as scan:
+                entries = list(scan)
+        except OSError:
             continue
-        rel_path = path.relative_to(project_path)
-        rel_path_str = rel_path.as_posix()
+        for entry in entries:
+            rel_path = f"{rel_dir}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                # Prune whole subtrees that could only yield skipped files.
+                if entry.name in _SKIPPED_DIRS or f"{rel_path}/".startswith(prefixes):
+                    continue
+                pending.append((f"{rel_path}/", Path(entry.path)))
+                continue
+            if entry.name in _SKIPPED_DIRS or not entry.is_file():
+                continue
+            if is_ignored(rel_path):
+                continue
+            suffix = os.path.splitext(entry.name)[1]
+            if entry.name in _RELEVANT_FILENAMES or suffix in _RELEVANT_EXTENSIONS:
+                relevant.append(Path(entry.path))
+    return sorted(relevant)
 
-        if any(part in _SKIPPED_DIRS for part in rel_path.parts):
-            continue
-        if _is_ignored(rel_path_str, ignore_patterns):
-            continue
 
-        if path.name in _RELEVANT_FILENAMES or path.suffix in _RELEVANT_EXTENSIONS:
-            relevant.append(path)
-    return relevant
+def _read_tail(path: Path, max_chars: int, size_bytes: int) -> str:
+    """Decode roughly the last ``max_chars`` characters without a full read."""
+    with path.open("rb") as handle:
+        # UTF-8 needs at most four bytes per character.
+        handle.seek(max(0, size_bytes - max_chars * 4))
+        text = handle.read().decode("utf-8", errors="ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")[-max_chars:]
 
 
 def _summarize_file(path: Path, max_chars: int = 4000) -> FileSummary:
-    raw = path.read_text(encoding="utf-8", errors="ignore")
+    size_bytes = path.stat().st_size
+    with path.open(encoding="utf-8", errors="ignore") as handle:
+        # One character past the limit is enough to tell whether to truncate.
+        raw = handle.read(max_chars + 1)
     truncated = len(raw) > max_chars
     if truncated:
-        head = raw[: max_chars // 2]
-        tail = raw[-(max_chars // 2) :]
-        summary = f"[truncated from {len(raw)} chars]\n{head}\n...\n{tail}"
+        half = max_chars // 2
+        head = raw[:half]
+        tail = _read_tail(path, half, size_bytes) if half else ""
+        summary = f"[truncated from {size_bytes} bytes]\n{head}\n...\n{tail}"
     else:
         summary = raw
     return FileSummary(
         path=str(path),
-        size_bytes=path.stat().st_size,
+        size_bytes=size_bytes,
         summary=summary,
         truncated=truncated,
     )
@@ -200,16 +244,80 @@ def _detect_framework(dependencies: list[ProjectDependency]) -> str:
     return "unknown"
 
 
+def _context_signature(
+    root: Path,
+    candidate_files: list[Path],
+    max_files: int,
+    max_chars_per_file: int,
+) -> str:
+    """Fingerprint the scanned tree by path, mtime and size of every input."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{max_files}\0{max_chars_per_file}\0".encode())
+    for path in [*candidate_files, *(root / name for name in _DEPENDENCY_FILES)]:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        rel_path = path.relative_to(root).as_posix()
+        digest.update(f"{rel_path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+    return digest.hexdigest()
+
+
+def _load_cached_context(
+    cache_path: Path, root: Path, signature: str
+) -> ProjectContext | None:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    cached = payload.get(str(root)) if isinstance(payload, dict) else None
+    if not isinstance(cached, dict) or cached.get("signature") != signature:
+        return None
+    try:
+        return ProjectContext.model_validate(cached.get("context"))
+    except ValidationError:
+        return None
+
+
+def _store_cached_context(
+    cache_path: Path, root: Path, signature: str, context: ProjectContext
+) -> None:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        payload = {}
+    if not isinstance(payload, dict):
+        payload = {}
+    payload[str(root)] = {"signature": signature, "context": context.model_dump()}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(payload), encoding="utf-8")
+
+
 def build_project_context(
     project_path: Path,
     max_files: int = 25,
     max_chars_per_file: int = 4000,
+    cache_path: Path | None = None,
 ) -> ProjectContext:
-    """Scan project files and build a structured enhancement context."""
+    """Scan project files and build a structured enhancement context.
+
+    When ``cache_path`` is given, the context is memoized there keyed by the
+    project root and a fingerprint of every candidate file's path, mtime and
+    size. An unchanged tree then skips reading and summarizing files.
+    """
     root = project_path.expanduser().resolve()
     ignore_patterns = load_gitignore_patterns(root)
     candidate_files = _iter_relevant_files(root, ignore_patterns)
 
+    signature = ""
+    if cache_path is not None:
+        signature = _context_signature(
+            root, candidate_files, max_files, max_chars_per_file
+        )
+        cached = _load_cached_context(cache_path, root, signature)
+        if cached is not None:
+            return cached
+
     selected_files: list[Path] = []
     priority_names = ["README.md", "README", "pyproject.toml", "package.json"]
     for name in priority_names:
@@ -229,7 +337,7 @@ def build_project_context(
     dependencies = _parse_dependencies(root)
     languages = _detect_languages(selected_files)
 
-    return ProjectContext(
+    context = ProjectContext(
         project_path=str(root),
         project_name=root.name,
         description=_extract_description(key_files),
@@ -238,3 +346,6 @@ def build_project_context(
         dependencies=dependencies,
         key_files=key_files,
     )
+    if cache_path is not None:
+        _store_cached_context(cache_path, root, signature, context)
+    return context
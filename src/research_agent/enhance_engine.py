@@ -6,16 +6,19 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from research_agent.enhance_context import build_project_context
 from research_agent.enhance_models import (
     DeltaSummary,
     EnhancementOpportunity,
+    EnhancementRunResult,
     KnowledgeEntry,
     OpportunityCategory,
     ProjectContext,
 )
+from research_agent.enhance_store import KnowledgeStore
 
 if TYPE_CHECKING:
-    from research_agent.enhance_store import KnowledgeStore
+    from research_agent.config import Settings
 
 
 def _has_tests(context: ProjectContext) -> bool:
@@ -127,6 +130,14 @@ def identify_opportunities(
     return opportunities
 
 
+def _updated_after(entry: KnowledgeEntry, cutoff: datetime) -> bool:
+    """Whether an entry was updated after ``cutoff``; unreadable stamps are stale."""
+    try:
+        return datetime.fromisoformat(entry.updated_at) > cutoff
+    except (TypeError, ValueError):
+        return False
+
+
 def plan_incremental_research(
     project_id: str,
     opportunities: list[EnhancementOpportunity],
@@ -136,22 +147,27 @@ def plan_incremental_research(
 ) -> tuple[list[EnhancementOpportunity], DeltaSummary, list[KnowledgeEntry]]:
     """Filter opportunities by staleness and collect cross-project shared findings."""
     existing = store.get_project_entries(project_id)
-    now = datetime.now(tz=UTC)
+    # Entries updated after this instant are still fresh
+    cutoff = datetime.now(tz=UTC) - timedelta(days=stale_days)
 
     refresh_targets: list[EnhancementOpportunity] = []
     skipped_recent: list[str] = []
     shared_entries: list[KnowledgeEntry] = []
+    # Each category's cross-project scan is shared by every target in it
+    shared_by_category: dict[OpportunityCategory, list[KnowledgeEntry]] = {}
 
     for opp in opportunities:
         entry = existing.get(opp.title)
-        if entry and not force_refresh:
-            updated_at = datetime.fromisoformat(entry.updated_at)
-            if now - updated_at < timedelta(days=stale_days):
-                skipped_recent.append(opp.title)
-                continue
+        if entry and not force_refresh and _updated_after(entry, cutoff):
+            skipped_recent.append(opp.title)
+            continue
 
         refresh_targets.append(opp)
-        shared_entries.extend(store.cross_project_matches(project_id, opp.category))
+        if opp.category not in shared_by_category:
+            shared_by_category[opp.category] = store.cross_project_matches(
+                project_id, opp.category
+            )
+        shared_entries.extend(shared_by_category[opp.category])
 
     shared_topics = sorted({entry.topic for entry in shared_entries})
     delta = DeltaSummary(
@@ -279,3 +295,73 @@ def persist_findings(
         for op in opportunities
     ]
     store.upsert_entries(project_id, entries)
+
+
+def run_enhancement(
+    project_path: Path,
+    settings: Settings,
+    focus_areas: set[OpportunityCategory] | None = None,
+    stale_days: int = 14,
+    force_refresh: bool = False,
+    output: Path | None = None,
+    apply_to: Path | None = None,
+) -> EnhancementRunResult:
+    """Analyze a project, refresh stale findings and write the report.
+
+    This is the whole ``research-agent enhance`` pipeline without argument
+    parsing, so it can be called directly from Python.
+
+    Args:
+        project_path: Root of the project to analyze.
+        settings: Application settings; the knowledge store and context
+            cache live in the vector store's persist directory.
+        focus_areas: Categories to restrict opportunities to, or None for all.
+        stale_days: Findings newer than this many days are not re-researched.
+        force_refresh: Re-research every topic regardless of staleness.
+        output: Report path; defaults to ``COMPILED_RESEARCH.md`` in the project.
+        apply_to: Optional second path to write the same report to.
+
+    Returns:
+        The project context, researched opportunities, delta and report.
+    """
+    root = project_path.expanduser().resolve()
+    persist_dir = Path(settings.vector_store.persist_directory)
+    context = build_project_context(
+        root, cache_path=persist_dir / "enhancement_context.json"
+    )
+    opportunities = identify_opportunities(context, focus_areas=focus_areas or None)
+
+    store = KnowledgeStore(persist_dir / "enhancement.json")
+    refresh_targets, delta, shared_entries = plan_incremental_research(
+        project_id=context.project_name,
+        opportunities=opportunities,
+        store=store,
+        stale_days=max(stale_days, 1),
+        force_refresh=force_refresh,
+    )
+    if refresh_targets:
+        persist_findings(context.project_name, refresh_targets, store)
+
+    report_targets = refresh_targets or opportunities
+    report = generate_enhancement_report(
+        context=context,
+        opportunities=report_targets,
+        delta=delta,
+        shared_entries=shared_entries,
+    )
+
+    output_path = output or (root / "COMPILED_RESEARCH.md")
+    for path in (output_path, apply_to):
+        if path is None:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(report, encoding="utf-8")
+
+    return EnhancementRunResult(
+        context=context,
+        opportunities=report_targets,
+        delta=delta,
+        report=report,
+        output_path=str(output_path),
+        apply_to_path=str(apply_to) if apply_to is not None else None,
+    )
@@ -76,3 +76,14 @@ class DeltaSummary(BaseModel):
     new_topics: list[str] = Field(default_factory=list)
     skipped_recent_topics: list[str] = Field(default_factory=list)
     shared_topics: list[str] = Field(default_factory=list)
+
+
+class EnhancementRunResult(BaseModel):
+    """Outcome of one end-to-end enhancement run."""
+
+    context: ProjectContext
+    opportunities: list[EnhancementOpportunity] = Field(default_factory=list)
+    delta: DeltaSummary = Field(default_factory=DeltaSummary)
+    report: str
+    output_path: str
+    apply_to_path: str | None = None
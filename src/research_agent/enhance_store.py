@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, cast
 
+import orjson
+
 from research_agent.enhance_models import KnowledgeEntry, OpportunityCategory
 
 if TYPE_CHECKING:
@@ -12,20 +13,41 @@ if TYPE_CHECKING:
 
 
 class KnowledgeStore:
-    """JSON-backed enhancement knowledge store."""
+    """JSON-backed enhancement knowledge store.
+
+    The parsed file is kept in memory and re-read only when its
+    modification time or size changes, so repeated lookups during one
+    planning pass do not re-parse the whole store.
+    """
 
     def __init__(self, store_path: Path) -> None:
         self._store_path = store_path
         self._store_path.parent.mkdir(parents=True, exist_ok=True)
+        # Parsed payload and the (mtime_ns, size) of the file it was read from
+        self._cached: dict[str, dict[str, dict[str, object]]] | None = None
+        self._cached_stamp: tuple[int, int] | None = None
+
+    def _stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = self._store_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def _load(self) -> dict[str, dict[str, dict[str, object]]]:
-        if not self._store_path.exists():
+        stamp = self._stamp()
+        if stamp is None:
             return {"projects": {}}
-        payload = json.loads(self._store_path.read_text(encoding="utf-8"))
-        return cast("dict[str, dict[str, dict[str, object]]]", payload)
+        if self._cached is None or stamp != self._cached_stamp:
+            payload = orjson.loads(self._store_path.read_bytes())
+            self._cached = cast("dict[str, dict[str, dict[str, object]]]", payload)
+            self._cached_stamp = stamp
+        return self._cached
 
     def _save(self, payload: dict[str, dict[str, dict[str, object]]]) -> None:
-        self._store_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        self._store_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        self._cached = payload
+        self._cached_stamp = self._stamp()
 
     def get_project_entries(self, project_id: str) -> dict[str, KnowledgeEntry]:
         raw = self._load().get("projects", {}).get(project_id, {})
@@ -38,12 +60,14 @@ class KnowledgeStore:
         return result
 
     def upsert_entries(self, project_id: str, entries: list[KnowledgeEntry]) -> None:
+        # Copy the touched maps so a failed write leaves the cached payload intact
         payload = self._load()
-        projects = payload.setdefault("projects", {})
-        project_entries = projects.setdefault(project_id, {})
+        projects = dict(payload.get("projects", {}))
+        project_entries = dict(projects.get(project_id, {}))
         for entry in entries:
             project_entries[entry.topic] = entry.model_dump()
-        self._save(payload)
+        projects[project_id] = project_entries
+        self._save({**payload, "projects": projects})
 
     def cross_project_matches(
         self,
@@ -6,6 +6,8 @@ callers can catch the entire family with a single ``except`` clause.
 
 from __future__ import annotations
 
+from typing import ClassVar, Literal
+
 
 class ResearchAgentError(Exception):
     """Base exception for all research-agent errors."""
@@ -29,8 +31,50 @@ class CheckpointCorruptionError(CheckpointError):
 # ---------------------------------------------------------------------------
 
 
+BudgetLimitKind = Literal["projected", "cost", "calls"]
+
+
 class BudgetExhaustedError(ResearchAgentError):
-    """Raised when the research run's cost budget is fully consumed."""
+    """Raised when the research run's cost budget is fully consumed.
+
+    Budget checks raise with a structured ``kind`` plus the ``spent`` and
+    ``limit`` values; the message is only formatted from them when the
+    error is rendered. A plain message string is also accepted.
+
+    Attributes:
+        kind: Which limit was hit (``"projected"``, ``"cost"``, ``"calls"``),
+            or an empty string when constructed from a message.
+        spent: The cost or call count that reached the limit.
+        limit: The configured limit.
+    """
+
+    _TEMPLATES: ClassVar[dict[str, str]] = {
+        "projected": "Budget would be exceeded: ${spent:.4f} >= ${limit:.2f}",
+        "cost": "Budget exhausted: ${spent:.4f} >= ${limit:.2f}",
+        "calls": "LLM call limit reached: {spent} >= {limit}",
+    }
+
+    def __init__(
+        self,
+        message: str = "",
+        *,
+        kind: BudgetLimitKind | Literal[""] = "",
+        spent: float = 0,
+        limit: float = 0,
+    ) -> None:
+        super().__init__(message)
+        self.kind = kind
+        self.spent = spent
+        self.limit = limit
+
+    def __str__(self) -> str:
+        if self.kind and not self.args[0]:
+            template = self._TEMPLATES[self.kind]
+            return template.format(spent=self.spent, limit=self.limit)
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
 
 
 # ---------------------------------------------------------------------------
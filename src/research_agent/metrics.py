@@ -102,6 +102,8 @@ class MetricsCollector:
         steps: Per-step metric history.
     """
 
+    __slots__ = ("_metrics", "_start_time", "_steps")
+
     def __init__(self, budget_usd: float = 2.0) -> None:
         """Initialize the metrics collector.
 
@@ -127,6 +129,15 @@ class MetricsCollector:
         """Total elapsed time since collection started."""
         return time.monotonic() - self._start_time
 
+    def reset(self) -> None:
+        """Discard all collected metrics and restart the elapsed clock.
+
+        The configured budget is kept.
+        """
+        self._metrics = RunMetrics(budget_usd=self._metrics.budget_usd)
+        self._steps.clear()
+        self._start_time = time.monotonic()
+
     def start_step(self, step_name: str) -> StepMetric:
         """Record the start of a pipeline step.
 
@@ -170,18 +181,44 @@ class MetricsCollector:
             output_tokens: Output tokens generated.
             cost_usd: Cost of this call in USD.
         """
-        self._metrics.total_input_tokens += input_tokens
-        self._metrics.total_output_tokens += output_tokens
-        self._metrics.total_cost_usd += cost_usd
-        self._metrics.model_usage[model] = self._metrics.model_usage.get(model, 0) + 1
+        self.record_llm_calls(model, 1, input_tokens, output_tokens, cost_usd)
+
+    def record_llm_calls(
+        self,
+        model: str,
+        count: int,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cost_usd: float = 0.0,
+    ) -> None:
+        """Record ``count`` identical LLM API calls in one update.
+
+        Args:
+            model: Model identifier.
+            count: Number of calls to record.
+            input_tokens: Input tokens consumed per call.
+            output_tokens: Output tokens generated per call.
+            cost_usd: Cost of each call in USD.
+        """
+        if count <= 0:
+            return
+        input_total = input_tokens * count
+        output_total = output_tokens * count
+        cost_total = cost_usd * count
+
+        self._metrics.total_input_tokens += input_total
+        self._metrics.total_output_tokens += output_total
+        self._metrics.total_cost_usd += cost_total
+        usage = self._metrics.model_usage
+        usage[model] = usage.get(model, 0) + count
 
         # Update current step if exists
         if self._steps:
             current = self._steps[-1]
             if not current.is_complete:
-                current.input_tokens += input_tokens
-                current.output_tokens += output_tokens
-                current.cost_usd += cost_usd
+                current.input_tokens += input_total
+                current.output_tokens += output_total
+                current.cost_usd += cost_total
 
     def record_sources(self, count: int) -> None:
         """Record discovered sources.
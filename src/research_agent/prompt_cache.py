@@ -22,8 +22,8 @@ logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 _CACHE_CONTROL_EPHEMERAL = {"type": "ephemeral"}
 
 # Pricing: cached reads cost 90% less than uncached
-_CACHE_WRITE_COST_MULTIPLIER = 1.25  # 25% surcharge on first write
-_CACHE_READ_COST_MULTIPLIER = 0.10  # 90% discount on cache hits
+CACHE_WRITE_COST_MULTIPLIER = 1.25  # 25% surcharge on first write
+CACHE_READ_COST_MULTIPLIER = 0.10  # 90% discount on cache hits
 
 
 # ---------------------------------------------------------------------------
@@ -185,7 +185,7 @@ class CacheTracker:
         cost_per_token = input_cost_per_million / 1_000_000
         uncached_cost = self._cached_input_tokens * cost_per_token
         cached_cost = (
-            self._cached_input_tokens * cost_per_token * _CACHE_READ_COST_MULTIPLIER
+            self._cached_input_tokens * cost_per_token * CACHE_READ_COST_MULTIPLIER
         )
         return uncached_cost - cached_cost
 
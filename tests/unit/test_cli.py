@@ -415,6 +415,45 @@ class TestServeCommand:
         mock_run_server.assert_called_once_with(settings)
 
 
+class TestEnhanceCommand:
+    """The `enhance` command behavior."""
+
+    @patch("research_agent.cli._load_settings")
+    def test_writes_output_and_apply_to(
+        self, mock_settings: MagicMock, tmp_path: Path
+    ) -> None:
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "main.py").write_text("print('hi')", encoding="utf-8")
+        output = tmp_path / "COMPILED_RESEARCH.md"
+        apply_to = tmp_path / "docs" / "ENHANCEMENTS.md"
+        settings = MagicMock()
+        settings.vector_store.persist_directory = tmp_path / "vector"
+        mock_settings.return_value = settings
+
+        result = runner.invoke(
+            app,
+            [
+                "enhance",
+                "--project",
+                str(project),
+                "--focus",
+                "security,performance",
+                "--output",
+                str(output),
+                "--apply-to",
+                str(apply_to),
+                "--force-refresh",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert output.exists()
+        assert apply_to.read_text(encoding="utf-8") == output.read_text(
+            encoding="utf-8"
+        )
+
+
 # ---- Signal handler ----------------------------------------------------------
 
 
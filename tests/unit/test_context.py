@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+from pydantic import ValidationError
+
 from research_agent.context import (
     _FILE_POINTER_MIN_CHARS,
     _STAGE_1_THRESHOLD,
@@ -10,6 +13,7 @@ from research_agent.context import (
     CompactionResult,
     ContextManager,
     MaskingStage,
+    RoleCode,
     Turn,
 )
 
@@ -44,6 +48,52 @@ class TestTurn:
         turn = Turn(role="user", content="test")
         assert turn.masked is False
 
+    def test_role_code_matches_role(self) -> None:
+        turn = Turn(role="tool", content="test")
+        assert turn.role_code == RoleCode.TOOL
+
+    def test_serializes_role_by_name(self) -> None:
+        data = Turn(role="user", content="hi").model_dump()
+        assert data["role"] == "user"
+        assert "role_code" not in data
+        assert Turn.model_validate(data).role_code == RoleCode.USER
+
+    def test_schema_lists_role(self) -> None:
+        schema = Turn.model_json_schema()
+        assert "role_code" not in schema["properties"]
+        assert schema["properties"]["role"]["enum"] == [
+            "system",
+            "user",
+            "assistant",
+            "tool",
+        ]
+        assert "role" in schema["required"]
+
+    def test_role_assignable(self) -> None:
+        turn = Turn(role="user", content="test")
+        turn.role = "tool"
+        assert turn.role_code == RoleCode.TOOL
+
+    def test_model_copy_updates_role(self) -> None:
+        turn = Turn(role="tool", content="test")
+        copied = turn.model_copy(update={"role": "user"})
+        assert copied.role == "user"
+        assert copied.role_code == RoleCode.USER
+
+    def test_model_construct_keeps_role(self) -> None:
+        turn = Turn.model_construct(role="assistant", content="test")
+        assert turn.role == "assistant"
+        assert turn.role_code == RoleCode.ASSISTANT
+
+    def test_missing_role_reported_by_name(self) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            Turn(content="test")  # type: ignore[call-arg]
+        assert exc_info.value.errors()[0]["loc"] == ("role",)
+
+    def test_invalid_role_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            Turn(role="narrator", content="test")
+
 
 # ---------------------------------------------------------------------------
 # MaskingStage enum
@@ -241,6 +291,17 @@ class TestUtilization:
         mgr.add_turn(Turn(role="user", content="a", token_count=850))
         assert mgr.active_stage == MaskingStage.STAGE_3
 
+    def test_stage_boundaries_are_inclusive(self) -> None:
+        mgr = ContextManager(max_tokens=10_000)
+        mgr.add_turn(Turn(role="user", content="a", token_count=7499))
+        assert mgr.active_stage == MaskingStage.NONE
+        mgr.add_turn(Turn(role="user", content="b", token_count=1))
+        assert mgr.active_stage == MaskingStage.STAGE_1
+        mgr.add_turn(Turn(role="user", content="c", token_count=499))
+        assert mgr.active_stage == MaskingStage.STAGE_1
+        mgr.add_turn(Turn(role="user", content="d", token_count=1))
+        assert mgr.active_stage == MaskingStage.STAGE_2
+
     def test_thresholds_are_correct(self) -> None:
         assert _STAGE_1_THRESHOLD == 75.0
         assert _STAGE_2_THRESHOLD == 80.0
@@ -438,6 +499,31 @@ class TestThreeStageMasking:
         # "short" is < _FILE_POINTER_MIN_CHARS, so not replaced
         assert mgr.turns[0].masked is False
 
+    def test_stage_3_skipped_when_all_content_short(self) -> None:
+        mgr = ContextManager(window_size=1, max_tokens=235)
+        mgr.add_turn(Turn(role="user", content="short", token_count=100))
+        mgr.add_turn(Turn(role="user", content="next", token_count=100))
+        assert mgr._max_content_len < _FILE_POINTER_MIN_CHARS
+        result = mgr.compact()
+        assert result.stage_applied == MaskingStage.STAGE_3
+        assert result.turns_masked == 0
+
+    def test_stage_3_single_pass_masks_each_role_once(self) -> None:
+        large_content = "x" * (_FILE_POINTER_MIN_CHARS + 50)
+        mgr = ContextManager(window_size=1, max_tokens=700)
+        mgr.add_turn(Turn(role="tool", content=large_content, token_count=200, step_name="t"))
+        mgr.add_turn(Turn(role="assistant", content="s", token_count=200, step_name="a"))
+        mgr.add_turn(Turn(role="user", content=large_content, token_count=100, step_name="u"))
+        mgr.add_turn(Turn(role="user", content="tail", token_count=100))
+        # Total=600, 600/700=85.7% => stage 3
+        result = mgr.compact()
+        assert result.turns_masked == 3
+        assert result.original_tokens == 600
+        assert result.compacted_tokens == mgr.total_tokens == 130
+        assert mgr.turns[0].content == "[masked tool output from t]"
+        assert mgr.turns[1].content == "[compressed summary from a]"
+        assert mgr.turns[2].content == "[content saved to file; ref: u]"
+
     def test_stage_reports_in_result(self) -> None:
         mgr = ContextManager(window_size=1, max_tokens=250)
         mgr.add_turn(Turn(role="tool", content="d", token_count=200, step_name="s-0"))
@@ -567,6 +653,15 @@ class TestFormatForApi:
         result = mgr.format_for_api("test")
         assert result["tools"] == []
 
+    def test_system_block_fresh_per_call(self) -> None:
+        mgr = ContextManager()
+        first = mgr.format_for_api("System prompt text.")
+        first["system"][0]["cache_control"] = {"type": "ephemeral"}
+        second = mgr.format_for_api("System prompt text.")
+        assert second["system"] == [{"type": "text", "text": "System prompt text."}]
+        third = mgr.format_for_api("Another prompt.")
+        assert third["system"][0]["text"] == "Another prompt."
+
     def test_includes_conversation(self) -> None:
         mgr = ContextManager()
         mgr.add_turn(Turn(role="user", content="Hello"))
@@ -624,6 +719,17 @@ class TestWindowReport:
         }
         assert set(report.keys()) == expected_keys
 
+    def test_report_matches_properties(self) -> None:
+        mgr = ContextManager(window_size=1, max_tokens=1000)
+        mgr.add_turn(Turn(role="tool", content="d", token_count=420, step_name="s"))
+        mgr.add_turn(Turn(role="user", content="q", token_count=400))
+        mgr.compact()
+        report = mgr.window_report()
+        assert report["total_tokens"] == mgr.total_tokens
+        assert report["utilization_percent"] == round(mgr.utilization_percent, 1)
+        assert report["active_stage"] == mgr.active_stage.name
+        assert report["masked_count"] == 1
+
 
 # ---------------------------------------------------------------------------
 # Clear
@@ -650,6 +756,13 @@ class TestClear:
         assert mgr.turn_count == 1
         assert mgr.total_tokens == 30
 
+    def test_clear_resets_max_content_length(self) -> None:
+        mgr = ContextManager()
+        mgr.add_turn(Turn(role="user", content="x" * 500))
+        assert mgr._max_content_len == 500
+        mgr.clear()
+        assert mgr._max_content_len == 0
+
     def test_clear_resets_compaction_state(self) -> None:
         mgr = ContextManager(max_tokens=50)
         mgr.add_turn(Turn(role="user", content="big", token_count=100))
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import gc
+import sys
+import weakref
+from collections.abc import Callable
+from math import isclose
+from typing import Any
+
 import pytest
+from pydantic import ValidationError
 
 from research_agent.costs import (
     MODEL_PRICING,
@@ -14,6 +22,100 @@ from research_agent.costs import (
 )
 from research_agent.exceptions import BudgetExhaustedError
 
+_FULL = DegradationTier.FULL
+_REDUCED = DegradationTier.REDUCED
+_CACHED = DegradationTier.CACHED
+_PARTIAL = DegradationTier.PARTIAL
+
+# Validated once at import; tests derive per-call records from it.
+_ZERO_COST_RECORD = LLMCallRecord(model="test")
+
+
+def _call(**changes: Any) -> LLMCallRecord:
+    """Return a copy of the zero-cost test record with ``changes`` applied."""
+    return _ZERO_COST_RECORD.model_copy(update=changes)
+
+
+# Shared records for the common spends; the tracker only reads records.
+_CALL_0_001 = _call(cost_usd=0.001)
+_CALL_0_1 = _call(cost_usd=0.1)
+_CALL_0_85 = _call(cost_usd=0.85)
+
+
+# Snapshot of the pricing table shared by the pricing scans below.
+_PRICED_MODELS = tuple(MODEL_PRICING.items())
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_costs_module() -> None:
+    """Exercise the tracker and manager once before the module's tests run.
+
+    Binds the structlog logger and builds the pydantic validators up front
+    so first-use setup is not attributed to whichever test happens to run
+    first.
+    """
+    tracker = BudgetTracker()
+    tracker.record_call(_call(step_name="warmup"))
+    DegradationManager(tracker).get_model()
+
+
+@pytest.fixture(scope="session")
+def default_tracker() -> BudgetTracker:
+    """A default-configured tracker shared by tests that only read from it.
+
+    Tests that record calls must build their own tracker instead.
+    """
+    return BudgetTracker()
+
+
+TrackerFactory = Callable[..., BudgetTracker]
+ManagerFactory = Callable[..., DegradationManager]
+
+
+@pytest.fixture()
+def make_tracker() -> TrackerFactory:
+    """Factory for BudgetTracker instances with optional limit overrides."""
+
+    def _make(**kwargs: Any) -> BudgetTracker:
+        return BudgetTracker(**kwargs)
+
+    return _make
+
+
+@pytest.fixture()
+def make_mgr(make_tracker: TrackerFactory) -> ManagerFactory:
+    """Factory for a DegradationManager over a tracker with prior spend.
+
+    ``spent`` is recorded as a single call before the manager is created;
+    remaining keyword arguments are passed to ``BudgetTracker``.
+    """
+
+    def _make(spent: float = 0.0, **tracker_kwargs: Any) -> DegradationManager:
+        tracker = make_tracker(**tracker_kwargs)
+        if spent:
+            tracker.record_call(_call(cost_usd=spent))
+        return DegradationManager(tracker)
+
+    return _make
+
+
+# ---------------------------------------------------------------------------
+# TestDegradationTier
+# ---------------------------------------------------------------------------
+
+
+class TestDegradationTier:
+    """DegradationTier orders tiers from most to least capable."""
+
+    def test_ordering(self) -> None:
+        assert DegradationTier.FULL < DegradationTier.REDUCED
+        assert DegradationTier.REDUCED < DegradationTier.CACHED
+        assert DegradationTier.CACHED < DegradationTier.PARTIAL
+
+    def test_values(self) -> None:
+        assert [int(t) for t in DegradationTier] == [0, 1, 2, 3]
+
+
 # ---------------------------------------------------------------------------
 # TestLLMCallRecord
 # ---------------------------------------------------------------------------
@@ -40,14 +142,39 @@ class TestLLMCallRecord:
         assert record.cost_usd == 0.0
         assert record.step_name == ""
 
+    def test_step_name_is_interned(self) -> None:
+        name = "".join(["sum", "marize"])
+        record = LLMCallRecord(model="test", step_name=name)
+        assert record.step_name is sys.intern("summarize")
+
     def test_rejects_negative_tokens(self) -> None:
         with pytest.raises(ValueError):
             LLMCallRecord(model="test", input_tokens=-1)
 
+    @pytest.mark.parametrize(
+        "field",
+        ["input_tokens", "output_tokens", "cached_read_tokens", "cached_write_tokens"],
+    )
+    def test_negative_value_error_names_field(self, field: str) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            LLMCallRecord(model="test", **{field: -1})
+        assert exc_info.value.errors()[0]["loc"] == (field,)
+
     def test_rejects_negative_cost(self) -> None:
         with pytest.raises(ValueError):
             LLMCallRecord(model="test", cost_usd=-0.01)
 
+    def test_cache_token_defaults(self) -> None:
+        record = LLMCallRecord(model="test")
+        assert record.cached_read_tokens == 0
+        assert record.cached_write_tokens == 0
+
+    def test_rejects_negative_cache_tokens(self) -> None:
+        with pytest.raises(ValueError):
+            LLMCallRecord(model="test", cached_read_tokens=-1)
+        with pytest.raises(ValueError):
+            LLMCallRecord(model="test", cached_write_tokens=-1)
+
 
 # ---------------------------------------------------------------------------
 # TestBudgetStatus
@@ -61,7 +188,7 @@ class TestBudgetStatus:
         status = BudgetStatus(budget_remaining_usd=2.0)
         assert status.total_cost_usd == 0.0
         assert status.total_llm_calls == 0
-        assert status.current_tier == DegradationTier.FULL
+        assert status.current_tier is _FULL
 
     def test_full_status(self) -> None:
         status = BudgetStatus(
@@ -71,11 +198,16 @@ class TestBudgetStatus:
             total_output_tokens=2000,
             budget_remaining_usd=0.5,
             budget_used_percent=75.0,
-            current_tier=DegradationTier.FULL,
+            current_tier=_FULL,
         )
         assert status.budget_remaining_usd == 0.5
         assert status.budget_used_percent == 75.0
 
+    def test_tier_serialized_by_name(self) -> None:
+        status = BudgetStatus(budget_remaining_usd=0.5, current_tier=_REDUCED)
+        assert status.model_dump(mode="json")["current_tier"] == "REDUCED"
+        assert BudgetStatus.model_validate_json(status.model_dump_json()) == status
+
 
 # ---------------------------------------------------------------------------
 # TestModelPricing
@@ -94,9 +226,8 @@ class TestModelPricing:
         assert "gpt-4o-mini" in MODEL_PRICING
 
     def test_pricing_format(self) -> None:
-        for model, (input_price, output_price) in MODEL_PRICING.items():
-            assert input_price > 0, f"{model} input price should be positive"
-            assert output_price > 0, f"{model} output price should be positive"
+        non_positive = [model for model, prices in _PRICED_MODELS if min(prices) <= 0]
+        assert not non_positive, f"pricing should be positive for {non_positive}"
 
     def test_haiku_cheaper_than_sonnet(self) -> None:
         haiku_in, haiku_out = MODEL_PRICING["claude-haiku-3-5-20241022"]
@@ -104,6 +235,10 @@ class TestModelPricing:
         assert haiku_in < sonnet_in
         assert haiku_out < sonnet_out
 
+    def test_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            MODEL_PRICING["gpt-4o"] = (0.0, 0.0)  # type: ignore[index]
+
 
 # ---------------------------------------------------------------------------
 # TestBudgetTrackerInit
@@ -113,11 +248,10 @@ class TestModelPricing:
 class TestBudgetTrackerInit:
     """BudgetTracker initializes with configurable limits."""
 
-    def test_default_values(self) -> None:
-        tracker = BudgetTracker()
-        assert tracker.max_cost_usd == 2.00
-        assert tracker.max_llm_calls == 50
-        assert tracker.warn_at_percent == 80
+    def test_default_values(self, default_tracker: BudgetTracker) -> None:
+        assert default_tracker.max_cost_usd == 2.00
+        assert default_tracker.max_llm_calls == 50
+        assert default_tracker.warn_at_percent == 80
 
     def test_custom_values(self) -> None:
         tracker = BudgetTracker(max_cost_usd=5.0, max_llm_calls=100, warn_at_percent=90)
@@ -125,10 +259,9 @@ class TestBudgetTrackerInit:
         assert tracker.max_llm_calls == 100
         assert tracker.warn_at_percent == 90
 
-    def test_initial_totals(self) -> None:
-        tracker = BudgetTracker()
-        assert tracker.total_cost == 0.0
-        assert tracker.total_calls == 0
+    def test_initial_totals(self, default_tracker: BudgetTracker) -> None:
+        assert default_tracker.total_cost == 0.0
+        assert default_tracker.total_calls == 0
 
 
 # ---------------------------------------------------------------------------
@@ -139,28 +272,60 @@ class TestBudgetTrackerInit:
 class TestEstimateCost:
     """estimate_cost calculates expected cost from token counts."""
 
-    def test_known_model(self) -> None:
-        tracker = BudgetTracker()
+    def test_known_model(self, default_tracker: BudgetTracker) -> None:
         # Haiku: input $0.80/1M, output $4.00/1M
-        cost = tracker.estimate_cost("claude-haiku-3-5-20241022", 1000, 500)
+        cost = default_tracker.estimate_cost("claude-haiku-3-5-20241022", 1000, 500)
         expected = (1000 * 0.80 + 500 * 4.00) / 1_000_000
-        assert abs(cost - expected) < 1e-10
+        assert isclose(cost, expected, rel_tol=0.0, abs_tol=1e-12)
 
-    def test_unknown_model_uses_fallback(self) -> None:
-        tracker = BudgetTracker()
+    def test_unknown_model_uses_fallback(self, default_tracker: BudgetTracker) -> None:
         # Unknown model uses (5.0, 15.0) fallback
-        cost = tracker.estimate_cost("unknown-model", 1000, 500)
+        cost = default_tracker.estimate_cost("unknown-model", 1000, 500)
         expected = (1000 * 5.0 + 500 * 15.0) / 1_000_000
-        assert abs(cost - expected) < 1e-10
+        assert isclose(cost, expected, rel_tol=0.0, abs_tol=1e-12)
+
+    def test_every_priced_model_uses_table_prices(
+        self, default_tracker: BudgetTracker
+    ) -> None:
+        for model, (input_price, output_price) in _PRICED_MODELS:
+            cost = default_tracker.estimate_cost(model, 1_000_000, 1_000_000)
+            assert isclose(cost, input_price + output_price, rel_tol=0.0, abs_tol=1e-12)
+
+    def test_cache_read_discounted(self, default_tracker: BudgetTracker) -> None:
+        # Sonnet: input $3.00/1M; cache reads at 10% of input
+        cost = default_tracker.estimate_cost(
+            "claude-sonnet-4-5-20250929", 0, 0, cached_read_tokens=1_000_000
+        )
+        assert isclose(cost, 0.30, rel_tol=0.0, abs_tol=1e-12)
 
-    def test_zero_tokens(self) -> None:
-        tracker = BudgetTracker()
-        assert tracker.estimate_cost("gpt-4o", 0, 0) == 0.0
+    def test_cache_write_surcharged(self, default_tracker: BudgetTracker) -> None:
+        # Sonnet: input $3.00/1M; cache writes at 125% of input
+        cost = default_tracker.estimate_cost(
+            "claude-sonnet-4-5-20250929", 0, 0, cached_write_tokens=1_000_000
+        )
+        assert isclose(cost, 3.75, rel_tol=0.0, abs_tol=1e-12)
+
+    def test_cache_reads_cheaper_than_uncached_input(
+        self, default_tracker: BudgetTracker
+    ) -> None:
+        uncached = default_tracker.estimate_cost("gpt-4o", 10_000, 500)
+        cached = default_tracker.estimate_cost(
+            "gpt-4o", 0, 500, cached_read_tokens=10_000
+        )
+        assert cached < uncached
 
-    def test_sonnet_more_expensive_than_haiku(self) -> None:
-        tracker = BudgetTracker()
-        haiku_cost = tracker.estimate_cost("claude-haiku-3-5-20241022", 1000, 1000)
-        sonnet_cost = tracker.estimate_cost("claude-sonnet-4-5-20250929", 1000, 1000)
+    def test_zero_tokens(self, default_tracker: BudgetTracker) -> None:
+        assert default_tracker.estimate_cost("gpt-4o", 0, 0) == 0.0
+
+    def test_sonnet_more_expensive_than_haiku(
+        self, default_tracker: BudgetTracker
+    ) -> None:
+        haiku_cost = default_tracker.estimate_cost(
+            "claude-haiku-3-5-20241022", 1000, 1000
+        )
+        sonnet_cost = default_tracker.estimate_cost(
+            "claude-sonnet-4-5-20250929", 1000, 1000
+        )
         assert sonnet_cost > haiku_cost
 
 
@@ -188,20 +353,37 @@ class TestCheckBudget:
 
     def test_raises_when_calls_exhausted(self) -> None:
         tracker = BudgetTracker(max_cost_usd=100.0, max_llm_calls=2)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.001))
+        tracker.record_call(_CALL_0_001)
         # Second record_call triggers the limit (total_calls == 2 >= max_llm_calls)
-        with pytest.raises(BudgetExhaustedError, match="call limit"):
-            tracker.record_call(LLMCallRecord(model="test", cost_usd=0.001))
+        with pytest.raises(BudgetExhaustedError) as exc_info:
+            tracker.record_call(_CALL_0_001)
+        assert exc_info.value.kind == "calls"
         # check_budget should also refuse after limit is reached
-        with pytest.raises(BudgetExhaustedError, match="call limit"):
+        with pytest.raises(BudgetExhaustedError) as exc_info:
             tracker.check_budget()
+        assert exc_info.value.kind == "calls"
 
     def test_accumulates_prior_cost(self) -> None:
         tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.8))
+        tracker.record_call(_call(cost_usd=0.8))
         with pytest.raises(BudgetExhaustedError):
             tracker.check_budget(estimated_cost=0.3)
 
+    def test_accounts_for_batch_records(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0, max_llm_calls=3)
+        tracker.record_calls([_call(cost_usd=0.2)] * 2)
+        tracker.check_budget(estimated_cost=0.5)  # 0.9 projected, 1 call left
+        with pytest.raises(BudgetExhaustedError) as exc_info:
+            tracker.check_budget(estimated_cost=0.6)
+        assert exc_info.value.kind == "projected"
+
+    def test_uses_updated_limits(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0, max_llm_calls=1)
+        tracker.max_cost_usd = 10.0
+        tracker.max_llm_calls = 5
+        tracker.record_call(_CALL_0_1)
+        tracker.check_budget(estimated_cost=2.0)  # limits raised after init
+
 
 # ---------------------------------------------------------------------------
 # TestRecordCall
@@ -214,9 +396,7 @@ class TestRecordCall:
     def test_increments_totals(self) -> None:
         tracker = BudgetTracker()
         tracker.record_call(
-            LLMCallRecord(
-                model="test", input_tokens=100, output_tokens=50, cost_usd=0.01
-            )
+            _call(model="test", input_tokens=100, output_tokens=50, cost_usd=0.01)
         )
         assert tracker.total_calls == 1
         assert tracker.total_cost == 0.01
@@ -224,37 +404,83 @@ class TestRecordCall:
     def test_accumulates_multiple_calls(self) -> None:
         tracker = BudgetTracker()
         for _ in range(3):
-            tracker.record_call(LLMCallRecord(model="test", cost_usd=0.1))
+            tracker.record_call(_CALL_0_1)
         assert tracker.total_calls == 3
-        assert abs(tracker.total_cost - 0.3) < 1e-10
+        assert isclose(tracker.total_cost, 0.3, rel_tol=0.0, abs_tol=1e-12)
 
     def test_raises_when_budget_exhausted(self) -> None:
         tracker = BudgetTracker(max_cost_usd=0.05)
         with pytest.raises(BudgetExhaustedError, match="Budget exhausted"):
-            tracker.record_call(LLMCallRecord(model="test", cost_usd=0.10))
+            tracker.record_call(_CALL_0_1)
 
     def test_raises_when_call_limit_reached(self) -> None:
         tracker = BudgetTracker(max_cost_usd=100.0, max_llm_calls=1)
         with pytest.raises(BudgetExhaustedError, match="call limit"):
-            tracker.record_call(LLMCallRecord(model="test", cost_usd=0.001))
+            tracker.record_call(_CALL_0_001)
 
     def test_warns_at_threshold(self) -> None:
         tracker = BudgetTracker(max_cost_usd=1.0, warn_at_percent=80)
         # Spend 85% of budget
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.85))
+        tracker.record_call(_CALL_0_85)
         assert tracker._warned is True
 
     def test_no_warn_below_threshold(self) -> None:
         tracker = BudgetTracker(max_cost_usd=1.0, warn_at_percent=80)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.5))
+        tracker.record_call(_call(cost_usd=0.5))
         assert tracker._warned is False
 
     def test_warns_only_once(self) -> None:
         tracker = BudgetTracker(max_cost_usd=1.0, warn_at_percent=50)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.6))
+        tracker.record_call(_call(cost_usd=0.6))
         assert tracker._warned is True
         # Recording more calls should not reset warned
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.1))
+        tracker.record_call(_CALL_0_1)
+        assert tracker._warned is True
+
+
+# ---------------------------------------------------------------------------
+# TestRecordCalls
+# ---------------------------------------------------------------------------
+
+
+class TestRecordCalls:
+    """record_calls tracks a batch of calls with a single threshold check."""
+
+    @pytest.mark.parametrize("count", [0, 1, 3, 10])
+    def test_bulk_record(self, count: int) -> None:
+        tracker = BudgetTracker(max_llm_calls=100)
+        tracker.record_calls([_call(cost_usd=0.1, step_name="plan")] * count)
+        assert tracker.total_calls == count
+        assert isclose(tracker.total_cost, 0.1 * count, rel_tol=0.0, abs_tol=1e-12)
+        if count:
+            per_step = tracker.cost_per_step()
+            assert per_step.keys() == {"plan"}
+            assert isclose(per_step["plan"], 0.1 * count, rel_tol=0.0, abs_tol=1e-12)
+
+    def test_matches_individual_records(self) -> None:
+        records = [
+            _call(model="a", input_tokens=10, cost_usd=0.01, step_name="plan"),
+            _call(model="b", output_tokens=5, cost_usd=0.02, step_name="search"),
+            _call(model="c", cost_usd=0.03),
+        ]
+        single = BudgetTracker()
+        for record in records:
+            single.record_call(record)
+        bulk = BudgetTracker()
+        bulk.record_calls(records)
+        assert bulk.status() == single.status()
+        assert bulk.cost_per_step() == single.cost_per_step()
+
+    def test_raises_when_batch_exhausts_budget(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=0.25)
+        with pytest.raises(BudgetExhaustedError) as exc_info:
+            tracker.record_calls([_CALL_0_1] * 3)
+        assert exc_info.value.kind == "cost"
+        assert tracker.total_calls == 3
+
+    def test_warns_once_for_batch(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0, warn_at_percent=50)
+        tracker.record_calls([_call(cost_usd=0.3)] * 2)
         assert tracker._warned is True
 
 
@@ -268,34 +494,37 @@ class TestCostPerStep:
 
     def test_single_step(self) -> None:
         tracker = BudgetTracker()
-        tracker.record_call(
-            LLMCallRecord(model="test", cost_usd=0.01, step_name="plan")
-        )
+        tracker.record_call(_call(cost_usd=0.01, step_name="plan"))
         assert tracker.cost_per_step() == {"plan": 0.01}
 
     def test_multiple_steps(self) -> None:
         tracker = BudgetTracker()
-        tracker.record_call(
-            LLMCallRecord(model="test", cost_usd=0.01, step_name="plan")
-        )
-        tracker.record_call(
-            LLMCallRecord(model="test", cost_usd=0.02, step_name="search")
-        )
-        tracker.record_call(
-            LLMCallRecord(model="test", cost_usd=0.03, step_name="plan")
-        )
+        tracker.record_call(_call(cost_usd=0.01, step_name="plan"))
+        tracker.record_call(_call(cost_usd=0.02, step_name="search"))
+        tracker.record_call(_call(cost_usd=0.03, step_name="plan"))
         breakdown = tracker.cost_per_step()
-        assert abs(breakdown["plan"] - 0.04) < 1e-10
-        assert abs(breakdown["search"] - 0.02) < 1e-10
+        assert isclose(breakdown["plan"], 0.04, rel_tol=0.0, abs_tol=1e-12)
+        assert isclose(breakdown["search"], 0.02, rel_tol=0.0, abs_tol=1e-12)
 
     def test_empty_step_name_uses_unknown(self) -> None:
         tracker = BudgetTracker()
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.01))
+        tracker.record_call(_call(cost_usd=0.01))
         assert "unknown" in tracker.cost_per_step()
 
-    def test_empty_records(self) -> None:
+    def test_empty_records(self, default_tracker: BudgetTracker) -> None:
+        assert default_tracker.cost_per_step() == {}
+
+    def test_includes_call_that_exhausts_budget(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=0.05)
+        with pytest.raises(BudgetExhaustedError):
+            tracker.record_call(_call(cost_usd=0.10, step_name="plan"))
+        assert tracker.cost_per_step() == {"plan": 0.10}
+
+    def test_returns_independent_copy(self) -> None:
         tracker = BudgetTracker()
-        assert tracker.cost_per_step() == {}
+        tracker.record_call(_call(cost_usd=0.01, step_name="plan"))
+        tracker.cost_per_step()["plan"] = 99.0
+        assert tracker.cost_per_step() == {"plan": 0.01}
 
 
 # ---------------------------------------------------------------------------
@@ -313,14 +542,12 @@ class TestBudgetTrackerStatus:
         assert status.total_llm_calls == 0
         assert status.budget_remaining_usd == 2.0
         assert status.budget_used_percent == 0.0
-        assert status.current_tier == DegradationTier.FULL
+        assert status.current_tier is _FULL
 
     def test_after_spending(self) -> None:
         tracker = BudgetTracker(max_cost_usd=2.0)
         tracker.record_call(
-            LLMCallRecord(
-                model="test", input_tokens=500, output_tokens=200, cost_usd=0.5
-            )
+            _call(model="test", input_tokens=500, output_tokens=200, cost_usd=0.5)
         )
         status = tracker.status()
         assert status.total_cost_usd == 0.5
@@ -333,12 +560,10 @@ class TestBudgetTrackerStatus:
     def test_token_accumulation(self) -> None:
         tracker = BudgetTracker()
         tracker.record_call(
-            LLMCallRecord(model="a", input_tokens=100, output_tokens=50, cost_usd=0.001)
+            _call(model="a", input_tokens=100, output_tokens=50, cost_usd=0.001)
         )
         tracker.record_call(
-            LLMCallRecord(
-                model="b", input_tokens=200, output_tokens=100, cost_usd=0.001
-            )
+            _call(model="b", input_tokens=200, output_tokens=100, cost_usd=0.001)
         )
         status = tracker.status()
         assert status.total_input_tokens == 300
@@ -353,23 +578,65 @@ class TestBudgetTrackerStatus:
 class TestCurrentTier:
     """_current_tier maps budget percentage to degradation tier."""
 
-    def test_full_tier(self) -> None:
-        assert BudgetTracker._current_tier(0.0) == DegradationTier.FULL
-        assert BudgetTracker._current_tier(50.0) == DegradationTier.FULL
-        assert BudgetTracker._current_tier(79.9) == DegradationTier.FULL
-
-    def test_reduced_tier(self) -> None:
-        assert BudgetTracker._current_tier(80.0) == DegradationTier.REDUCED
-        assert BudgetTracker._current_tier(90.0) == DegradationTier.REDUCED
-        assert BudgetTracker._current_tier(94.9) == DegradationTier.REDUCED
-
-    def test_cached_tier(self) -> None:
-        assert BudgetTracker._current_tier(95.0) == DegradationTier.CACHED
-        assert BudgetTracker._current_tier(99.9) == DegradationTier.CACHED
+    @pytest.mark.parametrize(
+        ("used_percent", "expected"),
+        [
+            (0.0, _FULL),
+            (50.0, _FULL),
+            (79.9, _FULL),
+            (80.0, _REDUCED),
+            (90.0, _REDUCED),
+            (94.9, _REDUCED),
+            (95.0, _CACHED),
+            (99.9, _CACHED),
+            (100.0, _PARTIAL),
+            (150.0, _PARTIAL),
+        ],
+    )
+    def test_tier_boundaries(
+        self, used_percent: float, expected: DegradationTier
+    ) -> None:
+        assert BudgetTracker._current_tier(used_percent) is expected
+
+
+# ---------------------------------------------------------------------------
+# TestTierTrace
+# ---------------------------------------------------------------------------
+
+
+class TestTierTrace:
+    """tier_trace replays the tier reached after each recorded call."""
+
+    def test_empty(self) -> None:
+        assert BudgetTracker().tier_trace() == []
+
+    def test_follows_cumulative_spend(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0, max_llm_calls=100)
+        tracker.record_calls(
+            [
+                _call(cost_usd=0.5),
+                _call(cost_usd=0.3),
+                _CALL_0_1,
+                _call(cost_usd=0.06),
+            ]
+        )
+        assert tracker.tier_trace() == [
+            _FULL,
+            _REDUCED,
+            _REDUCED,
+            _CACHED,
+        ]
+
+    def test_last_entry_matches_status(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0)
+        tracker.record_call(_CALL_0_85)
+        assert tracker.tier_trace()[-1] == tracker.status().current_tier
 
-    def test_partial_tier(self) -> None:
-        assert BudgetTracker._current_tier(100.0) == DegradationTier.PARTIAL
-        assert BudgetTracker._current_tier(150.0) == DegradationTier.PARTIAL
+    def test_zero_budget_stays_full(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=0.0)
+        with pytest.raises(BudgetExhaustedError):
+            tracker.record_call(_call(cost_usd=0.0))
+        assert tracker.tier_trace() == [_FULL]
 
 
 # ---------------------------------------------------------------------------
@@ -396,10 +663,9 @@ class TestBudgetExhaustedError:
 class TestDegradationManagerInit:
     """DegradationManager initializes with a budget tracker."""
 
-    def test_initial_tier_is_full(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
-        assert mgr.tier == DegradationTier.FULL
+    def test_initial_tier_is_full(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
+        assert mgr.tier is _FULL
 
     def test_has_tracker(self) -> None:
         tracker = BudgetTracker()
@@ -415,22 +681,19 @@ class TestDegradationManagerInit:
 class TestDegradationTierFromBudget:
     """Tier is computed from budget percentage when not forced."""
 
-    def test_full_tier(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        mgr = DegradationManager(tracker)
-        assert mgr.tier == DegradationTier.FULL
-
-    def test_reduced_tier_at_80_percent(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.80))
-        mgr = DegradationManager(tracker)
-        assert mgr.tier == DegradationTier.REDUCED
-
-    def test_cached_tier_at_95_percent(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.95))
-        mgr = DegradationManager(tracker)
-        assert mgr.tier == DegradationTier.CACHED
+    @pytest.mark.parametrize(
+        ("spent", "expected"),
+        [
+            (0.0, _FULL),
+            (0.80, _REDUCED),
+            (0.95, _CACHED),
+        ],
+    )
+    def test_tier_from_spend(
+        self, make_mgr: ManagerFactory, spent: float, expected: DegradationTier
+    ) -> None:
+        mgr = make_mgr(spent=spent, max_cost_usd=1.0)
+        assert mgr.tier is expected
 
 
 # ---------------------------------------------------------------------------
@@ -441,29 +704,36 @@ class TestDegradationTierFromBudget:
 class TestDegradationModelChains:
     """Model chains differ by tier."""
 
-    def test_full_tier_uses_sonnet(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
+    def test_full_tier_uses_sonnet(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
         assert "sonnet" in mgr.get_model()
 
-    def test_reduced_tier_uses_haiku(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.85))
-        mgr = DegradationManager(tracker)
+    def test_reduced_tier_uses_haiku(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(spent=0.85, max_cost_usd=1.0)
         assert "haiku" in mgr.get_model()
 
-    def test_fallback_chain_returns_list(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
+    def test_fallback_chain_returns_list(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
         chain = mgr.get_fallback_chain()
         assert isinstance(chain, list)
         assert len(chain) >= 1
 
-    def test_full_chain_has_two_models(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
+    def test_full_chain_has_two_models(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
         assert len(mgr.get_fallback_chain()) == 2
 
+    def test_model_chains_match_policies(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
+        for tier, chain in DegradationManager.MODEL_CHAINS.items():
+            mgr.force_degrade(tier)
+            assert mgr.get_fallback_chain() == chain
+            assert mgr.policy.model_chain[0] == mgr.get_model()
+
+    def test_fallback_chain_is_a_copy(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
+        mgr.get_fallback_chain().append("other")
+        assert "other" not in mgr.get_fallback_chain()
+
 
 # ---------------------------------------------------------------------------
 # TestFeatureFlags
@@ -473,30 +743,24 @@ class TestDegradationModelChains:
 class TestFeatureFlags:
     """Feature flags control which operations are allowed per tier."""
 
-    def test_full_tier_allows_search(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
+    def test_full_tier_allows_search(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
         assert mgr.should_skip_search() is False
         assert mgr.should_skip_scraping() is False
 
-    def test_reduced_tier_allows_search(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.85))
-        mgr = DegradationManager(tracker)
+    def test_reduced_tier_allows_search(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(spent=0.85, max_cost_usd=1.0)
         assert mgr.should_skip_search() is False
         assert mgr.should_skip_scraping() is False
 
-    def test_cached_tier_skips_search(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.96))
-        mgr = DegradationManager(tracker)
+    def test_cached_tier_skips_search(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(spent=0.96, max_cost_usd=1.0)
         assert mgr.should_skip_search() is True
         assert mgr.should_skip_scraping() is False
 
-    def test_partial_tier_skips_all(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        mgr = DegradationManager(tracker)
-        mgr.force_degrade(DegradationTier.PARTIAL)
+    def test_partial_tier_skips_all(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(max_cost_usd=1.0)
+        mgr.force_degrade(_PARTIAL)
         assert mgr.should_skip_search() is True
         assert mgr.should_skip_scraping() is True
 
@@ -509,27 +773,21 @@ class TestFeatureFlags:
 class TestMaxSearchResults:
     """max_search_results varies by tier."""
 
-    def test_full_tier_returns_10(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
+    def test_full_tier_returns_10(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
         assert mgr.max_search_results() == 10
 
-    def test_reduced_tier_returns_5(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.85))
-        mgr = DegradationManager(tracker)
+    def test_reduced_tier_returns_5(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(spent=0.85, max_cost_usd=1.0)
         assert mgr.max_search_results() == 5
 
-    def test_cached_tier_returns_3(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.96))
-        mgr = DegradationManager(tracker)
+    def test_cached_tier_returns_3(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(spent=0.96, max_cost_usd=1.0)
         assert mgr.max_search_results() == 3
 
-    def test_partial_tier_returns_0(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
-        mgr.force_degrade(DegradationTier.PARTIAL)
+    def test_partial_tier_returns_0(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
+        mgr.force_degrade(_PARTIAL)
         assert mgr.max_search_results() == 0
 
 
@@ -541,32 +799,28 @@ class TestMaxSearchResults:
 class TestForceDegrade:
     """force_degrade overrides the computed tier."""
 
-    def test_force_specific_tier(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
-        mgr.force_degrade(DegradationTier.CACHED)
-        assert mgr.tier == DegradationTier.CACHED
+    def test_force_specific_tier(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
+        mgr.force_degrade(_CACHED)
+        assert mgr.tier is _CACHED
 
-    def test_force_one_step_down(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
-        assert mgr.tier == DegradationTier.FULL
+    def test_force_one_step_down(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
+        assert mgr.tier is _FULL
         mgr.force_degrade()
-        assert mgr.tier == DegradationTier.REDUCED
+        assert mgr.tier is _REDUCED
 
-    def test_force_multiple_steps(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
+    def test_force_multiple_steps(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
         mgr.force_degrade()  # FULL -> REDUCED
         mgr.force_degrade()  # REDUCED -> CACHED
-        assert mgr.tier == DegradationTier.CACHED
+        assert mgr.tier is _CACHED
 
-    def test_force_at_lowest_stays(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
-        mgr.force_degrade(DegradationTier.PARTIAL)
+    def test_force_at_lowest_stays(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
+        mgr.force_degrade(_PARTIAL)
         mgr.force_degrade()  # Already at PARTIAL, stays
-        assert mgr.tier == DegradationTier.PARTIAL
+        assert mgr.tier is _PARTIAL
 
 
 # ---------------------------------------------------------------------------
@@ -577,42 +831,36 @@ class TestForceDegrade:
 class TestTryRecover:
     """try_recover upgrades tier when budget pressure eases."""
 
-    def test_recovers_when_below_threshold(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=10.0)
-        mgr = DegradationManager(tracker)
-        mgr.force_degrade(DegradationTier.REDUCED)
+    def test_recovers_when_below_threshold(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(max_cost_usd=10.0)
+        mgr.force_degrade(_REDUCED)
         # Budget at 0%, well below 75% threshold
         assert mgr.try_recover() is True
-        assert mgr.tier == DegradationTier.FULL
+        assert mgr.tier is _FULL
 
-    def test_no_recovery_above_threshold(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.80))
-        mgr = DegradationManager(tracker)
-        mgr.force_degrade(DegradationTier.CACHED)
+    def test_no_recovery_above_threshold(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(spent=0.80, max_cost_usd=1.0)
+        mgr.force_degrade(_CACHED)
         # Budget at 80%, above 75% threshold
         assert mgr.try_recover() is False
-        assert mgr.tier == DegradationTier.CACHED
+        assert mgr.tier is _CACHED
 
-    def test_no_recovery_when_not_forced(self) -> None:
-        tracker = BudgetTracker()
-        mgr = DegradationManager(tracker)
+    def test_no_recovery_when_not_forced(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr()
         # No forced tier, recovery is automatic via budget
         assert mgr.try_recover() is False
 
-    def test_recovers_one_step_at_a_time(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=10.0)
-        mgr = DegradationManager(tracker)
-        mgr.force_degrade(DegradationTier.CACHED)
+    def test_recovers_one_step_at_a_time(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(max_cost_usd=10.0)
+        mgr.force_degrade(_CACHED)
         mgr.try_recover()  # CACHED -> REDUCED
-        assert mgr.tier == DegradationTier.REDUCED
+        assert mgr.tier is _REDUCED
         mgr.try_recover()  # REDUCED -> FULL
-        assert mgr.tier == DegradationTier.FULL
+        assert mgr.tier is _FULL
 
-    def test_recover_from_full_clears_forced(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=10.0)
-        mgr = DegradationManager(tracker)
-        mgr.force_degrade(DegradationTier.REDUCED)
+    def test_recover_from_full_clears_forced(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(max_cost_usd=10.0)
+        mgr.force_degrade(_REDUCED)
         mgr.try_recover()
         # After recovering to FULL, forced tier should be cleared
         assert mgr._forced_tier is None
@@ -626,14 +874,52 @@ class TestTryRecover:
 class TestTierTransitionLogging:
     """Tier changes are logged via structlog."""
 
-    def test_transition_detected(self) -> None:
-        tracker = BudgetTracker(max_cost_usd=1.0)
-        mgr = DegradationManager(tracker)
+    def test_transition_detected(self, make_mgr: ManagerFactory) -> None:
+        mgr = make_mgr(max_cost_usd=1.0)
         # Start at FULL
-        assert mgr.tier == DegradationTier.FULL
+        assert mgr.tier is _FULL
         # Spend to reach REDUCED
-        tracker.record_call(LLMCallRecord(model="test", cost_usd=0.85))
+        mgr.tracker.record_call(_CALL_0_85)
         # Accessing tier should detect the transition
-        assert mgr.tier == DegradationTier.REDUCED
+        assert mgr.tier is _REDUCED
         # Internal last_tier should be updated
-        assert mgr._last_tier == DegradationTier.REDUCED
+        assert mgr._last_tier is _REDUCED
+
+    def test_budget_tier_cached_between_records(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0)
+        mgr = DegradationManager(tracker)
+        tracker.record_call(_call(cost_usd=0.96))
+        assert mgr._budget_tier is _CACHED
+        assert mgr.tier is _CACHED
+
+    def test_budget_tier_updated_when_budget_exhausted(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0)
+        mgr = DegradationManager(tracker)
+        with pytest.raises(BudgetExhaustedError):
+            tracker.record_call(_call(cost_usd=1.5))
+        assert mgr.tier is _PARTIAL
+
+    def test_budget_tier_follows_limit_change(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0)
+        mgr = DegradationManager(tracker)
+        tracker.record_call(_CALL_0_85)
+        assert mgr.tier is _REDUCED
+        tracker.max_cost_usd = 10.0
+        assert mgr.tier is _FULL
+
+    def test_tracker_does_not_keep_manager_alive(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0)
+        mgr_ref = weakref.ref(DegradationManager(tracker))
+        gc.collect()
+        assert mgr_ref() is None
+        tracker.record_call(_CALL_0_1)
+        assert tracker._observers == []
+
+    def test_plain_function_observer_kept(self) -> None:
+        tracker = BudgetTracker(max_cost_usd=1.0)
+        seen: list[float] = []
+        tracker.add_observer(seen.append)
+        tracker.add_observer(lambda pct: seen.append(-pct))
+        gc.collect()
+        tracker.record_call(_CALL_0_1)
+        assert seen == [10.0, -10.0]
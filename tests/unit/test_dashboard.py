@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from io import StringIO
 
+import pytest
 from rich.console import Console
+from rich.layout import Layout
 
 from research_agent.dashboard import (
     _build_header,
@@ -21,12 +25,47 @@ from research_agent.metrics import MetricsCollector
 # ---------------------------------------------------------------------------
 
 
+_BUF = StringIO()
+
+
+@functools.cache
+def _console() -> Console:
+    """Colourless console shared by every render, built on first use.
+
+    Deferring construction keeps collection cheap when the dashboard tests
+    are deselected.
+    """
+    return Console(
+        file=_BUF,
+        force_terminal=True,
+        width=120,
+        color_system=None,
+        highlight=False,
+        emoji=False,
+    )
+
+
 def _render_to_str(renderable: object) -> str:
     """Render a Rich object to a plain string for assertion checks."""
-    buf = StringIO()
-    console = Console(file=buf, force_terminal=True, width=120)
-    console.print(renderable)
-    return buf.getvalue()
+    _BUF.seek(0)
+    _BUF.truncate()
+    _console().print(renderable)
+    return _BUF.getvalue()
+
+
+def _needle_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile an alternation matching any of ``needles`` literally."""
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+_POOLED_COLLECTOR = MetricsCollector()
+
+
+@pytest.fixture()
+def collector() -> MetricsCollector:
+    """A default-budget collector, reset and reused across tests."""
+    _POOLED_COLLECTOR.reset()
+    return _POOLED_COLLECTOR
 
 
 # ---------------------------------------------------------------------------
@@ -34,27 +73,29 @@ def _render_to_str(renderable: object) -> str:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=64)
+def _render_header(query: str, current_step: str) -> str:
+    """Rendered header text; ``_build_header`` depends only on its arguments."""
+    return _render_to_str(_build_header(query, current_step))
+
+
 class TestBuildHeader:
     """Header panel rendering."""
 
     def test_contains_research_agent(self) -> None:
-        panel = _build_header("test query", "plan")
-        text = _render_to_str(panel)
+        text = _render_header("latest advances in RAG", "search")
         assert "Research Agent" in text
 
     def test_contains_step_name(self) -> None:
-        panel = _build_header("my query", "search")
-        text = _render_to_str(panel)
-        assert "search" in text
+        text = _render_header("latest advances in RAG", "search")
+        assert "Step: search" in text
 
     def test_contains_query_text(self) -> None:
-        panel = _build_header("latest advances in RAG", "plan")
-        text = _render_to_str(panel)
+        text = _render_header("latest advances in RAG", "search")
         assert "latest advances in RAG" in text
 
     def test_empty_query(self) -> None:
-        panel = _build_header("", "idle")
-        text = _render_to_str(panel)
+        text = _render_header("", "idle")
         assert "Dashboard" in text
 
 
@@ -63,53 +104,53 @@ class TestBuildHeader:
 # ---------------------------------------------------------------------------
 
 
+_METRICS_NEEDLES = (
+    "Elapsed",
+    "Tokens",
+    "150",
+    "Cost",
+    "$0.5000 / $1.00",
+    "50.0%",
+    "Sources",
+    "Findings",
+    "Errors",
+)
+_METRICS_PATTERN = _needle_pattern(_METRICS_NEEDLES)
+
+
+@pytest.fixture(scope="module")
+def rendered_metrics() -> str:
+    """Metrics table for a collector with every metric populated."""
+    collector = MetricsCollector(budget_usd=1.0)
+    collector.record_llm_call("m", input_tokens=100, output_tokens=50, cost_usd=0.5)
+    collector.record_sources(5)
+    collector.record_findings(3)
+    collector.record_error()
+    return _render_to_str(_build_metrics_table(collector))
+
+
+@pytest.fixture(scope="module")
+def metrics_found(rendered_metrics: str) -> set[str]:
+    """Needles present in the rendered metrics table, found in one scan."""
+    return set(_METRICS_PATTERN.findall(rendered_metrics))
+
+
 class TestBuildMetricsTable:
     """Metrics table rendering."""
 
-    def test_contains_elapsed(self) -> None:
-        collector = MetricsCollector()
-        table = _build_metrics_table(collector)
-        text = _render_to_str(table)
-        assert "Elapsed" in text
-
-    def test_contains_tokens(self) -> None:
-        collector = MetricsCollector()
-        collector.record_llm_call("m", input_tokens=100, output_tokens=50)
-        table = _build_metrics_table(collector)
-        text = _render_to_str(table)
-        assert "Tokens" in text
-        assert "150" in text
-
-    def test_contains_cost(self) -> None:
-        collector = MetricsCollector()
-        collector.record_llm_call("m", cost_usd=0.0123)
-        table = _build_metrics_table(collector)
-        text = _render_to_str(table)
-        assert "Cost" in text
-        assert "0.0123" in text
-
-    def test_contains_budget_used(self) -> None:
-        collector = MetricsCollector(budget_usd=1.0)
-        collector.record_llm_call("m", cost_usd=0.5)
-        table = _build_metrics_table(collector)
-        text = _render_to_str(table)
-        assert "50.0%" in text
-
-    def test_contains_sources_and_findings(self) -> None:
-        collector = MetricsCollector()
-        collector.record_sources(5)
-        collector.record_findings(3)
-        table = _build_metrics_table(collector)
-        text = _render_to_str(table)
-        assert "5" in text
-        assert "3" in text
+    @pytest.mark.parametrize("needle", _METRICS_NEEDLES)
+    def test_contains(self, metrics_found: set[str], needle: str) -> None:
+        assert needle in metrics_found
 
-    def test_contains_errors(self) -> None:
-        collector = MetricsCollector()
-        collector.record_error()
-        table = _build_metrics_table(collector)
-        text = _render_to_str(table)
-        assert "Errors" in text
+    def test_counts_shown_per_row(self, rendered_metrics: str) -> None:
+        rows = {
+            line.split()[0]: line.split()[-1]
+            for line in rendered_metrics.splitlines()
+            if line.strip()
+        }
+        assert rows["Sources"] == "5"
+        assert rows["Findings"] == "3"
+        assert rows["Errors"] == "1"
 
 
 # ---------------------------------------------------------------------------
@@ -120,14 +161,12 @@ class TestBuildMetricsTable:
 class TestBuildSubtopicProgress:
     """Subtopic progress panel rendering."""
 
-    def test_renders_with_no_subtopics(self) -> None:
-        collector = MetricsCollector()
+    def test_renders_with_no_subtopics(self, collector: MetricsCollector) -> None:
         panel = _build_subtopic_progress(collector)
         text = _render_to_str(panel)
         assert "Progress" in text
 
-    def test_renders_with_partial_progress(self) -> None:
-        collector = MetricsCollector()
+    def test_renders_with_partial_progress(self, collector: MetricsCollector) -> None:
         collector.set_subtopics(4)
         collector.complete_subtopic()
         collector.complete_subtopic()
@@ -135,8 +174,7 @@ class TestBuildSubtopicProgress:
         text = _render_to_str(panel)
         assert "Subtopics" in text
 
-    def test_renders_with_full_progress(self) -> None:
-        collector = MetricsCollector()
+    def test_renders_with_full_progress(self, collector: MetricsCollector) -> None:
         collector.set_subtopics(2)
         collector.complete_subtopic()
         collector.complete_subtopic()
@@ -153,21 +191,18 @@ class TestBuildSubtopicProgress:
 class TestBuildModelUsage:
     """Model usage panel rendering."""
 
-    def test_no_calls_shows_placeholder(self) -> None:
-        collector = MetricsCollector()
+    def test_no_calls_shows_placeholder(self, collector: MetricsCollector) -> None:
         panel = _build_model_usage(collector)
         text = _render_to_str(panel)
         assert "no calls yet" in text
 
-    def test_single_model_shown(self) -> None:
-        collector = MetricsCollector()
+    def test_single_model_shown(self, collector: MetricsCollector) -> None:
         collector.record_llm_call("claude-sonnet")
         panel = _build_model_usage(collector)
         text = _render_to_str(panel)
         assert "claude-sonnet" in text
 
-    def test_multiple_models_shown(self) -> None:
-        collector = MetricsCollector()
+    def test_multiple_models_shown(self, collector: MetricsCollector) -> None:
         collector.record_llm_call("claude-sonnet")
         collector.record_llm_call("claude-haiku")
         collector.record_llm_call("claude-sonnet")
@@ -176,10 +211,8 @@ class TestBuildModelUsage:
         assert "claude-sonnet" in text
         assert "claude-haiku" in text
 
-    def test_shows_call_count(self) -> None:
-        collector = MetricsCollector()
-        for _ in range(5):
-            collector.record_llm_call("gpt-4o")
+    def test_shows_call_count(self, collector: MetricsCollector) -> None:
+        collector.record_llm_calls("gpt-4o", 5)
         panel = _build_model_usage(collector)
         text = _render_to_str(panel)
         assert "5" in text
@@ -193,22 +226,19 @@ class TestBuildModelUsage:
 class TestBuildStepsTable:
     """Pipeline steps panel rendering."""
 
-    def test_no_steps_shows_waiting(self) -> None:
-        collector = MetricsCollector()
+    def test_no_steps_shows_waiting(self, collector: MetricsCollector) -> None:
         panel = _build_steps_table(collector)
         text = _render_to_str(panel)
         assert "waiting" in text
 
-    def test_running_step_shows_running(self) -> None:
-        collector = MetricsCollector()
+    def test_running_step_shows_running(self, collector: MetricsCollector) -> None:
         collector.start_step("search")
         panel = _build_steps_table(collector)
         text = _render_to_str(panel)
         assert "search" in text
         assert "Running" in text
 
-    def test_completed_step_shows_done(self) -> None:
-        collector = MetricsCollector()
+    def test_completed_step_shows_done(self, collector: MetricsCollector) -> None:
         step = collector.start_step("plan")
         collector.finish_step(step)
         panel = _build_steps_table(collector)
@@ -216,8 +246,7 @@ class TestBuildStepsTable:
         assert "plan" in text
         assert "Done" in text
 
-    def test_multiple_steps_listed(self) -> None:
-        collector = MetricsCollector()
+    def test_multiple_steps_listed(self, collector: MetricsCollector) -> None:
         for name in ["plan", "search", "scrape"]:
             s = collector.start_step(name)
             collector.finish_step(s)
@@ -227,8 +256,7 @@ class TestBuildStepsTable:
         assert "search" in text
         assert "scrape" in text
 
-    def test_step_tokens_displayed(self) -> None:
-        collector = MetricsCollector()
+    def test_step_tokens_displayed(self, collector: MetricsCollector) -> None:
         step = collector.start_step("plan")
         collector.record_llm_call("m", input_tokens=500, output_tokens=200)
         collector.finish_step(step)
@@ -242,32 +270,42 @@ class TestBuildStepsTable:
 # ---------------------------------------------------------------------------
 
 
+_PANEL_TITLES = ("Dashboard", "Metrics", "Pipeline Steps", "Progress", "Model Usage")
+_PANEL_TITLE_PATTERN = _needle_pattern(_PANEL_TITLES)
+
+
+@pytest.fixture(scope="module")
+def idle_layout() -> Layout:
+    """Dashboard for an idle collector, shared by structure-only tests.
+
+    ``build_dashboard`` renders the collector's state into the panels when
+    it is called, so tests that change the collector build their own.
+    """
+    return build_dashboard(MetricsCollector(), query="test")
+
+
 class TestBuildDashboard:
     """Full dashboard layout construction."""
 
-    def test_returns_layout(self) -> None:
-        collector = MetricsCollector()
-        layout = build_dashboard(collector, query="test")
-        assert layout is not None
+    def test_returns_layout(self, idle_layout: Layout) -> None:
+        assert isinstance(idle_layout, Layout)
 
-    def test_layout_has_named_regions(self) -> None:
-        collector = MetricsCollector()
-        layout = build_dashboard(collector, query="test")
+    def test_layout_has_named_regions(self, idle_layout: Layout) -> None:
+        layout = idle_layout
         # Layout should have header, body, footer regions
         assert layout["header"] is not None
         assert layout["body"] is not None
         assert layout["footer"] is not None
 
-    def test_layout_renders_without_error(self) -> None:
-        collector = MetricsCollector()
+    def test_layout_renders_without_error(self, collector: MetricsCollector) -> None:
         collector.start_step("plan")
         collector.record_llm_call("m", input_tokens=100, cost_usd=0.01)
         layout = build_dashboard(collector, query="test query")
         text = _render_to_str(layout)
-        assert len(text) > 0
+        found = set(_PANEL_TITLE_PATTERN.findall(text))
+        assert found == set(_PANEL_TITLES)
 
-    def test_empty_query_renders(self) -> None:
-        collector = MetricsCollector()
+    def test_empty_query_renders(self, collector: MetricsCollector) -> None:
         layout = build_dashboard(collector)
         text = _render_to_str(layout)
         assert "Dashboard" in text
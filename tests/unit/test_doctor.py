@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import TYPE_CHECKING
 
+import httpx
 import respx
 from httpx import Response
 from typer.testing import CliRunner
@@ -26,6 +30,20 @@ if TYPE_CHECKING:
 
 runner = CliRunner()
 
+# respx clones a route's return_value per request, so these can be shared
+_OK_ANTHROPIC = Response(200, json={"id": "msg"})
+_OK_OPENAI = Response(200, json={"data": []})
+_OK_TAVILY = Response(200, json={"results": []})
+
+
+def _mock_ok_probes() -> None:
+    """Route every provider probe to its shared 200 response."""
+    respx.post("https://api.anthropic.com/v1/messages").mock(
+        return_value=_OK_ANTHROPIC
+    )
+    respx.get("https://api.openai.com/v1/models").mock(return_value=_OK_OPENAI)
+    respx.post("https://api.tavily.com/search").mock(return_value=_OK_TAVILY)
+
 
 class TestCheckConfigSchema:
     """Config schema diagnostics."""
@@ -62,20 +80,76 @@ class TestApiChecks:
         monkeypatch.setenv("OPENAI_API_KEY", "open")
         monkeypatch.setenv("TAVILY_API_KEY", "tvly")
 
-        respx.post("https://api.anthropic.com/v1/messages").mock(
-            return_value=Response(200, json={"id": "msg"})
-        )
-        respx.get("https://api.openai.com/v1/models").mock(
-            return_value=Response(200, json={"data": []})
-        )
-        respx.post("https://api.tavily.com/search").mock(
-            return_value=Response(200, json={"results": []})
-        )
+        _mock_ok_probes()
 
         checks = _check_api_keys(timeout=0.5)
         assert len(checks) == 3
         assert all(check.status == CheckStatus.OK for check in checks)
 
+    @respx.mock
+    def test_api_probes_share_single_client(self, monkeypatch: object) -> None:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "ant")
+        monkeypatch.setenv("OPENAI_API_KEY", "open")
+        monkeypatch.setenv("TAVILY_API_KEY", "tvly")
+
+        _mock_ok_probes()
+
+        created: list[httpx.AsyncClient] = []
+
+        class CountingClient(httpx.AsyncClient):
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                created.append(self)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(httpx, "AsyncClient", CountingClient)
+
+        checks = _check_api_keys(timeout=0.5)
+        assert all(check.status == CheckStatus.OK for check in checks)
+        assert len(created) == 1
+
+    @respx.mock
+    def test_api_probes_run_concurrently(self, monkeypatch: object) -> None:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "ant")
+        monkeypatch.setenv("OPENAI_API_KEY", "open")
+        monkeypatch.setenv("TAVILY_API_KEY", "tvly")
+        timeout = 0.5
+
+        async def slow_ok(_request: httpx.Request) -> Response:
+            await asyncio.sleep(timeout * 0.8)
+            return Response(200, json={})
+
+        respx.post("https://api.anthropic.com/v1/messages").mock(side_effect=slow_ok)
+        respx.get("https://api.openai.com/v1/models").mock(side_effect=slow_ok)
+        respx.post("https://api.tavily.com/search").mock(side_effect=slow_ok)
+
+        started = time.monotonic()
+        checks = _check_api_keys(timeout=timeout)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 2 * timeout
+        assert [check.name for check in checks] == [
+            "anthropic-api-key",
+            "openai-api-key",
+            "tavily-api-key",
+        ]
+        assert all(check.status == CheckStatus.OK for check in checks)
+
+    @respx.mock
+    def test_slow_probe_times_out(self, monkeypatch: object) -> None:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "ant")
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+
+        async def hang(_request: httpx.Request) -> Response:
+            await asyncio.sleep(5)
+            return Response(200, json={})
+
+        respx.post("https://api.anthropic.com/v1/messages").mock(side_effect=hang)
+
+        checks = _check_api_keys(timeout=0.1)
+        assert checks[0].status == CheckStatus.FAIL
+        assert checks[0].message == "API probe timed out."
+
     def test_api_key_missing_is_fail(self, monkeypatch: object) -> None:
         monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
         monkeypatch.delenv("OPENAI_API_KEY", raising=False)
@@ -98,6 +172,127 @@ class TestRunDoctor:
         assert "api-probes" in names
         assert "optional-dependencies" in names
 
+    def test_default_behavior_runs_all_checks_unchanged(
+        self, tmp_path: Path, monkeypatch: object
+    ) -> None:
+        settings = Settings()
+        settings.vector_store.persist_directory = tmp_path / "db"
+        monkeypatch.setattr(
+            "research_agent.doctor._check_config_schema",
+            lambda _path: CheckResult(
+                name="config-schema", status=CheckStatus.FAIL, message="bad"
+            ),
+        )
+        report = run_doctor(settings, check_api_probes=False)
+        assert [check.name for check in report.checks] == [
+            "config-schema",
+            "chromadb-directory",
+            "api-probes",
+            "optional-dependencies",
+        ]
+        assert all(check.status != CheckStatus.SKIPPED for check in report.checks)
+
+    def test_run_doctor_timeout_on_slow_check(
+        self, tmp_path: Path, monkeypatch: object
+    ) -> None:
+        settings = Settings()
+        settings.vector_store.persist_directory = tmp_path / "db"
+
+        def slow_check(path: Path) -> CheckResult:
+            time.sleep(2)
+            return CheckResult(
+                name="chromadb-directory", status=CheckStatus.OK, message="ok"
+            )
+
+        monkeypatch.setattr(
+            "research_agent.doctor._check_chromadb_directory", slow_check
+        )
+
+        started = time.monotonic()
+        report = run_doctor(settings, check_api_probes=False, per_check_timeout=0.2)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 1.0
+        statuses = {check.name: check.status for check in report.checks}
+        assert statuses["chromadb-directory"] == CheckStatus.WARN
+        assert statuses["config-schema"] == CheckStatus.OK
+        hung = [t for t in threading.enumerate() if t.name.startswith("doctor-")]
+        assert hung
+        assert all(thread.daemon for thread in hung)
+
+    def test_run_doctor_timeout_reports_each_probe(
+        self, tmp_path: Path, monkeypatch: object
+    ) -> None:
+        settings = Settings()
+        settings.vector_store.persist_directory = tmp_path / "db"
+
+        def slow_probes() -> list[CheckResult]:
+            time.sleep(2)
+            return []
+
+        monkeypatch.setattr("research_agent.doctor._check_api_keys", slow_probes)
+
+        report = run_doctor(settings, check_api_probes=True, per_check_timeout=0.2)
+
+        statuses = {check.name: check.status for check in report.checks}
+        assert "api-probes" not in statuses
+        for name in ("anthropic-api-key", "openai-api-key", "tavily-api-key"):
+            assert statuses[name] == CheckStatus.WARN
+        assert report.exit_code == 0
+
+    def test_fast_fail_skips_network_probes_on_config_error(
+        self, tmp_path: Path, monkeypatch: object
+    ) -> None:
+        settings = Settings()
+        settings.vector_store.persist_directory = tmp_path / "db"
+        monkeypatch.setattr(
+            "research_agent.doctor._check_config_schema",
+            lambda _path: CheckResult(
+                name="config-schema", status=CheckStatus.FAIL, message="bad"
+            ),
+        )
+
+        def fail_if_probed(timeout: float = 5.0) -> list[CheckResult]:
+            raise AssertionError("network probes should not run")
+
+        monkeypatch.setattr("research_agent.doctor._check_api_keys", fail_if_probed)
+
+        report = run_doctor(settings, fast_fail=True)
+        assert [(check.name, check.status) for check in report.checks] == [
+            ("config-schema", CheckStatus.FAIL),
+            ("chromadb-directory", CheckStatus.SKIPPED),
+            ("anthropic-api-key", CheckStatus.SKIPPED),
+            ("openai-api-key", CheckStatus.SKIPPED),
+            ("tavily-api-key", CheckStatus.SKIPPED),
+            ("optional-dependencies", CheckStatus.SKIPPED),
+        ]
+        assert report.exit_code == 1
+
+    def test_fast_fail_runs_cheapest_checks_first(
+        self, tmp_path: Path, monkeypatch: object
+    ) -> None:
+        settings = Settings()
+        settings.vector_store.persist_directory = tmp_path / "db"
+        monkeypatch.setattr(
+            "research_agent.doctor._check_optional_dependencies",
+            lambda: CheckResult(
+                name="optional-dependencies", status=CheckStatus.FAIL, message="bad"
+            ),
+        )
+
+        def fail_if_checked(path: Path) -> CheckResult:
+            raise AssertionError("chromadb directory should not be checked")
+
+        monkeypatch.setattr(
+            "research_agent.doctor._check_chromadb_directory", fail_if_checked
+        )
+
+        report = run_doctor(settings, check_api_probes=False, fast_fail=True)
+        statuses = {check.name: check.status for check in report.checks}
+        assert statuses["optional-dependencies"] == CheckStatus.FAIL
+        assert statuses["chromadb-directory"] == CheckStatus.SKIPPED
+        assert statuses["api-probes"] == CheckStatus.SKIPPED
+
 
 class TestDoctorCli:
     """CLI formatting and exit behavior."""
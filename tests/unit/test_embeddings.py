@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -14,9 +16,14 @@ from research_agent.embeddings import (
     EmbeddingDocument,
     ResearchEmbeddings,
     SimilarityResult,
+    _similarities,
+    _unit_rows,
 )
 from research_agent.exceptions import EmbeddingError
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # ---------------------------------------------------------------------------
 # EmbeddingDocument model
 # ---------------------------------------------------------------------------
@@ -121,6 +128,66 @@ class TestDeduplicationResult:
         assert high.similarity_score == 1.0
 
 
+# ---------------------------------------------------------------------------
+# Similarity helpers
+# ---------------------------------------------------------------------------
+
+
+class TestSimilarities:
+    """_similarities converts ChromaDB distances to clipped scores."""
+
+    def test_converts_distances(self) -> None:
+        scores = _similarities([0.1, 0.3])
+        np.testing.assert_allclose(scores, [0.9, 0.7])
+
+    def test_clips_to_unit_interval(self) -> None:
+        scores = _similarities([-0.2, 1.5])
+        assert scores.tolist() == [1.0, 0.0]
+
+    def test_empty(self) -> None:
+        assert _similarities([]).shape == (0,)
+
+
+class TestUnitRows:
+    """_unit_rows scales rows to unit length and leaves zero rows at zero."""
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float16])
+    def test_rows_have_unit_norm(self, dtype: type[np.floating[Any]]) -> None:
+        matrix = np.array([[3.0, 4.0, 0.0], [0.3, -1.2, 2.5]], dtype=dtype)
+        norms = np.linalg.norm(_unit_rows(matrix).astype(np.float64), axis=1)
+        np.testing.assert_allclose(norms, 1.0, atol=1e-3)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float16])
+    def test_zero_row_without_nan(self, dtype: type[np.floating[Any]]) -> None:
+        result = _unit_rows(np.array([[0.0, 0.0], [2.0, 0.0]], dtype=dtype))
+        assert not np.isnan(result).any()
+        assert result.tolist() == [[0.0, 0.0], [1.0, 0.0]]
+
+
+# ---------------------------------------------------------------------------
+# Module import
+# ---------------------------------------------------------------------------
+
+
+class TestModuleImport:
+    """Heavy optional backends stay unloaded until first use."""
+
+    def test_importing_module_does_not_import_backends(self) -> None:
+        # A fresh interpreter, since this session may already hold the modules
+        code = (
+            "import sys, research_agent.embeddings; "
+            "print(','.join(m for m in ('torch', 'sentence_transformers', "
+            "'chromadb') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == ""
+
+
 # ---------------------------------------------------------------------------
 # ResearchEmbeddings initialization
 # ---------------------------------------------------------------------------
@@ -137,6 +204,7 @@ class TestResearchEmbeddingsInit:
         assert emb.dimensions == 768
         assert emb.content_dedup_threshold == 0.85
         assert emb.exact_dedup_threshold == 0.95
+        assert emb.embed_batch_size == 32
 
     def test_custom_values(self) -> None:
         emb = ResearchEmbeddings(
@@ -146,6 +214,7 @@ class TestResearchEmbeddingsInit:
             dimensions=384,
             content_dedup_threshold=0.80,
             exact_dedup_threshold=0.99,
+            embed_batch_size=128,
         )
         assert emb.collection_name == "my_collection"
         assert emb.persist_directory == "/tmp/test_db"
@@ -153,6 +222,7 @@ class TestResearchEmbeddingsInit:
         assert emb.dimensions == 384
         assert emb.content_dedup_threshold == 0.80
         assert emb.exact_dedup_threshold == 0.99
+        assert emb.embed_batch_size == 128
 
     def test_lazy_fields_initially_none(self) -> None:
         emb = ResearchEmbeddings()
@@ -193,21 +263,22 @@ class TestGetClient:
         client2 = emb._get_client()
         assert client1 is client2
 
-    def test_raises_if_chromadb_not_installed(self) -> None:
-        import sys
-
+    def test_raises_if_chromadb_not_installed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         emb = ResearchEmbeddings()
-        # Temporarily remove chromadb from sys.modules
-        saved = sys.modules.get("chromadb")
-        sys.modules["chromadb"] = None  # type: ignore[assignment]
-        try:
-            with pytest.raises(EmbeddingError, match="chromadb is required"):
-                emb._get_client()
-        finally:
-            if saved is not None:
-                sys.modules["chromadb"] = saved
-            else:
-                sys.modules.pop("chromadb", None)
+        # Block the import; monkeypatch restores the real module afterwards
+        monkeypatch.setitem(sys.modules, "chromadb", None)
+        with pytest.raises(EmbeddingError, match="chromadb is required"):
+            emb._get_client()
+
+    def test_blocked_import_is_restored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        loaded = sys.modules.get("chromadb")
+        with monkeypatch.context() as patch:
+            patch.setitem(sys.modules, "chromadb", None)
+            with pytest.raises(EmbeddingError):
+                ResearchEmbeddings()._get_client()
+        assert sys.modules.get("chromadb") is loaded
 
 
 # ---------------------------------------------------------------------------
@@ -218,7 +289,7 @@ class TestGetClient:
 class TestGetCollection:
     """ChromaDB collection initialization."""
 
-    def test_creates_collection_with_cosine(self, tmp_path: Any) -> None:
+    def test_creates_collection(self, tmp_path: Any) -> None:
         emb = ResearchEmbeddings(
             persist_directory=tmp_path / "chromadb",
             collection_name="test_col",
@@ -227,6 +298,22 @@ class TestGetCollection:
         assert collection is not None
         assert emb._collection is collection
 
+    def test_uses_inner_product_space(self, tmp_path: Any) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        collection = emb._get_collection()
+        assert collection.metadata["hnsw:space"] == "ip"
+
+    def test_inner_product_distance_is_one_minus_similarity(
+        self, tmp_path: Any
+    ) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        collection = emb._get_collection()
+        collection.add(ids=["a"], embeddings=[[0.6, 0.8, 0.0]])
+        raw = collection.query(
+            query_embeddings=[[1.0, 0.0, 0.0]], n_results=1, include=["distances"]
+        )
+        assert _similarities(raw["distances"][0])[0] == pytest.approx(0.6)
+
     def test_returns_cached_collection(self, tmp_path: Any) -> None:
         emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
         col1 = emb._get_collection()
@@ -242,20 +329,13 @@ class TestGetCollection:
 class TestGetModel:
     """Sentence-transformers model initialization."""
 
-    def test_raises_if_sentence_transformers_not_installed(self) -> None:
-        import sys
-
+    def test_raises_if_sentence_transformers_not_installed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         emb = ResearchEmbeddings()
-        saved = sys.modules.get("sentence_transformers")
-        sys.modules["sentence_transformers"] = None  # type: ignore[assignment]
-        try:
-            with pytest.raises(EmbeddingError, match="sentence-transformers is required"):
-                emb._get_model()
-        finally:
-            if saved is not None:
-                sys.modules["sentence_transformers"] = saved
-            else:
-                sys.modules.pop("sentence_transformers", None)
+        monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+        with pytest.raises(EmbeddingError, match="sentence-transformers is required"):
+            emb._get_model()
 
     def test_returns_cached_model(self) -> None:
         emb = ResearchEmbeddings()
@@ -265,6 +345,95 @@ class TestGetModel:
         assert result is mock_model
 
 
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+
+_FIXED_VEC = np.array([[0.1, 0.2, 0.3]], dtype=np.float32)
+
+
+class _FakeModel:
+    """Sentence-transformer stand-in returning a preallocated array.
+
+    Cheaper than a ``MagicMock`` and records each ``encode`` call so tests
+    can still assert on the arguments.
+    """
+
+    def __init__(self) -> None:
+        self.vectors: np.ndarray = _FIXED_VEC
+        self.error: Exception | None = None
+        self.calls: list[tuple[list[str], dict[str, Any]]] = []
+
+    def encode(self, texts: list[str], **kwargs: Any) -> np.ndarray:
+        self.calls.append((list(texts), kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.vectors
+
+
+@pytest.fixture()
+def model() -> _FakeModel:
+    """Stand-in for the sentence-transformer model."""
+    return _FakeModel()
+
+
+class _FakeCollection:
+    """In-memory stand-in for a ChromaDB collection with fixed query hits.
+
+    ``query`` returns the first ``n_results`` stored hits, in stored order,
+    for every query vector and records its keyword arguments in ``queries``.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str] = (),
+        distances: Sequence[float] = (),
+        documents: Sequence[str] | None = None,
+        metadatas: Sequence[dict[str, Any]] | None = None,
+        count: int | None = None,
+    ) -> None:
+        self.ids = list(ids)
+        self.distances = np.asarray(distances, dtype=np.float32)
+        self.documents = list(documents or [""] * len(self.ids))
+        self.metadatas = list(metadatas or [{}] * len(self.ids))
+        self._count = len(self.ids) if count is None else count
+        self.queries: list[dict[str, Any]] = []
+
+    def count(self) -> int:
+        return self._count
+
+    def query(self, **kwargs: Any) -> dict[str, list[list[Any]]]:
+        self.queries.append(kwargs)
+        n = kwargs["n_results"]
+        rows = len(kwargs["query_embeddings"])
+        return {
+            "ids": [self.ids[:n]] * rows,
+            "distances": [self.distances[:n].tolist()] * rows,
+            "documents": [self.documents[:n]] * rows,
+            "metadatas": [self.metadatas[:n]] * rows,
+        }
+
+
+@pytest.fixture()
+def mock_collection() -> MagicMock:
+    """Stand-in for the ChromaDB collection."""
+    return MagicMock()
+
+
+@pytest.fixture()
+def emb(model: _FakeModel, mock_collection: MagicMock) -> ResearchEmbeddings:
+    """Embeddings manager with its model and collection pre-populated.
+
+    Pre-populating ``_model`` means no test can fall through to
+    ``_get_model`` and load the real (~500 MB) model by accident.
+    """
+    embeddings = ResearchEmbeddings()
+    embeddings._model = model
+    embeddings._collection = mock_collection
+    return embeddings
+
+
 # ---------------------------------------------------------------------------
 # embed
 # ---------------------------------------------------------------------------
@@ -273,31 +442,56 @@ class TestGetModel:
 class TestEmbed:
     """Embedding generation."""
 
-    def test_empty_list_returns_empty(self) -> None:
-        emb = ResearchEmbeddings()
+    def test_empty_list_returns_empty(self, emb: ResearchEmbeddings) -> None:
         result = emb.embed([])
-        assert result == []
+        assert result.shape == (0, emb.dimensions)
 
-    def test_embeds_texts_to_float_lists(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_model = MagicMock()
-        # Simulate model.encode returning numpy arrays
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
-        emb._model = mock_model
+    def test_embeds_texts_to_float32_array(
+        self, emb: ResearchEmbeddings, model: _FakeModel
+    ) -> None:
+        model.vectors = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
 
         result = emb.embed(["hello", "world"])
-        assert len(result) == 2
-        assert isinstance(result[0], list)
-        assert isinstance(result[0][0], float)
-        mock_model.encode.assert_called_once_with(
-            ["hello", "world"], normalize_embeddings=True
-        )
-
-    def test_raises_embedding_error_on_failure(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_model = MagicMock()
-        mock_model.encode.side_effect = RuntimeError("GPU OOM")
-        emb._model = mock_model
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float32
+        assert result.shape == (2, 3)
+        assert model.calls == [
+            (["hello", "world"], {"batch_size": 32, "normalize_embeddings": True})
+        ]
+
+    def test_embed_batched_single_forward(
+        self, emb: ResearchEmbeddings, model: _FakeModel
+    ) -> None:
+        model.vectors = np.eye(3, dtype=np.float32)
+        emb.embed_batch_size = 2
+
+        assert emb.embed(["a", "b", "c"]).shape == (3, 3)
+        # The model does its own batching, so the whole input goes in one call
+        assert model.calls == [
+            (["a", "b", "c"], {"batch_size": 2, "normalize_embeddings": True})
+        ]
+
+    def test_embed_does_not_copy_rows(
+        self, emb: ResearchEmbeddings, model: _FakeModel
+    ) -> None:
+        model.vectors = np.array([[0.6, 0.8, 0.0]], dtype=np.float32)
+        result = emb.embed(["hello"])
+        assert np.shares_memory(result, model.vectors)
+
+    def test_embed_normalizes_unnormalized_output(
+        self, emb: ResearchEmbeddings, model: _FakeModel
+    ) -> None:
+        model.vectors = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 0.0]], dtype=np.float32)
+
+        result = emb.embed(["a", "b"])
+        np.testing.assert_allclose(result, [[0.6, 0.8, 0.0], [0.0, 0.0, 0.0]])
+        # The model's own buffer is left untouched
+        assert model.vectors[0, 0] == 3.0
+
+    def test_raises_embedding_error_on_failure(
+        self, emb: ResearchEmbeddings, model: _FakeModel
+    ) -> None:
+        model.error = RuntimeError("GPU OOM")
 
         with pytest.raises(EmbeddingError, match="Embedding failed"):
             emb.embed(["text"])
@@ -311,19 +505,13 @@ class TestEmbed:
 class TestAddDocuments:
     """Document addition with deduplication."""
 
-    def test_empty_documents_returns_zero(self) -> None:
-        emb = ResearchEmbeddings()
+    def test_empty_documents_returns_zero(self, emb: ResearchEmbeddings) -> None:
         assert emb.add_documents([]) == 0
 
-    def test_adds_non_duplicate_documents(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
+    def test_adds_non_duplicate_documents(
+        self, emb: ResearchEmbeddings, mock_collection: MagicMock
+    ) -> None:
         mock_collection.count.return_value = 0
-        emb._collection = mock_collection
-
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
 
         # Empty collection, so check_duplicate returns no duplicate
         mock_collection.query.return_value = {
@@ -337,15 +525,10 @@ class TestAddDocuments:
         assert added == 1
         mock_collection.add.assert_called_once()
 
-    def test_skips_duplicate_documents(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
+    def test_skips_duplicate_documents(
+        self, emb: ResearchEmbeddings, mock_collection: MagicMock
+    ) -> None:
         mock_collection.count.return_value = 1
-        emb._collection = mock_collection
-
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
 
         # High similarity => duplicate
         mock_collection.query.return_value = {
@@ -359,15 +542,135 @@ class TestAddDocuments:
         assert added == 0
         mock_collection.add.assert_not_called()
 
-    def test_adds_document_without_metadata(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
+    def test_embeds_batch_once(
+        self, emb: ResearchEmbeddings, model: _FakeModel, mock_collection: MagicMock
+    ) -> None:
         mock_collection.count.return_value = 0
-        emb._collection = mock_collection
 
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
+        model.vectors = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        docs = [
+            EmbeddingDocument(id="doc-1", content="first"),
+            EmbeddingDocument(id="doc-2", content="second"),
+        ]
+        assert emb.add_documents(docs) == 2
+        assert [texts for texts, _ in model.calls] == [["first", "second"]]
+        mock_collection.add.assert_called_once()
+        assert mock_collection.add.call_args[1]["ids"] == ["doc-1", "doc-2"]
+
+    def test_queries_collection_once_per_batch(
+        self, emb: ResearchEmbeddings, model: _FakeModel, mock_collection: MagicMock
+    ) -> None:
+        mock_collection.count.return_value = 3
+        mock_collection.query.return_value = {
+            "ids": [["old-1"], ["old-2"]],
+            "distances": [[0.5], [0.02]],  # second document duplicates old-2
+        }
+
+        model.vectors = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        docs = [
+            EmbeddingDocument(id="doc-1", content="first"),
+            EmbeddingDocument(id="doc-2", content="second"),
+        ]
+        assert emb.add_documents(docs) == 1
+        mock_collection.query.assert_called_once()
+        assert len(mock_collection.query.call_args[1]["query_embeddings"]) == 2
+        assert mock_collection.add.call_args[1]["ids"] == ["doc-1"]
+
+    def test_keeps_metadata_aligned_in_batch(
+        self, emb: ResearchEmbeddings, model: _FakeModel, mock_collection: MagicMock
+    ) -> None:
+        mock_collection.count.return_value = 0
+
+        model.vectors = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        docs = [
+            EmbeddingDocument(id="doc-1", content="first"),
+            EmbeddingDocument(id="doc-2", content="second", metadata={"src": "web"}),
+        ]
+        emb.add_documents(docs)
+        call_kwargs = mock_collection.add.call_args[1]
+        assert call_kwargs["metadatas"] == [None, {"src": "web"}]
+
+    def test_skips_duplicate_within_batch(
+        self, emb: ResearchEmbeddings, model: _FakeModel, mock_collection: MagicMock
+    ) -> None:
+        mock_collection.count.return_value = 1
+        mock_collection.query.return_value = {"ids": [[]], "distances": [[]]}
+
+        model.vectors = np.array([[0.6, 0.8], [0.6, 0.8]])
+
+        docs = [
+            EmbeddingDocument(id="doc-1", content="same"),
+            EmbeddingDocument(id="doc-2", content="same again"),
+        ]
+        assert emb.add_documents(docs) == 1
+        assert mock_collection.add.call_args[1]["ids"] == ["doc-1"]
+
+    def test_skips_repeated_id_within_batch(
+        self, emb: ResearchEmbeddings, model: _FakeModel, mock_collection: MagicMock
+    ) -> None:
+        mock_collection.count.return_value = 0
+
+        model.vectors = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        docs = [
+            EmbeddingDocument(id="doc-1", content="first"),
+            EmbeddingDocument(id="doc-1", content="second"),
+        ]
+        assert emb.add_documents(docs) == 1
+        assert mock_collection.add.call_args[1]["ids"] == ["doc-1"]
+
+    def test_repeated_id_does_not_drop_batch(
+        self, tmp_path: Any, model: _FakeModel
+    ) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        emb._model = model
+        model.vectors = np.eye(3, dtype=np.float32)
+
+        docs = [
+            EmbeddingDocument(id="a", content="a"),
+            EmbeddingDocument(id="a", content="b"),
+            EmbeddingDocument(id="c", content="c"),
+        ]
+        assert emb.add_documents(docs) == 2
+        assert sorted(emb._get_collection().get(include=[])["ids"]) == ["a", "c"]
+
+    def test_skips_already_stored_id(
+        self, emb: ResearchEmbeddings, model: _FakeModel, mock_collection: MagicMock
+    ) -> None:
+        mock_collection.count.return_value = 1
+        mock_collection.get.return_value = {"ids": ["doc-1"]}
+        mock_collection.query.return_value = {
+            "ids": [["doc-1"], ["doc-1"]],
+            "distances": [[0.5], [0.5]],
+        }
+
+        model.vectors = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        docs = [
+            EmbeddingDocument(id="doc-1", content="first"),
+            EmbeddingDocument(id="doc-2", content="second"),
+        ]
+        assert emb.add_documents(docs) == 1
+        mock_collection.get.assert_called_once_with(ids=["doc-1", "doc-2"], include=[])
+        assert mock_collection.add.call_args[1]["ids"] == ["doc-2"]
+
+    def test_add_failure_raises_embedding_error(
+        self, emb: ResearchEmbeddings, mock_collection: MagicMock
+    ) -> None:
+        mock_collection.count.return_value = 0
+        mock_collection.add.side_effect = RuntimeError("store unavailable")
+
+        doc = EmbeddingDocument(id="doc-1", content="hello")
+        with pytest.raises(EmbeddingError, match="store unavailable"):
+            emb.add_documents([doc])
+
+    def test_adds_document_without_metadata(
+        self, emb: ResearchEmbeddings, mock_collection: MagicMock
+    ) -> None:
+        mock_collection.count.return_value = 0
 
         mock_collection.query.return_value = {
             "ids": [[]],
@@ -389,31 +692,19 @@ class TestAddDocuments:
 class TestSearch:
     """Similarity search."""
 
-    def test_empty_collection_returns_empty(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 0
-        emb._collection = mock_collection
+    def test_empty_collection_returns_empty(self, emb: ResearchEmbeddings) -> None:
+        emb._collection = _FakeCollection()
 
         results = emb.search("query")
         assert results == []
 
-    def test_returns_results_sorted_by_score(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 2
-        emb._collection = mock_collection
-
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
-
-        mock_collection.query.return_value = {
-            "ids": [["doc-1", "doc-2"]],
-            "documents": [["content 1", "content 2"]],
-            "distances": [[0.3, 0.1]],  # doc-2 is closer
-            "metadatas": [[{"src": "a"}, {"src": "b"}]],
-        }
+    def test_returns_results_sorted_by_score(self, emb: ResearchEmbeddings) -> None:
+        emb._collection = _FakeCollection(
+            ids=["doc-1", "doc-2"],
+            distances=[0.3, 0.1],  # doc-2 is closer
+            documents=["content 1", "content 2"],
+            metadatas=[{"src": "a"}, {"src": "b"}],
+        )
 
         results = emb.search("query", n_results=2)
         assert len(results) == 2
@@ -421,64 +712,42 @@ class TestSearch:
         assert results[1].id == "doc-1"  # Lower similarity (1 - 0.3 = 0.7)
         assert results[0].score > results[1].score
 
-    def test_passes_where_filter(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 1
-        emb._collection = mock_collection
+    @pytest.mark.parametrize(
+        "distances", [[0.3, 0.1], [0.1, 0.3], [0.5, 0.5, 0.1], [0.4, 0.2, 0.9, 0.0]]
+    )
+    def test_orders_any_distance_permutation(
+        self, emb: ResearchEmbeddings, distances: list[float]
+    ) -> None:
+        ids = [f"doc-{i}" for i in range(len(distances))]
+        emb._collection = _FakeCollection(
+            ids=ids,
+            distances=distances,
+            documents=[f"content {i}" for i in range(len(ids))],
+            metadatas=[{"rank": i} for i in range(len(ids))],
+        )
 
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
+        results = emb.search("query", n_results=len(ids))
+        assert results == sorted(results, key=lambda r: -r.score)
+        # Content and metadata stay attached to their document
+        assert all(r.metadata["rank"] == int(r.id.split("-")[1]) for r in results)
+        assert all(r.content == f"content {r.metadata['rank']}" for r in results)
 
-        mock_collection.query.return_value = {
-            "ids": [["doc-1"]],
-            "documents": [["content"]],
-            "distances": [[0.2]],
-            "metadatas": [[{"src": "web"}]],
-        }
+    def test_passes_where_filter(self, emb: ResearchEmbeddings) -> None:
+        emb._collection = collection = _FakeCollection(ids=["doc-1"], distances=[0.2])
 
         emb.search("query", where={"src": "web"})
-        call_kwargs = mock_collection.query.call_args[1]
-        assert call_kwargs["where"] == {"src": "web"}
-
-    def test_clamps_n_results_to_collection_size(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 2
-        emb._collection = mock_collection
-
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
+        assert collection.queries[-1]["where"] == {"src": "web"}
 
-        mock_collection.query.return_value = {
-            "ids": [["doc-1", "doc-2"]],
-            "documents": [["c1", "c2"]],
-            "distances": [[0.1, 0.2]],
-            "metadatas": [[{}, {}]],
-        }
+    def test_clamps_n_results_to_collection_size(self, emb: ResearchEmbeddings) -> None:
+        emb._collection = collection = _FakeCollection(
+            ids=["doc-1", "doc-2"], distances=[0.1, 0.2]
+        )
 
         emb.search("query", n_results=100)
-        call_kwargs = mock_collection.query.call_args[1]
-        assert call_kwargs["n_results"] == 2
-
-    def test_handles_empty_query_results(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 1
-        emb._collection = mock_collection
+        assert collection.queries[-1]["n_results"] == 2
 
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
-
-        mock_collection.query.return_value = {
-            "ids": [[]],
-            "documents": [[]],
-            "distances": [[]],
-            "metadatas": [[]],
-        }
+    def test_handles_empty_query_results(self, emb: ResearchEmbeddings) -> None:
+        emb._collection = _FakeCollection(count=1)
 
         results = emb.search("query")
         assert results == []
@@ -492,74 +761,155 @@ class TestSearch:
 class TestCheckDuplicate:
     """Deduplication checking."""
 
-    def test_empty_collection_returns_no_duplicate(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 0
-        emb._collection = mock_collection
+    def test_empty_collection_returns_no_duplicate(
+        self, emb: ResearchEmbeddings
+    ) -> None:
+        emb._collection = _FakeCollection()
 
         result = emb.check_duplicate("content")
         assert result.is_duplicate is False
         assert result.most_similar_id is None
 
-    def test_detects_duplicate_above_threshold(self) -> None:
-        emb = ResearchEmbeddings(content_dedup_threshold=0.85)
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 1
-        emb._collection = mock_collection
-
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
-
-        mock_collection.query.return_value = {
-            "ids": [["existing-doc"]],
-            "distances": [[0.1]],  # similarity = 0.9 > 0.85
-        }
+    def test_detects_duplicate_above_threshold(self, emb: ResearchEmbeddings) -> None:
+        emb._collection = _FakeCollection(
+            ids=["existing-doc"],
+            distances=[0.1],  # similarity = 0.9 > 0.85
+        )
 
         result = emb.check_duplicate("similar content")
         assert result.is_duplicate is True
         assert result.most_similar_id == "existing-doc"
         assert result.similarity_score == pytest.approx(0.9)
 
-    def test_not_duplicate_below_threshold(self) -> None:
-        emb = ResearchEmbeddings(content_dedup_threshold=0.85)
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 1
-        emb._collection = mock_collection
-
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
-
-        mock_collection.query.return_value = {
-            "ids": [["other-doc"]],
-            "distances": [[0.5]],  # similarity = 0.5 < 0.85
-        }
+    def test_not_duplicate_below_threshold(self, emb: ResearchEmbeddings) -> None:
+        emb._collection = _FakeCollection(
+            ids=["other-doc"],
+            distances=[0.5],  # similarity = 0.5 < 0.85
+        )
 
         result = emb.check_duplicate("different content")
         assert result.is_duplicate is False
         assert result.most_similar_id == "other-doc"
 
-    def test_handles_empty_query_results(self) -> None:
-        emb = ResearchEmbeddings()
-        mock_collection = MagicMock()
-        mock_collection.count.return_value = 1
-        emb._collection = mock_collection
+    @pytest.mark.parametrize(
+        ("distance", "expected"), [(0.0, True), (0.1, True), (0.5, False), (1.0, False)]
+    )
+    def test_decision_follows_distance(
+        self, emb: ResearchEmbeddings, distance: float, expected: bool
+    ) -> None:
+        emb._collection = _FakeCollection(ids=["doc"], distances=[distance])
+        assert emb.check_duplicate("content").is_duplicate is expected
 
-        mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
-        emb._model = mock_model
-
-        mock_collection.query.return_value = {
-            "ids": [[]],
-            "distances": [[]],
-        }
+    def test_handles_empty_query_results(self, emb: ResearchEmbeddings) -> None:
+        emb._collection = _FakeCollection(count=1)
 
         result = emb.check_duplicate("content")
         assert result.is_duplicate is False
 
 
+# ---------------------------------------------------------------------------
+# mean_similarity
+# ---------------------------------------------------------------------------
+
+_MEAN_VECTORS = {
+    "a": [1.0, 0.0, 0.0],
+    "b": [0.0, 1.0, 0.0],
+    "c": [0.6, 0.8, 0.0],
+    "query": [0.8, 0.0, 0.6],
+}
+
+
+def _lookup_model() -> MagicMock:
+    """Model whose encode maps each text to a fixed unit vector."""
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **_: np.array(
+        [_MEAN_VECTORS[t] for t in texts]
+    )
+    return model
+
+
+class TestMeanSimilarity:
+    """mean_similarity compares content against the mean stored vector."""
+
+    def test_empty_collection_returns_zero(self, tmp_path: Any) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        emb._model = _lookup_model()
+        assert emb.mean_similarity("query") == 0.0
+
+    def test_matches_average_of_pairwise_similarities(self, tmp_path: Any) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        emb._model = _lookup_model()
+        emb.add_documents([EmbeddingDocument(id=t, content=t) for t in ("a", "b", "c")])
+        query = np.array(_MEAN_VECTORS["query"])
+        expected = np.mean([query @ _MEAN_VECTORS[t] for t in ("a", "b", "c")])
+        assert emb.mean_similarity("query") == pytest.approx(expected, abs=1e-6)
+
+    def test_mean_normed_updates_on_add(self, tmp_path: Any) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        emb._model = _lookup_model()
+        emb.add_documents([EmbeddingDocument(id="a", content="a")])
+        emb.mean_similarity("query")  # loads the mean from the collection
+        emb.add_documents([EmbeddingDocument(id="b", content="b")])
+        assert emb._mean_count == 2
+        np.testing.assert_allclose(emb._mean_normed, [0.5, 0.5, 0.0], atol=1e-6)
+
+    def test_mean_ignores_already_stored_id(self, tmp_path: Any) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        emb._model = _lookup_model()
+        emb.add_documents([EmbeddingDocument(id="a", content="a")])
+        emb.mean_similarity("query")  # loads the mean from the collection
+        # Same id, different content: ChromaDB keeps the stored vector
+        assert emb.add_documents([EmbeddingDocument(id="a", content="b")]) == 0
+        assert emb._mean_count == emb.count == 1
+        np.testing.assert_allclose(emb._mean_normed, [1.0, 0.0, 0.0], atol=1e-6)
+
+
+# ---------------------------------------------------------------------------
+# Stored vectors
+# ---------------------------------------------------------------------------
+
+
+class TestStoredVectors:
+    """Vectors are persisted unit-normalized, as the inner-product space needs."""
+
+    def test_stored_vectors_are_unit_norm(
+        self, tmp_path: Any, model: _FakeModel
+    ) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        model.vectors = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 2.0]], dtype=np.float32)
+        emb._model = model
+        emb.add_documents(
+            [
+                EmbeddingDocument(id="a", content="a"),
+                EmbeddingDocument(id="b", content="b"),
+            ]
+        )
+
+        stored = emb._get_collection().get(include=["embeddings"])["embeddings"]
+        np.testing.assert_allclose(np.linalg.norm(stored, axis=1), 1.0, atol=1e-6)
+
+    def test_check_duplicate_matches_reference_cosine(
+        self, tmp_path: Any, model: _FakeModel
+    ) -> None:
+        emb = ResearchEmbeddings(persist_directory=tmp_path / "chromadb")
+        emb._model = model
+        stored = np.array([[3.0, 4.0, 0.0]], dtype=np.float32)
+        query = np.array([[1.0, 2.0, 2.0]], dtype=np.float32)
+        model.vectors = stored
+        emb.add_documents([EmbeddingDocument(id="a", content="a")])
+
+        model.vectors = query
+        result = emb.check_duplicate("q")
+
+        reference = float(
+            stored[0]
+            @ query[0]
+            / (np.linalg.norm(stored[0]) * np.linalg.norm(query[0]))
+        )
+        assert result.most_similar_id == "a"
+        assert result.similarity_score == pytest.approx(reference, abs=1e-5)
+
+
 # ---------------------------------------------------------------------------
 # delete_collection
 # ---------------------------------------------------------------------------
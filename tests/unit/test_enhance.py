@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import json
+import os
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import IO, Any
 
-from typer.testing import CliRunner
+import orjson
+import pytest
 
-from research_agent.cli import app
 from research_agent.config import Settings
 from research_agent.enhance_context import build_project_context
 from research_agent.enhance_engine import (
     generate_enhancement_report,
     identify_opportunities,
     plan_incremental_research,
+    run_enhancement,
 )
 from research_agent.enhance_models import (
     DeltaSummary,
@@ -25,8 +29,6 @@ from research_agent.enhance_models import (
 )
 from research_agent.enhance_store import KnowledgeStore
 
-runner = CliRunner()
-
 
 def _make_project(tmp_path: Path) -> Path:
     project = tmp_path / "sample-project"
@@ -59,6 +61,136 @@ def test_context_loader_multilanguage_gitignore_and_size_limits(tmp_path: Path)
     assert large_items[0].truncated is True
 
 
+def test_context_cache_hit_skips_rescan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project = _make_project(tmp_path)
+    cache_path = tmp_path / "cache" / "context.json"
+    first = build_project_context(project, cache_path=cache_path)
+
+    opened: list[Path] = []
+    real_open = Path.open
+
+    def recording_open(self: Path, *args: Any, **kwargs: Any) -> Any:
+        opened.append(self)
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", recording_open)
+    second = build_project_context(project, cache_path=cache_path)
+
+    assert second == first
+    # Only the ignore file and the cache itself are read on a hit
+    assert set(opened) <= {project / ".gitignore", cache_path}
+
+    # Touching a scanned file changes its size and invalidates the entry
+    (project / "src" / "main.py").write_text("print('changed')", encoding="utf-8")
+    third = build_project_context(project, cache_path=cache_path)
+    main_item = next(i for i in third.key_files if i.path.endswith("main.py"))
+    assert main_item.summary == "print('changed')"
+
+
+@pytest.mark.parametrize(
+    ("filename", "language"),
+    [
+        ("main.py", "python"),
+        ("app.ts", "typescript"),
+        ("view.tsx", "typescript"),
+        ("index.js", "javascript"),
+        ("main.go", "go"),
+        ("lib.rs", "rust"),
+    ],
+)
+def test_suffix_table_covers_common_languages(
+    tmp_path: Path, filename: str, language: str
+) -> None:
+    (tmp_path / filename).write_text("x", encoding="utf-8")
+    context = build_project_context(tmp_path)
+    assert context.languages == [language]
+
+
+class _ReadCounter:
+    """File handle proxy recording the size of every ``read`` result."""
+
+    def __init__(self, handle: IO[Any], reads: list[int]) -> None:
+        self._handle = handle
+        self._reads = reads
+
+    def __enter__(self) -> _ReadCounter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._handle.close()
+
+    def read(self, size: int = -1) -> Any:
+        data = self._handle.read(size)
+        self._reads.append(len(data))
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._handle.seek(offset, whence)
+
+
+def test_large_file_bounded_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project = tmp_path / "big-project"
+    project.mkdir()
+    limit = 120
+    body = "HEAD" + "a" * (10 * 1024 * 1024) + "TAIL"
+    (project / "huge.py").write_text(body, encoding="utf-8")
+
+    reads: list[int] = []
+    real_open = Path.open
+
+    def counting_open(self: Path, *args: Any, **kwargs: Any) -> _ReadCounter:
+        return _ReadCounter(real_open(self, *args, **kwargs), reads)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+    context = build_project_context(project, max_chars_per_file=limit)
+
+    (item,) = context.key_files
+    assert item.truncated is True
+    assert item.size_bytes == len(body)
+    assert item.summary.splitlines()[1].startswith("HEAD")
+    assert item.summary.endswith("TAIL")
+    # Head and tail reads together stay within a few times the limit.
+    assert sum(reads) <= (limit + 1) + (limit // 2) * 4
+
+
+def test_scandir_used_for_traversal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project = _make_project(tmp_path)
+    (project / "node_modules" / "pkg").mkdir(parents=True)
+    (project / "node_modules" / "pkg" / "index.js").write_text("x", encoding="utf-8")
+    (project / "generated" / "deep").mkdir(parents=True)
+    (project / "generated" / "deep" / "out.py").write_text("x", encoding="utf-8")
+    (project / "logs").mkdir()
+    (project / "logs" / "run.py").write_text("x", encoding="utf-8")
+    (project / ".gitignore").write_text(
+        "ignored.py\ngenerated/\n*.log\n", encoding="utf-8"
+    )
+
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path: Path) -> object:
+        scanned.append(Path(path).relative_to(project).as_posix())
+        return real_scandir(path)
+
+    monkeypatch.setattr(Path, "rglob", None)
+    monkeypatch.setattr(os, "scandir", recording_scandir)
+    context = build_project_context(project, max_files=20)
+
+    assert sorted(scanned) == [".", "frontend", "logs", "src"]
+    rel_paths = [
+        Path(item.path).relative_to(project).as_posix() for item in context.key_files
+    ]
+    assert "logs/run.py" in rel_paths
+    assert "ignored.py" not in rel_paths
+    assert not any(p.startswith(("node_modules/", "generated/")) for p in rel_paths)
+
+
 def test_opportunity_identifier_ranking_and_focus_filter() -> None:
     context = ProjectContext(
         project_path="/tmp/x",
@@ -86,6 +218,32 @@ def test_opportunity_identifier_ranking_and_focus_filter() -> None:
     )
 
 
+def test_ranking_stable_for_equal_scores() -> None:
+    context = ProjectContext(
+        project_path="/tmp/x",
+        project_name="demo",
+        description="",
+        languages=["python"],
+        framework="fastapi",
+        dependencies=[
+            ProjectDependency(name="fastapi", version=">=0.110", source="pyproject")
+        ],
+        key_files=[],
+    )
+
+    ranked = [opp.title for opp in identify_opportunities(context)]
+    # Impact descending, then effort ascending, then title for full ties
+    assert ranked == [
+        "Security controls and secrets handling review",
+        "Create automated regression test suite",
+        "Establish architecture decision records",
+        "Performance profiling and hotspot optimization",
+        "Improve project documentation quality",
+        "Harden dependency upgrade strategy",
+    ]
+    assert [opp.title for opp in identify_opportunities(context)] == ranked
+
+
 def test_incremental_staleness_and_force_refresh(tmp_path: Path) -> None:
     store = KnowledgeStore(tmp_path / "knowledge.json")
 
@@ -159,40 +317,224 @@ def test_incremental_staleness_and_force_refresh(tmp_path: Path) -> None:
     assert len(force_targets) == len(opportunities)
 
 
-def test_report_generation_and_apply_to(tmp_path: Path, monkeypatch: object) -> None:
+def test_planner_single_pass_over_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = KnowledgeStore(tmp_path / "knowledge.json")
+    shared_entry = KnowledgeEntry(
+        topic="shared", category=OpportunityCategory.TESTING, finding="f", query="q"
+    )
+    store.upsert_entries("proj-b", [shared_entry])
+    opportunities = [
+        EnhancementOpportunity(
+            title=f"testing {i}",
+            category=OpportunityCategory.TESTING,
+            impact_score=3,
+            effort_score=3,
+            rationale="r",
+            suggested_query="q",
+        )
+        for i in range(5)
+    ]
+
+    scans: list[OpportunityCategory] = []
+    real_matches = store.cross_project_matches
+
+    def counting_matches(
+        project_id: str, category: OpportunityCategory
+    ) -> list[KnowledgeEntry]:
+        scans.append(category)
+        return real_matches(project_id, category)
+
+    monkeypatch.setattr(store, "cross_project_matches", counting_matches)
+    refresh_targets, delta, shared = plan_incremental_research(
+        project_id="proj-a",
+        opportunities=opportunities,
+        store=store,
+        stale_days=30,
+        force_refresh=False,
+    )
+
+    assert scans == [OpportunityCategory.TESTING]
+    assert len(refresh_targets) == 5
+    assert shared == [shared_entry] * 5
+    assert delta.shared_topics == ["shared"]
+
+
+def test_unreadable_timestamps_are_treated_as_stale(tmp_path: Path) -> None:
+    store = KnowledgeStore(tmp_path / "knowledge.json")
+    topics = ["blank stamp", "naive stamp"]
+    store.upsert_entries(
+        "proj-a",
+        [
+            KnowledgeEntry(
+                topic=topic,
+                category=OpportunityCategory.TESTING,
+                updated_at=stamp,
+                finding="f",
+                query="q",
+            )
+            for topic, stamp in zip(topics, ["", "2026-01-01T00:00:00"], strict=True)
+        ],
+    )
+    opportunities = [
+        EnhancementOpportunity(
+            title=topic,
+            category=OpportunityCategory.TESTING,
+            impact_score=3,
+            effort_score=2,
+            rationale="r",
+            suggested_query="q",
+        )
+        for topic in topics
+    ]
+
+    refresh_targets, delta, _shared = plan_incremental_research(
+        project_id="proj-a",
+        opportunities=opportunities,
+        store=store,
+        stale_days=30,
+        force_refresh=False,
+    )
+    assert [opp.title for opp in refresh_targets] == topics
+    assert delta.skipped_recent_topics == []
+
+
+def test_store_reuses_parsed_payload(tmp_path: Path, monkeypatch: object) -> None:
+    store = KnowledgeStore(tmp_path / "knowledge.json")
+    entry = KnowledgeEntry(
+        topic="t", category=OpportunityCategory.TESTING, finding="f", query="q"
+    )
+    store.upsert_entries("proj-a", [entry])
+
+    parses: list[bytes] = []
+    real_loads = orjson.loads
+
+    def counting_loads(text: bytes) -> object:
+        parses.append(text)
+        return real_loads(text)
+
+    monkeypatch.setattr("research_agent.enhance_store.orjson.loads", counting_loads)
+
+    assert "t" in store.get_project_entries("proj-a")
+    assert store.cross_project_matches("proj-b", OpportunityCategory.TESTING)
+    assert parses == []
+
+    # Another writer changing the file invalidates the cached payload
+    other = KnowledgeStore(tmp_path / "knowledge.json")
+    other.upsert_entries("proj-a", [entry.model_copy(update={"topic": "t2"})])
+    parses.clear()
+    assert set(store.get_project_entries("proj-a")) == {"t", "t2"}
+    assert len(parses) == 1
+
+
+def test_store_roundtrip_orjson(tmp_path: Path) -> None:
+    path = tmp_path / "knowledge.json"
+    entries = [
+        KnowledgeEntry(
+            topic="Caché tuning — naïve",
+            category=OpportunityCategory.PERFORMANCE,
+            finding="Use 🚀 wisely",
+            query="q",
+        ),
+        KnowledgeEntry(
+            topic="Docs",
+            category=OpportunityCategory.DOCUMENTATION,
+            finding="",
+            query="",
+        ),
+    ]
+    KnowledgeStore(path).upsert_entries("proj-a", entries)
+
+    reloaded = KnowledgeStore(path).get_project_entries("proj-a")
+    assert list(reloaded.values()) == entries
+    # The file stays plain, indented JSON readable by the standard library
+    raw = path.read_text(encoding="utf-8")
+    assert raw.startswith('{\n  "projects"')
+    assert json.loads(raw)["projects"]["proj-a"]["Docs"]["category"] == "documentation"
+
+
+def test_upsert_entries_single_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = KnowledgeStore(tmp_path / "knowledge.json")
+    entries = [
+        KnowledgeEntry(
+            topic=f"t{i}", category=OpportunityCategory.TESTING, finding="f", query="q"
+        )
+        for i in range(50)
+    ]
+
+    writes: list[Path] = []
+    real_write_bytes = Path.write_bytes
+
+    def counting_write_bytes(self: Path, data: bytes) -> int:
+        writes.append(self)
+        return real_write_bytes(self, data)
+
+    monkeypatch.setattr(Path, "write_bytes", counting_write_bytes)
+    store.upsert_entries("proj-a", entries)
+
+    assert writes == [tmp_path / "knowledge.json"]
+    assert (
+        len(KnowledgeStore(tmp_path / "knowledge.json").get_project_entries("proj-a"))
+        == 50
+    )
+
+
+def test_upsert_entries_failed_write_keeps_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = KnowledgeStore(tmp_path / "knowledge.json")
+    entry = KnowledgeEntry(
+        topic="t", category=OpportunityCategory.TESTING, finding="f", query="q"
+    )
+    store.upsert_entries("proj-a", [entry])
+
+    def failing_write_bytes(self: Path, data: bytes) -> int:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Path, "write_bytes", failing_write_bytes)
+    with pytest.raises(OSError, match="disk full"):
+        store.upsert_entries("proj-a", [entry.model_copy(update={"topic": "t2"})])
+
+    assert set(store.get_project_entries("proj-a")) == {"t"}
+
+
+def test_report_generation_and_apply_to_inprocess(tmp_path: Path) -> None:
     project = _make_project(tmp_path)
     output = tmp_path / "COMPILED_RESEARCH.md"
     apply_to = tmp_path / "docs" / "ENHANCEMENTS.md"
-
     settings = Settings()
     settings.vector_store.persist_directory = tmp_path / "vector"
-    monkeypatch.setattr(
-        "research_agent.cli._load_settings", lambda *_args, **_kwargs: settings
-    )
 
-    result = runner.invoke(
-        app,
-        [
-            "enhance",
-            "--project",
-            str(project),
-            "--focus",
-            "security,performance",
-            "--output",
-            str(output),
-            "--apply-to",
-            str(apply_to),
-            "--force-refresh",
-        ],
+    result = run_enhancement(
+        project,
+        settings,
+        focus_areas={OpportunityCategory.SECURITY, OpportunityCategory.PERFORMANCE},
+        force_refresh=True,
+        output=output,
+        apply_to=apply_to,
     )
 
-    assert result.exit_code == 0
     assert output.exists()
     assert apply_to.exists()
+    assert result.output_path == str(output)
+    assert result.apply_to_path == str(apply_to)
+    assert {op.category for op in result.opportunities} <= {
+        OpportunityCategory.SECURITY,
+        OpportunityCategory.PERFORMANCE,
+    }
     content = output.read_text(encoding="utf-8")
+    assert content == result.report
     assert "## Current State" in content
     assert "## Recommendations" in content
     assert "## Priority Matrix" in content
+    # The run persisted its findings for the next incremental pass
+    store = KnowledgeStore(tmp_path / "vector" / "enhancement.json")
+    assert set(store.get_project_entries(result.context.project_name)) == {
+        op.title for op in result.opportunities
+    }
 
 
 def test_generate_enhancement_report_structure() -> None:
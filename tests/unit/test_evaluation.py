@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import pytest
 from pydantic import ValidationError
 
@@ -35,6 +37,28 @@ _SAMPLE_REPORT = (
 )
 
 
+def _dumps(payload: dict[str, Any]) -> str:
+    """Serialize a response payload to the JSON text an LLM would return."""
+    return orjson.dumps(payload).decode("utf-8")
+
+
+_BASELINE_DIMS: list[dict[str, Any]] = [
+    {"dimension": name, "score": 3.0, "reasoning": ""}
+    for name, _ in EVALUATION_DIMENSIONS
+]
+
+
+def _dims_payload(
+    overrides: dict[str, dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Return the baseline five-dimension list with per-dimension overrides.
+
+    Entries are fresh dicts, so callers may extend or filter the list.
+    """
+    overrides = overrides or {}
+    return [{**d, **overrides.get(d["dimension"], {})} for d in _BASELINE_DIMS]
+
+
 def _make_llm_response(
     scores: dict[str, float] | None = None,
     overall: str = "Solid report.",
@@ -53,7 +77,7 @@ def _make_llm_response(
         {"dimension": name, "score": score, "reasoning": f"Score {score} for {name}."}
         for name, score in scores.items()
     ]
-    return json.dumps(
+    return _dumps(
         {
             "dimensions": dims,
             "overall_reasoning": overall,
@@ -62,6 +86,20 @@ def _make_llm_response(
     )
 
 
+# Tests only read the default response, so it is serialized once
+_DEFAULT_RESPONSE_JSON = _make_llm_response()
+
+
+@pytest.fixture(scope="module")
+def evaluator() -> ReportEvaluator:
+    """Default-dimension evaluator shared across the module.
+
+    ``ReportEvaluator`` holds no per-call state, so one instance serves
+    every test that does not exercise construction itself.
+    """
+    return ReportEvaluator()
+
+
 def _make_async_callable(response: str) -> LLMCallable:
     """Return an async callable that returns a fixed response."""
 
@@ -87,15 +125,15 @@ class TestDimensionScore:
 
     def test_weighted_score(self) -> None:
         ds = DimensionScore(dimension="Test", score=4.0, weight=0.25)
-        assert ds.weighted_score == pytest.approx(1.0)
+        assert ds.weighted_score == 1.0
 
     def test_min_score(self) -> None:
         ds = DimensionScore(dimension="Test", score=1.0, weight=0.10)
-        assert ds.weighted_score == pytest.approx(0.10)
+        assert ds.weighted_score == 0.10
 
     def test_max_score(self) -> None:
         ds = DimensionScore(dimension="Test", score=5.0, weight=1.0)
-        assert ds.weighted_score == pytest.approx(5.0)
+        assert ds.weighted_score == 5.0
 
     def test_score_below_1_rejected(self) -> None:
         with pytest.raises(ValidationError):
@@ -179,11 +217,11 @@ class TestConstants:
 
     def test_dimension_weights(self) -> None:
         weight_map = dict(EVALUATION_DIMENSIONS)
-        assert weight_map["Factual Accuracy"] == pytest.approx(0.30)
-        assert weight_map["Completeness"] == pytest.approx(0.25)
-        assert weight_map["Coverage"] == pytest.approx(0.20)
-        assert weight_map["Coherence"] == pytest.approx(0.15)
-        assert weight_map["Bias"] == pytest.approx(0.10)
+        assert weight_map["Factual Accuracy"] == 0.30
+        assert weight_map["Completeness"] == 0.25
+        assert weight_map["Coverage"] == 0.20
+        assert weight_map["Coherence"] == 0.15
+        assert weight_map["Bias"] == 0.10
 
     def test_all_dimensions_have_descriptions(self) -> None:
         for name, _ in EVALUATION_DIMENSIONS:
@@ -230,54 +268,53 @@ class TestReportEvaluatorInit:
 # ---------------------------------------------------------------------------
 
 
+def _needle_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile an alternation matching any of ``needles`` literally."""
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+_DIM_NAMES = tuple(name for name, _ in EVALUATION_DIMENSIONS)
+_DIM_WEIGHTS = ("30%", "25%", "20%", "15%", "10%")
+_DIM_NAMES_PATTERN = _needle_pattern(_DIM_NAMES)
+_DIM_WEIGHTS_PATTERN = _needle_pattern(_DIM_WEIGHTS)
+_DIM_DESCRIPTIONS_PATTERN = _needle_pattern(tuple(_DIMENSION_DESCRIPTIONS.values()))
+
+
+@pytest.fixture(scope="module")
+def sample_prompt(evaluator: ReportEvaluator) -> str:
+    """Default-dimension prompt for the sample query and report, built once."""
+    return evaluator._build_evaluation_prompt(_SAMPLE_QUERY, _SAMPLE_REPORT)
+
+
 class TestBuildEvaluationPrompt:
     """_build_evaluation_prompt constructs a structured evaluation prompt."""
 
-    def test_contains_query(self) -> None:
-        evaluator = ReportEvaluator()
-        prompt = evaluator._build_evaluation_prompt(_SAMPLE_QUERY, _SAMPLE_REPORT)
-        assert _SAMPLE_QUERY in prompt
+    def test_contains_query(self, sample_prompt: str) -> None:
+        assert _SAMPLE_QUERY in sample_prompt
 
-    def test_contains_report(self) -> None:
-        evaluator = ReportEvaluator()
-        prompt = evaluator._build_evaluation_prompt(_SAMPLE_QUERY, _SAMPLE_REPORT)
-        assert _SAMPLE_REPORT in prompt
+    def test_contains_report(self, sample_prompt: str) -> None:
+        assert _SAMPLE_REPORT in sample_prompt
 
-    def test_contains_all_dimension_names(self) -> None:
-        evaluator = ReportEvaluator()
-        prompt = evaluator._build_evaluation_prompt(_SAMPLE_QUERY, _SAMPLE_REPORT)
-        for name, _ in EVALUATION_DIMENSIONS:
-            assert name in prompt
+    def test_contains_all_dimension_names(self, sample_prompt: str) -> None:
+        assert set(_DIM_NAMES_PATTERN.findall(sample_prompt)) == set(_DIM_NAMES)
 
-    def test_contains_dimension_weights(self) -> None:
-        evaluator = ReportEvaluator()
-        prompt = evaluator._build_evaluation_prompt(_SAMPLE_QUERY, _SAMPLE_REPORT)
-        assert "30%" in prompt
-        assert "25%" in prompt
-        assert "20%" in prompt
-        assert "15%" in prompt
-        assert "10%" in prompt
-
-    def test_contains_scoring_scale(self) -> None:
-        evaluator = ReportEvaluator()
-        prompt = evaluator._build_evaluation_prompt(_SAMPLE_QUERY, _SAMPLE_REPORT)
-        assert "1-5" in prompt
-        assert "1 = Very Poor" in prompt
-        assert "5 = Excellent" in prompt
+    def test_contains_dimension_weights(self, sample_prompt: str) -> None:
+        assert set(_DIM_WEIGHTS_PATTERN.findall(sample_prompt)) == set(_DIM_WEIGHTS)
 
-    def test_requests_json_format(self) -> None:
-        evaluator = ReportEvaluator()
-        prompt = evaluator._build_evaluation_prompt(_SAMPLE_QUERY, _SAMPLE_REPORT)
-        assert "JSON" in prompt
-        assert '"dimensions"' in prompt
-        assert '"score"' in prompt
-        assert '"reasoning"' in prompt
+    def test_contains_scoring_scale(self, sample_prompt: str) -> None:
+        assert "1-5" in sample_prompt
+        assert "1 = Very Poor" in sample_prompt
+        assert "5 = Excellent" in sample_prompt
 
-    def test_contains_dimension_descriptions(self) -> None:
-        evaluator = ReportEvaluator()
-        prompt = evaluator._build_evaluation_prompt(_SAMPLE_QUERY, _SAMPLE_REPORT)
-        for desc in _DIMENSION_DESCRIPTIONS.values():
-            assert desc in prompt
+    def test_requests_json_format(self, sample_prompt: str) -> None:
+        assert "JSON" in sample_prompt
+        assert '"dimensions"' in sample_prompt
+        assert '"score"' in sample_prompt
+        assert '"reasoning"' in sample_prompt
+
+    def test_contains_dimension_descriptions(self, sample_prompt: str) -> None:
+        found = set(_DIM_DESCRIPTIONS_PATTERN.findall(sample_prompt))
+        assert found == set(_DIMENSION_DESCRIPTIONS.values())
 
     def test_custom_dimensions_in_prompt(self) -> None:
         custom = [("Speed", 0.60), ("Depth", 0.40)]
@@ -303,15 +340,14 @@ class TestBuildEvaluationPrompt:
 class TestParseEvaluationResponse:
     """_parse_evaluation_response handles valid and malformed JSON."""
 
-    def test_valid_response(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = _make_llm_response()
+    def test_valid_response(self, evaluator: ReportEvaluator) -> None:
+        raw = _DEFAULT_RESPONSE_JSON
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         assert isinstance(result, EvaluationResult)
         assert len(result.dimensions) == 5
         assert result.query == _SAMPLE_QUERY
 
-    def test_scores_preserved(self) -> None:
+    def test_scores_preserved(self, evaluator: ReportEvaluator) -> None:
         scores = {
             "Factual Accuracy": 5.0,
             "Completeness": 4.0,
@@ -319,7 +355,6 @@ class TestParseEvaluationResponse:
             "Coherence": 2.0,
             "Bias": 1.0,
         }
-        evaluator = ReportEvaluator()
         raw = _make_llm_response(scores=scores)
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         score_map = {d.dimension: d.score for d in result.dimensions}
@@ -329,7 +364,7 @@ class TestParseEvaluationResponse:
         assert score_map["Coherence"] == 2.0
         assert score_map["Bias"] == 1.0
 
-    def test_overall_score_computed(self) -> None:
+    def test_overall_score_computed(self, evaluator: ReportEvaluator) -> None:
         scores = {
             "Factual Accuracy": 4.0,
             "Completeness": 4.0,
@@ -337,39 +372,33 @@ class TestParseEvaluationResponse:
             "Coherence": 4.0,
             "Bias": 4.0,
         }
-        evaluator = ReportEvaluator()
         raw = _make_llm_response(scores=scores)
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         # All 4s with weights summing to 1.0 -> overall = 4.0
         assert result.overall_score == pytest.approx(4.0)
 
-    def test_overall_reasoning_captured(self) -> None:
-        evaluator = ReportEvaluator()
+    def test_overall_reasoning_captured(self, evaluator: ReportEvaluator) -> None:
         raw = _make_llm_response(overall="Very thorough analysis.")
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         assert result.overall_reasoning == "Very thorough analysis."
 
-    def test_recommendations_captured(self) -> None:
-        evaluator = ReportEvaluator()
+    def test_recommendations_captured(self, evaluator: ReportEvaluator) -> None:
         raw = _make_llm_response(recommendations=["Add sources.", "Fix formatting."])
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         assert len(result.recommendations) == 2
         assert "Add sources." in result.recommendations
 
-    def test_invalid_json_raises(self) -> None:
-        evaluator = ReportEvaluator()
+    def test_invalid_json_raises(self, evaluator: ReportEvaluator) -> None:
         with pytest.raises(EvaluationParseError, match="not valid JSON"):
             evaluator._parse_evaluation_response("not json at all", _SAMPLE_QUERY)
 
-    def test_missing_dimensions_key_raises(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = json.dumps({"overall_reasoning": "test"})
+    def test_missing_dimensions_key_raises(self, evaluator: ReportEvaluator) -> None:
+        raw = _dumps({"overall_reasoning": "test"})
         with pytest.raises(EvaluationParseError, match="Missing 'dimensions'"):
             evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
 
-    def test_missing_score_raises(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = json.dumps({
+    def test_missing_score_raises(self, evaluator: ReportEvaluator) -> None:
+        raw = _dumps({
             "dimensions": [
                 {"dimension": "Factual Accuracy", "reasoning": "Good."}
             ]
@@ -377,55 +406,30 @@ class TestParseEvaluationResponse:
         with pytest.raises(EvaluationParseError, match="Missing score"):
             evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
 
-    def test_markdown_fences_stripped(self) -> None:
-        evaluator = ReportEvaluator()
-        inner = _make_llm_response()
+    def test_markdown_fences_stripped(self, evaluator: ReportEvaluator) -> None:
+        inner = _DEFAULT_RESPONSE_JSON
         raw = f"```json\n{inner}\n```"
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         assert len(result.dimensions) == 5
 
-    def test_score_clamped_to_max(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = json.dumps({
-            "dimensions": [
-                {"dimension": "Factual Accuracy", "score": 7.0, "reasoning": ""},
-                {"dimension": "Completeness", "score": 3.0, "reasoning": ""},
-                {"dimension": "Coverage", "score": 3.0, "reasoning": ""},
-                {"dimension": "Coherence", "score": 3.0, "reasoning": ""},
-                {"dimension": "Bias", "score": 3.0, "reasoning": ""},
-            ],
-        })
-        result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
-        score_map = {d.dimension: d.score for d in result.dimensions}
-        assert score_map["Factual Accuracy"] == 5.0
-
-    def test_score_clamped_to_min(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = json.dumps({
-            "dimensions": [
-                {"dimension": "Factual Accuracy", "score": -1.0, "reasoning": ""},
-                {"dimension": "Completeness", "score": 3.0, "reasoning": ""},
-                {"dimension": "Coverage", "score": 3.0, "reasoning": ""},
-                {"dimension": "Coherence", "score": 3.0, "reasoning": ""},
-                {"dimension": "Bias", "score": 3.0, "reasoning": ""},
-            ],
-        })
+    @pytest.mark.parametrize(
+        ("raw_score", "expected"),
+        [(7.0, 5.0), (-1.0, 1.0)],
+        ids=["to_max", "to_min"],
+    )
+    def test_score_clamped(
+        self, evaluator: ReportEvaluator, raw_score: float, expected: float
+    ) -> None:
+        overrides = {"Factual Accuracy": {"score": raw_score}}
+        raw = _dumps({"dimensions": _dims_payload(overrides)})
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         score_map = {d.dimension: d.score for d in result.dimensions}
-        assert score_map["Factual Accuracy"] == 1.0
+        assert score_map["Factual Accuracy"] == expected
 
-    def test_missing_dimension_defaults_to_1(self) -> None:
-        evaluator = ReportEvaluator()
+    def test_missing_dimension_defaults_to_1(self, evaluator: ReportEvaluator) -> None:
         # Only provide 4 of 5 dimensions
-        raw = json.dumps({
-            "dimensions": [
-                {"dimension": "Factual Accuracy", "score": 4.0, "reasoning": ""},
-                {"dimension": "Completeness", "score": 4.0, "reasoning": ""},
-                {"dimension": "Coverage", "score": 4.0, "reasoning": ""},
-                {"dimension": "Coherence", "score": 4.0, "reasoning": ""},
-                # Missing: Bias
-            ],
-        })
+        dims = [d for d in _dims_payload() if d["dimension"] != "Bias"]
+        raw = _dumps({"dimensions": dims})
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         score_map = {d.dimension: d.score for d in result.dimensions}
         assert score_map["Bias"] == 1.0
@@ -433,34 +437,17 @@ class TestParseEvaluationResponse:
             d.reasoning for d in result.dimensions if d.dimension == "Bias"
         ).lower()
 
-    def test_unexpected_dimension_ignored(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = json.dumps({
-            "dimensions": [
-                {"dimension": "Factual Accuracy", "score": 4.0, "reasoning": ""},
-                {"dimension": "Completeness", "score": 4.0, "reasoning": ""},
-                {"dimension": "Coverage", "score": 4.0, "reasoning": ""},
-                {"dimension": "Coherence", "score": 4.0, "reasoning": ""},
-                {"dimension": "Bias", "score": 4.0, "reasoning": ""},
-                {"dimension": "Novelty", "score": 5.0, "reasoning": ""},
-            ],
-        })
+    def test_unexpected_dimension_ignored(self, evaluator: ReportEvaluator) -> None:
+        dims = _dims_payload()
+        dims.append({"dimension": "Novelty", "score": 5.0, "reasoning": ""})
+        raw = _dumps({"dimensions": dims})
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         dim_names = {d.dimension for d in result.dimensions}
         assert "Novelty" not in dim_names
         assert len(result.dimensions) == 5
 
-    def test_empty_recommendations_ok(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = json.dumps({
-            "dimensions": [
-                {"dimension": "Factual Accuracy", "score": 4.0, "reasoning": ""},
-                {"dimension": "Completeness", "score": 4.0, "reasoning": ""},
-                {"dimension": "Coverage", "score": 4.0, "reasoning": ""},
-                {"dimension": "Coherence", "score": 4.0, "reasoning": ""},
-                {"dimension": "Bias", "score": 4.0, "reasoning": ""},
-            ],
-        })
+    def test_empty_recommendations_ok(self, evaluator: ReportEvaluator) -> None:
+        raw = _dumps({"dimensions": _dims_payload()})
         result = evaluator._parse_evaluation_response(raw, _SAMPLE_QUERY)
         assert result.recommendations == []
 
@@ -470,6 +457,19 @@ class TestParseEvaluationResponse:
 # ---------------------------------------------------------------------------
 
 
+def _uniform_dims(score: float) -> list[DimensionScore]:
+    """Default dimensions, each scored ``score``."""
+    return [
+        DimensionScore(dimension=name, score=score, weight=weight)
+        for name, weight in EVALUATION_DIMENSIONS
+    ]
+
+
+# compute_overall_score only reads these, so they are built once
+_MAX_DIMS = _uniform_dims(5.0)
+_MIN_DIMS = _uniform_dims(1.0)
+
+
 class TestComputeOverallScore:
     """compute_overall_score produces correct weighted averages."""
 
@@ -478,7 +478,7 @@ class TestComputeOverallScore:
 
     def test_single_dimension(self) -> None:
         dims = [DimensionScore(dimension="A", score=4.0, weight=1.0)]
-        assert ReportEvaluator.compute_overall_score(dims) == pytest.approx(4.0)
+        assert ReportEvaluator.compute_overall_score(dims) == 4.0
 
     def test_weighted_average(self) -> None:
         dims = [
@@ -489,18 +489,10 @@ class TestComputeOverallScore:
         assert ReportEvaluator.compute_overall_score(dims) == pytest.approx(4.2)
 
     def test_all_max_scores(self) -> None:
-        dims = [
-            DimensionScore(dimension=name, score=5.0, weight=weight)
-            for name, weight in EVALUATION_DIMENSIONS
-        ]
-        assert ReportEvaluator.compute_overall_score(dims) == pytest.approx(5.0)
+        assert ReportEvaluator.compute_overall_score(_MAX_DIMS) == pytest.approx(5.0)
 
     def test_all_min_scores(self) -> None:
-        dims = [
-            DimensionScore(dimension=name, score=1.0, weight=weight)
-            for name, weight in EVALUATION_DIMENSIONS
-        ]
-        assert ReportEvaluator.compute_overall_score(dims) == pytest.approx(1.0)
+        assert ReportEvaluator.compute_overall_score(_MIN_DIMS) == pytest.approx(1.0)
 
     def test_mixed_scores(self) -> None:
         dims = [
@@ -520,96 +512,106 @@ class TestComputeOverallScore:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def sample_result() -> EvaluationResult:
+    """Passing five-dimension result shared by the scorecard tests.
+
+    Tests that need a variant take a ``model_copy`` instead of mutating it.
+    """
+    dims = [
+        DimensionScore(dimension=name, score=4.0, weight=weight, reasoning="Good.")
+        for name, weight in EVALUATION_DIMENSIONS
+    ]
+    return EvaluationResult(
+        query=_SAMPLE_QUERY,
+        dimensions=dims,
+        overall_score=4.0,
+        overall_reasoning="Solid report.",
+        recommendations=["Add more sources."],
+    )
+
+
 class TestFormatScorecard:
     """format_scorecard produces valid Markdown."""
 
-    def _make_result(self) -> EvaluationResult:
-        dims = [
-            DimensionScore(
-                dimension=name, score=4.0, weight=weight, reasoning="Good."
-            )
-            for name, weight in EVALUATION_DIMENSIONS
-        ]
-        return EvaluationResult(
-            query=_SAMPLE_QUERY,
-            dimensions=dims,
-            overall_score=4.0,
-            overall_reasoning="Solid report.",
-            recommendations=["Add more sources."],
-        )
-
-    def test_contains_header(self) -> None:
-        evaluator = ReportEvaluator()
-        card = evaluator.format_scorecard(self._make_result())
+    def test_contains_header(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        card = evaluator.format_scorecard(sample_result)
         assert "# Evaluation Scorecard" in card
 
-    def test_contains_query(self) -> None:
-        evaluator = ReportEvaluator()
-        card = evaluator.format_scorecard(self._make_result())
+    def test_contains_query(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        card = evaluator.format_scorecard(sample_result)
         assert _SAMPLE_QUERY in card
 
-    def test_contains_overall_score(self) -> None:
-        evaluator = ReportEvaluator()
-        card = evaluator.format_scorecard(self._make_result())
+    def test_contains_overall_score(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        card = evaluator.format_scorecard(sample_result)
         assert "4.0/5.0" in card
 
-    def test_contains_table_rows(self) -> None:
-        evaluator = ReportEvaluator()
-        card = evaluator.format_scorecard(self._make_result())
+    def test_contains_table_rows(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        card = evaluator.format_scorecard(sample_result)
         for name, _ in EVALUATION_DIMENSIONS:
             assert name in card
 
-    def test_contains_assessment(self) -> None:
-        evaluator = ReportEvaluator()
-        card = evaluator.format_scorecard(self._make_result())
+    def test_contains_assessment(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        card = evaluator.format_scorecard(sample_result)
         assert "Solid report." in card
 
-    def test_contains_recommendations(self) -> None:
-        evaluator = ReportEvaluator()
-        card = evaluator.format_scorecard(self._make_result())
+    def test_contains_recommendations(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        card = evaluator.format_scorecard(sample_result)
         assert "Add more sources." in card
 
-    def test_no_assessment_when_empty(self) -> None:
-        evaluator = ReportEvaluator()
-        result = self._make_result()
-        result.overall_reasoning = ""
+    def test_no_assessment_when_empty(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        result = sample_result.model_copy(update={"overall_reasoning": ""})
         card = evaluator.format_scorecard(result)
         assert "**Assessment:**" not in card
 
-    def test_no_recommendations_when_empty(self) -> None:
-        evaluator = ReportEvaluator()
-        result = self._make_result()
-        result.recommendations = []
+    def test_no_recommendations_when_empty(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        result = sample_result.model_copy(update={"recommendations": []})
         card = evaluator.format_scorecard(result)
         assert "**Recommendations:**" not in card
 
-    def test_pass_indicator(self) -> None:
-        evaluator = ReportEvaluator()
-        result = self._make_result()
-        result.overall_score = 4.0
+    def test_pass_indicator(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        result = sample_result.model_copy(update={"overall_score": 4.0})
         card = evaluator.format_scorecard(result)
         assert "PASS" in card
         assert "3.5" in card  # threshold shown
 
-    def test_fail_indicator(self) -> None:
-        evaluator = ReportEvaluator()
-        result = self._make_result()
-        result.overall_score = 2.0
+    def test_fail_indicator(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        result = sample_result.model_copy(update={"overall_score": 2.0})
         card = evaluator.format_scorecard(result)
         assert "FAIL" in card
 
-    def test_custom_threshold(self) -> None:
-        evaluator = ReportEvaluator()
-        result = self._make_result()
-        result.overall_score = 4.0
+    def test_custom_threshold(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        result = sample_result.model_copy(update={"overall_score": 4.0})
         card = evaluator.format_scorecard(result, threshold=4.5)
         assert "FAIL" in card
         assert "4.5" in card
 
-    def test_at_threshold_passes(self) -> None:
-        evaluator = ReportEvaluator()
-        result = self._make_result()
-        result.overall_score = 3.5
+    def test_at_threshold_passes(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        result = sample_result.model_copy(update={"overall_score": 3.5})
         card = evaluator.format_scorecard(result, threshold=3.5)
         assert "PASS" in card
 
@@ -622,79 +624,73 @@ class TestFormatScorecard:
 class TestFormatScorecardRich:
     """format_scorecard_rich produces terminal-formatted output."""
 
-    def _make_result(self) -> EvaluationResult:
-        dims = [
-            DimensionScore(
-                dimension=name, score=4.0, weight=weight, reasoning="Good."
-            )
-            for name, weight in EVALUATION_DIMENSIONS
-        ]
-        return EvaluationResult(
-            query=_SAMPLE_QUERY,
-            dimensions=dims,
-            overall_score=4.0,
-            overall_reasoning="Solid report.",
-            recommendations=["Add more sources."],
-        )
-
-    def test_contains_header(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result())
+    def test_contains_header(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result)
         assert "EVALUATION SCORECARD" in output
 
-    def test_contains_query(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result())
+    def test_contains_query(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result)
         assert _SAMPLE_QUERY in output
 
-    def test_contains_score(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result())
+    def test_contains_score(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result)
         assert "4.0/5.0" in output
 
-    def test_pass_marker(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result())
+    def test_pass_marker(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result)
         assert "[PASS]" in output
 
-    def test_fail_marker(self) -> None:
-        evaluator = ReportEvaluator()
-        result = self._make_result()
-        result.overall_score = 2.0
+    def test_fail_marker(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        result = sample_result.model_copy(update={"overall_score": 2.0})
         output = evaluator.format_scorecard_rich(result)
         assert "[FAIL]" in output
 
-    def test_contains_all_dimensions(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result())
+    def test_contains_all_dimensions(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result)
         for name, _ in EVALUATION_DIMENSIONS:
             assert name in output
 
-    def test_contains_threshold(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result())
+    def test_contains_threshold(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result)
         assert "3.5/5.0" in output
 
-    def test_contains_assessment(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result())
+    def test_contains_assessment(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result)
         assert "Solid report." in output
 
-    def test_contains_recommendations(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result())
+    def test_contains_recommendations(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result)
         assert "Add more sources." in output
 
-    def test_no_assessment_when_empty(self) -> None:
-        evaluator = ReportEvaluator()
-        result = self._make_result()
-        result.overall_reasoning = ""
+    def test_no_assessment_when_empty(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        result = sample_result.model_copy(update={"overall_reasoning": ""})
         output = evaluator.format_scorecard_rich(result)
         assert "Assessment:" not in output
 
-    def test_custom_threshold(self) -> None:
-        evaluator = ReportEvaluator()
-        output = evaluator.format_scorecard_rich(self._make_result(), threshold=4.5)
+    def test_custom_threshold(
+        self, evaluator: ReportEvaluator, sample_result: EvaluationResult
+    ) -> None:
+        output = evaluator.format_scorecard_rich(sample_result, threshold=4.5)
         assert "4.5/5.0" in output
         assert "[FAIL]" in output
 
@@ -744,73 +740,49 @@ class TestSaveScorecard:
 class TestEvaluateAsync:
     """evaluate() end-to-end with a mock LLM callable."""
 
-    @pytest.mark.asyncio
-    async def test_evaluate_returns_result(self) -> None:
-        evaluator = ReportEvaluator()
-        mock_llm = _make_async_callable(_make_llm_response())
-        result = await evaluator.evaluate(_SAMPLE_QUERY, _SAMPLE_REPORT, mock_llm)
-        assert isinstance(result, EvaluationResult)
-        assert len(result.dimensions) == 5
+    # One loop serves every coroutine test here instead of one loop per test
+    pytestmark = pytest.mark.asyncio(loop_scope="class")
 
-    @pytest.mark.asyncio
-    async def test_evaluate_computes_overall(self) -> None:
-        scores = {
-            "Factual Accuracy": 4.0,
-            "Completeness": 4.0,
-            "Coverage": 4.0,
-            "Coherence": 4.0,
-            "Bias": 4.0,
-        }
-        evaluator = ReportEvaluator()
-        mock_llm = _make_async_callable(_make_llm_response(scores=scores))
-        result = await evaluator.evaluate(_SAMPLE_QUERY, _SAMPLE_REPORT, mock_llm)
-        assert result.overall_score == pytest.approx(4.0)
+    async def test_evaluate_batch(self, evaluator: ReportEvaluator) -> None:
+        names = [name for name, _ in EVALUATION_DIMENSIONS]
+        responses = [
+            _DEFAULT_RESPONSE_JSON,
+            _make_llm_response(scores=dict.fromkeys(names, 4.0)),
+            _make_llm_response(scores=dict.fromkeys(names, 4.5)),
+            _make_llm_response(scores=dict.fromkeys(names, 2.0)),
+            f"```json\n{_DEFAULT_RESPONSE_JSON}\n```",
+        ]
+        # Independent evaluations share one evaluator and run concurrently
+        default, flat, passing, failing, fenced = await asyncio.gather(
+            *(
+                evaluator.evaluate(
+                    _SAMPLE_QUERY, _SAMPLE_REPORT, _make_async_callable(raw)
+                )
+                for raw in responses
+            )
+        )
 
-    @pytest.mark.asyncio
-    async def test_evaluate_without_callable_raises(self) -> None:
-        evaluator = ReportEvaluator()
+        assert isinstance(default, EvaluationResult)
+        assert len(default.dimensions) == 5
+        assert default.query == _SAMPLE_QUERY
+        assert flat.overall_score == pytest.approx(4.0)
+        assert passing.overall_score >= QUALITY_THRESHOLD
+        assert failing.overall_score < QUALITY_THRESHOLD
+        assert len(fenced.dimensions) == 5
+
+    async def test_evaluate_without_callable_raises(
+        self, evaluator: ReportEvaluator
+    ) -> None:
         with pytest.raises(ValueError, match="llm_callable is required"):
             await evaluator.evaluate(_SAMPLE_QUERY, _SAMPLE_REPORT)
 
-    @pytest.mark.asyncio
-    async def test_evaluate_parse_error_propagates(self) -> None:
-        evaluator = ReportEvaluator()
+    async def test_evaluate_parse_error_propagates(
+        self, evaluator: ReportEvaluator
+    ) -> None:
         mock_llm = _make_async_callable("this is not json")
         with pytest.raises(EvaluationParseError):
             await evaluator.evaluate(_SAMPLE_QUERY, _SAMPLE_REPORT, mock_llm)
 
-    @pytest.mark.asyncio
-    async def test_evaluate_above_threshold(self) -> None:
-        scores = {name: 4.5 for name, _ in EVALUATION_DIMENSIONS}
-        evaluator = ReportEvaluator()
-        mock_llm = _make_async_callable(_make_llm_response(scores=scores))
-        result = await evaluator.evaluate(_SAMPLE_QUERY, _SAMPLE_REPORT, mock_llm)
-        assert result.overall_score >= QUALITY_THRESHOLD
-
-    @pytest.mark.asyncio
-    async def test_evaluate_below_threshold(self) -> None:
-        scores = {name: 2.0 for name, _ in EVALUATION_DIMENSIONS}
-        evaluator = ReportEvaluator()
-        mock_llm = _make_async_callable(_make_llm_response(scores=scores))
-        result = await evaluator.evaluate(_SAMPLE_QUERY, _SAMPLE_REPORT, mock_llm)
-        assert result.overall_score < QUALITY_THRESHOLD
-
-    @pytest.mark.asyncio
-    async def test_evaluate_passes_query_through(self) -> None:
-        evaluator = ReportEvaluator()
-        mock_llm = _make_async_callable(_make_llm_response())
-        result = await evaluator.evaluate(_SAMPLE_QUERY, _SAMPLE_REPORT, mock_llm)
-        assert result.query == _SAMPLE_QUERY
-
-    @pytest.mark.asyncio
-    async def test_evaluate_with_markdown_fenced_response(self) -> None:
-        evaluator = ReportEvaluator()
-        inner = _make_llm_response()
-        fenced = f"```json\n{inner}\n```"
-        mock_llm = _make_async_callable(fenced)
-        result = await evaluator.evaluate(_SAMPLE_QUERY, _SAMPLE_REPORT, mock_llm)
-        assert len(result.dimensions) == 5
-
 
 # ---------------------------------------------------------------------------
 # Edge cases
@@ -823,7 +795,7 @@ class TestEvaluationEdgeCases:
     def test_custom_two_dimensions(self) -> None:
         custom = [("Speed", 0.50), ("Quality", 0.50)]
         evaluator = ReportEvaluator(dimensions=custom)
-        raw = json.dumps({
+        raw = _dumps({
             "dimensions": [
                 {"dimension": "Speed", "score": 3.0, "reasoning": "Ok."},
                 {"dimension": "Quality", "score": 5.0, "reasoning": "Great."},
@@ -832,38 +804,31 @@ class TestEvaluationEdgeCases:
         })
         result = evaluator._parse_evaluation_response(raw, "test")
         # 3*0.5 + 5*0.5 = 4.0
-        assert result.overall_score == pytest.approx(4.0)
-
-    def test_integer_scores_accepted(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = json.dumps({
-            "dimensions": [
-                {"dimension": "Factual Accuracy", "score": 4, "reasoning": ""},
-                {"dimension": "Completeness", "score": 3, "reasoning": ""},
-                {"dimension": "Coverage", "score": 5, "reasoning": ""},
-                {"dimension": "Coherence", "score": 2, "reasoning": ""},
-                {"dimension": "Bias", "score": 4, "reasoning": ""},
-            ],
-        })
+        assert result.overall_score == 4.0
+
+    def test_integer_scores_accepted(self, evaluator: ReportEvaluator) -> None:
+        int_scores = {
+            "Factual Accuracy": 4,
+            "Completeness": 3,
+            "Coverage": 5,
+            "Coherence": 2,
+            "Bias": 4,
+        }
+        dims = _dims_payload({k: {"score": v} for k, v in int_scores.items()})
+        raw = _dumps({"dimensions": dims})
         result = evaluator._parse_evaluation_response(raw, "test")
         assert len(result.dimensions) == 5
 
-    def test_reasoning_per_dimension_captured(self) -> None:
-        evaluator = ReportEvaluator()
-        raw = json.dumps({
-            "dimensions": [
-                {"dimension": "Factual Accuracy", "score": 4.0,
-                 "reasoning": "Well-sourced claims."},
-                {"dimension": "Completeness", "score": 3.0,
-                 "reasoning": "Missing some angles."},
-                {"dimension": "Coverage", "score": 4.0,
-                 "reasoning": "Broad source base."},
-                {"dimension": "Coherence", "score": 4.5,
-                 "reasoning": "Clear structure."},
-                {"dimension": "Bias", "score": 3.0,
-                 "reasoning": "Slightly one-sided."},
-            ],
-        })
+    def test_reasoning_per_dimension_captured(self, evaluator: ReportEvaluator) -> None:
+        reasons = {
+            "Factual Accuracy": "Well-sourced claims.",
+            "Completeness": "Missing some angles.",
+            "Coverage": "Broad source base.",
+            "Coherence": "Clear structure.",
+            "Bias": "Slightly one-sided.",
+        }
+        dims = _dims_payload({k: {"reasoning": v} for k, v in reasons.items()})
+        raw = _dumps({"dimensions": dims})
         result = evaluator._parse_evaluation_response(raw, "test")
         reasoning_map = {d.dimension: d.reasoning for d in result.dimensions}
         assert reasoning_map["Factual Accuracy"] == "Well-sourced claims."
@@ -79,6 +79,25 @@ class TestBudgetExhaustedError:
     def test_message(self) -> None:
         err = BudgetExhaustedError("budget exceeded")
         assert str(err) == "budget exceeded"
+        assert err.kind == ""
+
+    def test_structured_cost_message(self) -> None:
+        err = BudgetExhaustedError(kind="cost", spent=2.5, limit=2.0)
+        assert str(err) == "Budget exhausted: $2.5000 >= $2.00"
+        assert err.spent == 2.5
+        assert err.limit == 2.0
+
+    def test_structured_call_limit_message(self) -> None:
+        err = BudgetExhaustedError(kind="calls", spent=50, limit=50)
+        assert str(err) == "LLM call limit reached: 50 >= 50"
+
+    def test_structured_message_in_repr(self) -> None:
+        err = BudgetExhaustedError(kind="cost", spent=2.5, limit=2.0)
+        assert repr(err) == "BudgetExhaustedError('Budget exhausted: $2.5000 >= $2.00')"
+
+    def test_plain_message_repr(self) -> None:
+        err = BudgetExhaustedError("budget exceeded")
+        assert repr(err) == "BudgetExhaustedError('budget exceeded')"
 
 
 class TestModelRoutingError:
@@ -223,6 +223,24 @@ class TestMetricsCollector:
         # But the finished step does not
         assert step.input_tokens == 0
 
+    def test_record_llm_calls_matches_repeated_single_calls(self) -> None:
+        single = MetricsCollector()
+        single.start_step("search")
+        for _ in range(4):
+            single.record_llm_call("m", input_tokens=10, output_tokens=5, cost_usd=0.25)
+        bulk = MetricsCollector()
+        bulk.start_step("search")
+        bulk.record_llm_calls("m", 4, input_tokens=10, output_tokens=5, cost_usd=0.25)
+        assert bulk.metrics == single.metrics
+        assert bulk.steps[0].input_tokens == single.steps[0].input_tokens == 40
+        assert bulk.steps[0].cost_usd == single.steps[0].cost_usd == 1.0
+
+    def test_record_llm_calls_zero_count_is_noop(self) -> None:
+        collector = MetricsCollector()
+        collector.record_llm_calls("m", 0, input_tokens=10)
+        assert collector.metrics.total_input_tokens == 0
+        assert "m" not in collector.metrics.model_usage
+
     def test_record_sources(self) -> None:
         collector = MetricsCollector()
         collector.start_step("search")
@@ -320,3 +338,24 @@ class TestMetricsCollector:
         collector = MetricsCollector()
         collector.record_error()
         assert collector.metrics.total_errors == 1
+
+    def test_reset_clears_metrics_and_steps(self) -> None:
+        collector = MetricsCollector(budget_usd=1.0)
+        collector.start_step("plan")
+        collector.record_llm_call("m", input_tokens=10, cost_usd=0.25)
+        collector.record_error()
+        collector.reset()
+        assert collector.steps == []
+        assert collector.metrics == RunMetrics(budget_usd=1.0)
+
+    def test_reset_restarts_elapsed_clock(self) -> None:
+        collector = MetricsCollector()
+        before = collector.elapsed_seconds
+        time.sleep(0.01)
+        collector.reset()
+        assert collector.elapsed_seconds < before + 0.01
+
+    def test_has_no_instance_dict(self) -> None:
+        collector = MetricsCollector()
+        with pytest.raises(AttributeError):
+            collector.extra = 1  # type: ignore[attr-defined]
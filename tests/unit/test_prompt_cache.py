@@ -6,7 +6,7 @@ import json
 
 from research_agent.prompt_cache import (
     _CACHE_CONTROL_EPHEMERAL,
-    _CACHE_READ_COST_MULTIPLIER,
+    CACHE_READ_COST_MULTIPLIER,
     CacheTracker,
     deterministic_json,
     order_messages_for_cache,
@@ -233,7 +233,7 @@ class TestCacheTrackerEstimatedSavings:
         tracker.record_call(input_tokens=1000, cached_tokens=500)
         # Only 500 tokens cached; savings on those 500
         savings = tracker.estimated_savings(3.0)
-        expected = (500 * 3.0 / 1_000_000) * (1.0 - _CACHE_READ_COST_MULTIPLIER)
+        expected = (500 * 3.0 / 1_000_000) * (1.0 - CACHE_READ_COST_MULTIPLIER)
         assert abs(savings - expected) < 1e-10
 
     def test_zero_calls(self) -> None: